@@ -10,7 +10,14 @@ __version__ = "2.1.0"
 __author__ = "Jéron Crooks"
 __email__ = "your.email@example.com"
 
-# Import main components for easier access
-from .gui.run_gui import run_gui
+# run_gui is exported lazily through the module __getattr__ below
+__all__ = ["run_gui", "__version__"]
 
-__all__ = ["run_gui", "__version__"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the GUI on first use, so importing a submodule doesn't load
+    # tkinter, pandas and the whole processing pipeline
+    if name == "run_gui":
+        from .gui.run_gui import run_gui
+        return run_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,12 +16,11 @@ import pandas as pd
 import numpy as np
 
 from ..utils.logging_config import get_logger
+from ..utils.data_utils import (
+    identify_keyword_columns, fill_other_unique_identifier,
+    build_do_concatenate_vector, check_null_or_blank_all
+)
 # Temporarily comment out missing imports
-# from ..utils.data_utils import (
-#     identify_keyword_columns, fill_other_unique_identifier,
-#     create_current_do_concatenate, check_null_or_blank_columns,
-#     check_keywords, remove_nulls_and_blanks
-# )
 # from ..modules.data_loader import load_comparative_file
 # from ..core.status_validation import (
 #     do_status_1_validation, do_status_2_validation,
@@ -302,9 +301,8 @@ def process_data(df: pd.DataFrame, component: str, cy_fy_qtr: str) -> pd.DataFra
 
         # Create DO Concatenate column if not already present (for current data)
         if 'DO Concatenate' not in df.columns:
-            df['DO Concatenate'] = df.apply(
-                lambda row: create_current_do_concatenate(row, component, keyword_columns), 
-                axis=1
+            df['DO Concatenate'] = build_do_concatenate_vector(
+                df, component, keyword_columns, 'PY Q4 Ending Balance UDO'
             )
         
         # Validate the input data
@@ -448,7 +446,7 @@ def process_data(df: pd.DataFrame, component: str, cy_fy_qtr: str) -> pd.DataFra
         }
 
         # Add "Null or Blank Columns" column
-        df["Null or Blank Columns"] = df.apply(check_null_or_blank_columns, axis=1)
+        df["Null or Blank Columns"] = check_null_or_blank_all(df)
 
         # Add debugging wrapper for Federal Vendor determination
         def safe_check_trading_partner(row):
@@ -6,6 +6,7 @@ a dropdown menu with recently used files.
 """
 import os
 import tkinter as tk
+import time
 from tkinter import ttk, filedialog
 from typing import Optional, Callable, List, Dict
 import logging
@@ -103,8 +104,9 @@ class FileSelectionWidget(ttk.Frame):
         menu = tk.Menu(self, tearoff=0)
         
         # Add recent files
+        now = time.time()
         for file_info in recent_files:
-            display_text = self.recent_files_manager.format_file_display(file_info)
+            display_text = self.recent_files_manager.format_file_display(file_info, now)
             file_path = file_info["path"]
             
             # Add menu item
@@ -141,11 +143,7 @@ class FileSelectionWidget(ttk.Frame):
                 f"The selected file no longer exists:\n{file_path}"
             )
             # Remove from recent files
-            self.recent_files_manager.recent_files[self.file_type] = [
-                f for f in self.recent_files_manager.recent_files[self.file_type]
-                if f.get("path") != file_path
-            ]
-            self.recent_files_manager._save_recent_files()
+            self.recent_files_manager.remove_file(self.file_type, file_path)
     
     def _clear_recent_files(self):
         """Clear recent files for this file type."""
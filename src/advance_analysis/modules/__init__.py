@@ -7,7 +7,7 @@ and file system operations.
 
 from .data_loader import load_excel_file, load_trial_balance
 from .excel_handler import format_excel_file, process_excel_files
-from .file_handler import copy_and_rename_input_file, ensure_file_accessibility
+from .file_handler import copy_and_rename_input_file, copy_session, ensure_file_accessibility
 
 __all__ = [
     "load_excel_file",
@@ -15,5 +15,6 @@ __all__ = [
     "format_excel_file",
     "process_excel_files",
     "copy_and_rename_input_file",
+    "copy_session",
     "ensure_file_accessibility"
 ]
\ No newline at end of file
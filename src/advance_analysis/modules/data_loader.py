@@ -12,10 +12,11 @@ import pandas as pd
 import numpy as np
 import logging
 
+from ..utils.data_utils import parse_dates, build_do_concatenate_vector
+
 # Temporarily commenting out the import until data_utils.py is created
 # from ..utils.data_utils import (
-#     identify_keyword_columns, fill_other_unique_identifier, 
-#     create_comparative_do_concatenate
+#     identify_keyword_columns, fill_other_unique_identifier
 # )
 
 # Temporary implementations of the required functions
@@ -60,36 +61,6 @@ def fill_other_unique_identifier(df: pd.DataFrame, keyword_columns: List[str]) -
     return df
 
 
-def create_comparative_do_concatenate(row: pd.Series, component: str, keyword_columns: List[str]) -> str:
-    """
-    Create DO Concatenate value for comparative data.
-    
-    Args:
-        row: DataFrame row
-        component: Component name
-        keyword_columns: List of keyword columns to include
-        
-    Returns:
-        Concatenated string
-    """
-    parts = []
-    
-    # Add DHS Doc No if present
-    if 'DHS Doc No' in row and pd.notna(row['DHS Doc No']):
-        parts.append(str(row['DHS Doc No']))
-    
-    # Add Other Unique Identifier if present
-    identifier_col = 'Other Unique Identifier if DHS Doc No is not unique1'
-    if identifier_col in row and pd.notna(row[identifier_col]) and str(row[identifier_col]).strip():
-        parts.append(str(row[identifier_col]))
-    
-    # Add keyword column values
-    for col in keyword_columns:
-        if col in row and pd.notna(row[col]) and str(row[col]).strip():
-            parts.append(str(row[col]))
-    
-    return '-'.join(parts) if parts else ''
-
 logger = logging.getLogger(__name__)
 
 
@@ -169,6 +140,27 @@ def parse_date(value: Any) -> pd.Timestamp:
         return pd.NaT
 
 
+def parse_date_column(values: pd.Series, column_name: str) -> pd.Series:
+    """
+    Parses a date column in one pass, logging any values that could not be parsed.
+
+    Args:
+        values (pd.Series): The column to be parsed into dates or datetimes.
+        column_name (str): Name of the column, used in the log message.
+
+    Returns:
+        pd.Series: Parsed timestamps, with pd.NaT for blank or unparseable values.
+    """
+    parsed = parse_dates(values)
+    invalid = parsed.isna() & values.notna()
+    if invalid.any():
+        logger.warning(
+            f"Invalid date encountered in '{column_name}': {int(invalid.sum())} value(s), "
+            f"first: {values[invalid].iloc[0]}"
+        )
+    return parsed
+
+
 def load_excel_file(file_path: str, sheet_name: str, use_intelligent_header_detection: bool = True) -> pd.DataFrame:
     """
     Loads data from an Excel file and processes date columns to ensure consistent date handling.
@@ -230,10 +222,10 @@ def load_excel_file(file_path: str, sheet_name: str, use_intelligent_header_dete
             'Date of the Last Invoice Received'
         ]
 
-        # Apply the parse_date function to each date column
+        # Parse each date column in one pass
         for col in date_columns:
             if col in df.columns:
-                df[col] = df[col].apply(lambda x: parse_date(x) if pd.notna(x) else pd.NaT)
+                df[col] = parse_date_column(df[col], col)
                 logger.debug(f"Processed date column '{col}' with timestamps retained")
 
         return df
@@ -294,25 +286,28 @@ def load_comparative_file(base_path: str, component: str, comparative_reporting_
             'Date of Obligation'
         ]
 
-        # Apply parse_date to each date column, retaining timestamps if present
+        # Parse each date column in one pass, retaining timestamps if present
         for col in date_columns:
             if col in df.columns:
-                df[col] = df[col].apply(lambda x: parse_date(x) if pd.notna(x) else pd.NaT)
+                df[col] = parse_date_column(df[col], col)
                 logger.debug(f"Processed date column '{col}' with timestamps retained")
 
         # Identify keyword columns and process DO Concatenate
         keyword_terms = ["pono", "item", "line"]
         keyword_columns = identify_keyword_columns(df, keyword_terms)
         logger.info(f"Comparative keyword columns for {component}: {keyword_columns}")
-        logger.debug(f"Total columns in comparative dataframe: {len(df.columns)}")
-        logger.debug(f"Columns in comparative dataframe: {df.columns.tolist()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Total columns in comparative dataframe: {len(df.columns)}")
+            logger.debug(f"Columns in comparative dataframe: {df.columns.tolist()}")
 
         df = fill_other_unique_identifier(df, keyword_columns)
 
-        df['DO Concatenate'] = df.apply(lambda row: create_comparative_do_concatenate(row, component, keyword_columns), axis=1)
+        df['DO Concatenate'] = build_do_concatenate_vector(df, component, keyword_columns, 'Current FY Quarter-End  balance UDO')
         
-        logger.debug(f"Sample of DO Concatenate values: {df['DO Concatenate'].head().tolist()}")
-        logger.debug(f"Number of NaN values in DO Concatenate: {df['DO Concatenate'].isna().sum()}")
+        # Sampling and counting cost a pass over the column, so skip them unless logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sample of DO Concatenate values: {df['DO Concatenate'].head().tolist()}")
+            logger.debug(f"Number of NaN values in DO Concatenate: {df['DO Concatenate'].isna().sum()}")
 
         # Define required columns and return them
         required_columns = [
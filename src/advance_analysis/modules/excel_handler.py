@@ -81,7 +81,12 @@ def get_excel_constant(constant_name: str, default_value: int) -> int:
 
 # Import the new Excel processor if available
 try:
-    from .excel_processor import ExcelProcessor, safe_excel_operation as safe_excel_op
+    from .excel_processor import (
+        ExcelProcessor,
+        get_used_range_values,
+        write_range_bulk,
+        safe_excel_operation as safe_excel_op
+    )
     EXCEL_PROCESSOR_AVAILABLE = True
 except ImportError:
     EXCEL_PROCESSOR_AVAILABLE = False
@@ -1616,10 +1621,8 @@ def populate_do_tab_4_review_sheet_v2(processor: 'ExcelProcessor', input_wb: Any
                 rows = len(source_values)
                 cols = len(source_values[0]) if source_values else 0
                 
-                # Write data in chunks for better performance
-                for row_idx, row_data in enumerate(source_values, 1):
-                    for col_idx, value in enumerate(row_data, 1):
-                        target_sheet.Cells(row_idx, col_idx).Value = value
+                # Write all values in a single range assignment
+                write_range_bulk(target_sheet, 1, 1, source_values)
                 
                 # Apply date formatting
                 apply_date_formatting(target_sheet)
@@ -1862,6 +1865,10 @@ def process_excel_files_v2(output_path: str, input_path: str, current_dhstier_pa
             except Exception as e:
                 logger.error(f"Error copying prior year DHSTIER sheet: {str(e)}")
             
+            # The processor keeps calculation manual, so bring formulas that depend
+            # on the copied sheets up to date before they are read
+            processor.calculate_workbook(input_wb)
+            
             # Create pivot table
             logger.info("Step 4: Creating pivot table in PY Q4 Ending Balance sheet...")
             try:
@@ -6,6 +6,7 @@ including copying sheets with formatting and formulas preserved.
 """
 import os
 import logging
+from copy import copy
 from typing import Optional, List, Tuple
 import shutil
 import re
@@ -86,10 +87,15 @@ def copy_sheet_to_workbook(
         
         source_sheet = source_wb[source_sheet_name]
         
+        # sheetnames builds a new list on every access, so take it once and only
+        # rebuild it after the sheet list is mutated
+        dest_sheet_names = dest_wb.sheetnames
+        
         # Create new sheet in destination workbook
-        if new_sheet_name in dest_wb.sheetnames:
+        if new_sheet_name in dest_sheet_names:
             logger.warning(f"Sheet '{new_sheet_name}' already exists, it will be replaced")
             del dest_wb[new_sheet_name]
+            dest_sheet_names = dest_wb.sheetnames
         
         # Create the new sheet
         dest_sheet = dest_wb.create_sheet(title=new_sheet_name)
@@ -97,11 +103,12 @@ def copy_sheet_to_workbook(
         # Copy all cell data, formatting, and formulas
         copy_sheet_data(source_sheet, dest_sheet)
         
-        # Move sheet to the correct position if needed
-        if insert_after and insert_after in dest_wb.sheetnames:
-            sheets = dest_wb.sheetnames
-            insert_index = sheets.index(insert_after) + 1
-            dest_wb.move_sheet(new_sheet_name, offset=insert_index - sheets.index(new_sheet_name))
+        # Move sheet to the correct position if needed. The new sheet was appended
+        # last, so splice it straight into the workbook's sheet list.
+        if insert_after and insert_after in dest_sheet_names:
+            insert_index = dest_sheet_names.index(insert_after) + 1
+            dest_wb._sheets.remove(dest_sheet)
+            dest_wb._sheets.insert(insert_index, dest_sheet)
         
         logger.info(f"Sheet '{source_sheet_name}' copied to '{new_sheet_name}' successfully")
         
@@ -128,6 +135,12 @@ def copy_sheet_data(source_sheet: Worksheet, dest_sheet: Worksheet) -> None:
             dest_sheet.column_dimensions[col_letter].width = col_dim.width
             dest_sheet.column_dimensions[col_letter].hidden = col_dim.hidden
         
+        # Destination style arrays keyed by source style array. Style ids are
+        # workbook-local, so each distinct source style is rebuilt in the
+        # destination once and its resulting ids are reused for every other
+        # cell that shares it.
+        style_cache = {}
+        
         # Copy all cells with data, formulas, and formatting
         for row in source_sheet.iter_rows():
             for cell in row:
@@ -142,6 +155,12 @@ def copy_sheet_data(source_sheet: Worksheet, dest_sheet: Worksheet) -> None:
                 
                 # Copy formatting
                 if cell.has_style:
+                    style_key = tuple(cell._style)
+                    cached_style = style_cache.get(style_key)
+                    if cached_style is not None:
+                        dest_cell._style = copy(cached_style)
+                        continue
+                    
                     dest_cell.font = Font(
                         name=cell.font.name,
                         size=cell.font.size,
@@ -174,21 +193,19 @@ def copy_sheet_data(source_sheet: Worksheet, dest_sheet: Worksheet) -> None:
                         locked=cell.protection.locked,
                         hidden=cell.protection.hidden
                     )
+                    style_cache[style_key] = copy(dest_cell._style)
         
         # Copy merged cells
         for merged_range in source_sheet.merged_cells.ranges:
             dest_sheet.merge_cells(str(merged_range))
         
-        # Copy page setup
-        dest_sheet.page_setup.orientation = source_sheet.page_setup.orientation
-        dest_sheet.page_setup.paperSize = source_sheet.page_setup.paperSize
-        dest_sheet.page_setup.fitToPage = source_sheet.page_setup.fitToPage
-        dest_sheet.page_setup.fitToHeight = source_sheet.page_setup.fitToHeight
-        dest_sheet.page_setup.fitToWidth = source_sheet.page_setup.fitToWidth
-        
-        # Copy print options
-        dest_sheet.print_options.horizontalCentered = source_sheet.print_options.horizontalCentered
-        dest_sheet.print_options.verticalCentered = source_sheet.print_options.verticalCentered
+        # Copy sheet properties, page setup and print options wholesale. fitToPage
+        # lives on sheet_properties, so it travels with that copy; the copied page
+        # setup must be re-pointed at the destination sheet it now belongs to.
+        dest_sheet.sheet_properties = copy(source_sheet.sheet_properties)
+        dest_sheet.page_setup = copy(source_sheet.page_setup)
+        dest_sheet.page_setup._parent = dest_sheet
+        dest_sheet.print_options = copy(source_sheet.print_options)
         
         # Copy freeze panes
         dest_sheet.freeze_panes = source_sheet.freeze_panes
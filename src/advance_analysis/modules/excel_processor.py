@@ -4,13 +4,20 @@ Excel processor with comprehensive COM best practices implementation.
 This module provides a robust Excel processing class that follows industry
 best practices for COM interface management, error handling, and resource cleanup.
 """
+import gc
 import os
 import time
+import threading
+from datetime import datetime
+from decimal import Decimal
 import pythoncom
+import pywintypes
+import win32file
+import win32com
 import win32com.client
 from win32com.client import constants
 import traceback
-from typing import Optional, Any, List, Dict, Callable
+from typing import Optional, Any, List, Dict, Callable, Sequence
 from contextlib import contextmanager
 import logging
 
@@ -27,6 +34,72 @@ COM_ERROR_CODES = {
     -2147467259: "Unspecified error"
 }
 
+# Sheet.Protection permissions preserved across unprotect/re-protect
+PROTECTION_PERMISSIONS = (
+    'AllowFormattingCells',
+    'AllowFormattingColumns',
+    'AllowFormattingRows',
+    'AllowInsertingColumns',
+    'AllowInsertingRows',
+    'AllowInsertingHyperlinks',
+    'AllowDeletingColumns',
+    'AllowDeletingRows',
+    'AllowSorting',
+    'AllowFiltering',
+    'AllowUsingPivotTables'
+)
+
+# Translation tables for clean_numeric_value: drop currency symbols and
+# thousands separators, and turn accounting parentheses into a minus sign
+_CURRENCY_CHARS_TABLE = str.maketrans('', '', '$,')
+_NEGATIVE_PARENS_TABLE = str.maketrans({'(': '-', ')': None})
+
+# Type library of the Excel object model, generated into gen_py by makepy
+EXCEL_TYPELIB_CLSID = '{00020813-0000-0000-C000-000000000046}'
+
+# Where gen_py is redirected when the default location is read-only, so the
+# generated wrappers persist across runs instead of being rebuilt each time
+GEN_PY_FALLBACK_DIR = os.path.join(os.path.expanduser("~"), ".advance_analysis", "gen_py")
+
+# Whether the Excel type library wrappers have been loaded in this process
+_excel_typelib_ready = False
+
+# RPC_E_CHANGED_MODE - COM is already initialized on this thread with another model
+RPC_E_CHANGED_MODE = -2147417850
+
+# Per-thread count of ExcelProcessor instances holding COM initialized, so that
+# nested processors on one thread initialize and uninitialize COM only once
+_com_thread_state = threading.local()
+
+# Excel calculation modes (XlCalculation), used when the makepy constants
+# are not available because Excel was started with late binding
+XL_CALCULATION_MANUAL = -4135
+XL_CALCULATION_AUTOMATIC = -4105
+
+# Application.CalculationInterruptKey value that lets no key interrupt calculation
+XL_NO_KEY = 0
+
+# Range.Find arguments (XlFindLookIn, XlLookAt, XlSearchOrder, XlSearchDirection)
+XL_FORMULAS = -4123
+XL_PART = 2
+XL_BY_ROWS = 1
+XL_BY_COLUMNS = 2
+XL_PREVIOUS = 2
+
+
+def _xl_constant(name: str, default: int) -> int:
+    """
+    Look up an Excel constant generated by makepy, with a fallback value.
+    
+    Args:
+        name: Constant name (e.g., 'xlCalculationManual')
+        default: Value to use when early-bound constants are not loaded
+        
+    Returns:
+        The constant value
+    """
+    return getattr(constants, name, default)
+
 
 class ExcelProcessor:
     """
@@ -53,21 +126,24 @@ class ExcelProcessor:
         self.display_alerts = display_alerts
         self._com_initialized = False
         self._workbooks = []  # Track open workbooks for cleanup
+        self._previous_calculation = None  # Calculation mode to restore, once suspended
+        self._previous_print_communication = None
+        self._previous_interrupt_key = None
         
     def __enter__(self):
         """Context manager entry - initialize COM and Excel."""
         try:
             # Initialize COM in this thread
-            pythoncom.CoInitialize()
-            self._com_initialized = True
-            logger.debug("COM initialized successfully")
+            self._com_initialized = self._initialize_com()
             
             # Try early binding first for better performance
             try:
-                self.excel = win32com.client.gencache.EnsureDispatch("Excel.Application")
+                self.excel = self._dispatch_early_bound()
                 logger.debug("Excel started with early binding")
-            except:
-                # Fall back to late binding
+            except Exception as e:
+                # Fall back to late binding whenever makepy cannot serve Excel,
+                # including an unwritable or locked gen_py cache
+                logger.warning(f"Early binding failed, falling back to late binding: {e}")
                 self.excel = win32com.client.Dispatch("Excel.Application")
                 logger.debug("Excel started with late binding")
             
@@ -77,6 +153,21 @@ class ExcelProcessor:
             self.excel.ScreenUpdating = False  # Improve performance
             self.excel.EnableEvents = False    # Prevent event handlers
             
+            # Skip printer driver round-trips, and keep keystrokes from
+            # interrupting calculation while values are being read
+            try:
+                self._previous_print_communication = self.excel.PrintCommunication
+                self.excel.PrintCommunication = False
+            except Exception as e:
+                self._previous_print_communication = None
+                logger.debug(f"Could not turn off PrintCommunication: {e}")
+            try:
+                self._previous_interrupt_key = self.excel.CalculationInterruptKey
+                self.excel.CalculationInterruptKey = _xl_constant('xlNoKey', XL_NO_KEY)
+            except Exception as e:
+                self._previous_interrupt_key = None
+                logger.debug(f"Could not set CalculationInterruptKey: {e}")
+            
             logger.info(f"Excel processor initialized (Version: {self.excel.Version})")
             return self
             
@@ -85,26 +176,167 @@ class ExcelProcessor:
             self._cleanup()
             raise
             
+    @staticmethod
+    def _initialize_com() -> bool:
+        """
+        Initialize COM for this thread as a single-threaded apartment.
+        
+        Excel's application object is apartment-threaded, so each thread that
+        drives its own ExcelProcessor gets its own STA. Only the outermost
+        processor on a thread initializes COM.
+        
+        Returns:
+            True if this call initialized COM and must uninitialize it
+        """
+        depth = getattr(_com_thread_state, 'depth', 0)
+        if depth:
+            _com_thread_state.depth = depth + 1
+            logger.debug("COM already initialized by this thread")
+            return True
+        
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        except pythoncom.com_error as e:
+            if e.hresult != RPC_E_CHANGED_MODE:
+                raise
+            # The thread already runs another apartment model, owned by someone else
+            logger.debug("COM already initialized on this thread with a different model")
+            return False
+        
+        _com_thread_state.depth = 1
+        logger.debug("COM initialized successfully")
+        return True
+    
+    @staticmethod
+    def _uninitialize_com() -> None:
+        """Release this processor's hold on COM, uninitializing with the outermost one."""
+        depth = getattr(_com_thread_state, 'depth', 0) - 1
+        _com_thread_state.depth = max(depth, 0)
+        if depth <= 0:
+            pythoncom.CoUninitialize()
+            logger.debug("COM uninitialized")
+    
+    @staticmethod
+    def _ensure_excel_typelib() -> None:
+        """
+        Generate or load the makepy wrappers for Excel once per process.
+        
+        EnsureModule only parses the type library when gen_py holds no wrappers
+        for it yet. If the default gen_py location cannot be written (e.g. in a
+        frozen build) it is redirected to a per-user directory so the wrappers
+        are kept for later runs.
+        """
+        global _excel_typelib_ready
+        if _excel_typelib_ready:
+            return
+        
+        gencache = win32com.client.gencache
+        if gencache.is_readonly:
+            os.makedirs(GEN_PY_FALLBACK_DIR, exist_ok=True)
+            win32com.__gen_path__ = GEN_PY_FALLBACK_DIR
+            win32com.gen_py.__path__ = [GEN_PY_FALLBACK_DIR]
+            gencache.is_readonly = False
+            logger.debug(f"gen_py cache redirected to {GEN_PY_FALLBACK_DIR}")
+        
+        gencache.EnsureModule(EXCEL_TYPELIB_CLSID, 0, 1, 9)
+        _excel_typelib_ready = True
+        logger.debug("Excel type library wrappers loaded")
+    
+    @staticmethod
+    def _dispatch_early_bound() -> Any:
+        """
+        Start Excel through the makepy cache so calls use the typed interface.
+        
+        A stale gen_py cache surfaces as an AttributeError; it is rebuilt once
+        before giving up on early binding.
+        
+        Returns:
+            Early-bound Excel application COM object
+        """
+        try:
+            ExcelProcessor._ensure_excel_typelib()
+            return win32com.client.gencache.EnsureDispatch("Excel.Application")
+        except AttributeError:
+            logger.debug("gen_py cache is stale, rebuilding it")
+            win32com.client.gencache.Rebuild()
+            return win32com.client.gencache.EnsureDispatch("Excel.Application")
+            
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup resources."""
         self._cleanup()
         
-    def _cleanup(self):
-        """Comprehensive cleanup of Excel resources."""
-        logger.debug("Starting Excel processor cleanup")
+    def _suspend_calculation(self):
+        """
+        Switch Excel to manual calculation for the bulk operations that follow.
+        
+        Excel only accepts a new calculation mode while a workbook is open, so
+        this is called once the first workbook has been opened. Recalculation
+        is then driven explicitly through calculate_workbook.
+        """
+        if self._previous_calculation is not None:
+            return
+        try:
+            self._previous_calculation = self.excel.Calculation
+            self.excel.Calculation = _xl_constant('xlCalculationManual', XL_CALCULATION_MANUAL)
+            logger.debug("Excel calculation set to manual")
+        except Exception as e:
+            self._previous_calculation = None
+            logger.debug(f"Could not set manual calculation: {e}")
+    
+    def _restore_calculation(self):
+        """Restore the calculation mode that was active before it was suspended."""
+        if self._previous_calculation is None:
+            return
+        try:
+            self.excel.Calculation = self._previous_calculation
+            logger.debug("Excel calculation mode restored")
+        except Exception as e:
+            logger.debug(f"Could not restore calculation mode: {e}")
+        finally:
+            self._previous_calculation = None
+    
+    def close_workbooks(self):
+        """Close all workbooks opened by this processor without saving, keeping Excel running."""
+        # Restore calculation while workbooks are still open to accept it
+        if self.excel:
+            self._restore_calculation()
         
-        # Close all tracked workbooks
         for wb in self._workbooks:
             try:
+                wb_name = wb.Name
                 wb.Close(SaveChanges=False)
-                logger.debug(f"Closed workbook: {wb.Name}")
+                logger.debug(f"Closed workbook: {wb_name}")
             except:
                 pass
                 
         self._workbooks.clear()
+    
+    def _cleanup(self):
+        """Comprehensive cleanup of Excel resources."""
+        logger.debug("Starting Excel processor cleanup")
+        
+        # Close all tracked workbooks, then collect so their proxies are released
+        # now rather than whenever the garbage collector next runs
+        self.close_workbooks()
+        gc.collect()
         
         # Quit Excel
         if self.excel:
+            # Restore these on their own, so a busy or disconnected instance
+            # that rejects them still reaches Quit below
+            if self._previous_print_communication is not None:
+                try:
+                    self.excel.PrintCommunication = self._previous_print_communication
+                except Exception as e:
+                    logger.debug(f"Could not restore PrintCommunication: {e}")
+                self._previous_print_communication = None
+            if self._previous_interrupt_key is not None:
+                try:
+                    self.excel.CalculationInterruptKey = self._previous_interrupt_key
+                except Exception as e:
+                    logger.debug(f"Could not restore CalculationInterruptKey: {e}")
+                self._previous_interrupt_key = None
+            
             try:
                 # Reset Excel settings
                 self.excel.ScreenUpdating = True
@@ -121,12 +353,14 @@ class ExcelProcessor:
                 logger.warning(f"Error quitting Excel: {e}")
             finally:
                 self.excel = None
+                # Release the last application reference before COM is
+                # uninitialized, so no orphaned EXCEL.EXE is left behind
+                gc.collect()
         
         # Uninitialize COM
         if self._com_initialized:
             try:
-                pythoncom.CoUninitialize()
-                logger.debug("COM uninitialized")
+                self._uninitialize_com()
             except:
                 pass
             self._com_initialized = False
@@ -183,6 +417,14 @@ class ExcelProcessor:
             # Validate workbook
             if wb and hasattr(wb, 'Sheets') and wb.Sheets.Count > 0:
                 self._workbooks.append(wb)
+                self._suspend_calculation()
+                
+                # Like manual calculation, stop AutoRecover from writing shadow
+                # copies in the background while the workbook is processed
+                try:
+                    wb.EnableAutoRecover = False
+                except Exception as e:
+                    logger.debug(f"Could not disable AutoRecover for {wb.Name}: {e}")
                 logger.info(f"Workbook opened successfully: {wb.Name} ({wb.Sheets.Count} sheets)")
                 return wb
             else:
@@ -212,13 +454,14 @@ class ExcelProcessor:
         try:
             cell = sheet.Cells(row, column)
             
-            # Strategy 1: Direct Value property
+            # Strategy 1: Value2 property, which skips the Date/Currency
+            # variant conversion that Value performs
             try:
-                value = cell.Value
+                value = cell.Value2
                 if value is not None:
                     return value
             except:
-                logger.debug(f"Direct value access failed for cell ({row}, {column})")
+                logger.debug(f"Value2 access failed for cell ({row}, {column})")
             
             # Strategy 2: Text property
             try:
@@ -236,21 +479,8 @@ class ExcelProcessor:
             except:
                 logger.debug(f"Text property access failed for cell ({row}, {column})")
             
-            # Strategy 3: Formula calculation
-            try:
-                if cell.HasFormula:
-                    cell.Calculate()
-                    return cell.Value
-            except:
-                logger.debug(f"Formula calculation failed for cell ({row}, {column})")
-            
-            # Strategy 4: Value2 property
-            try:
-                value2 = cell.Value2
-                if value2 is not None:
-                    return value2
-            except:
-                logger.debug(f"Value2 access failed for cell ({row}, {column})")
+            # Formulas are not recalculated per cell here: the processor runs
+            # with manual calculation and recalculates through calculate_workbook
             
             logger.warning(f"All strategies failed for cell ({row}, {column})")
             return None
@@ -275,13 +505,22 @@ class ExcelProcessor:
         if isinstance(value, (int, float)):
             return float(value)
         
+        # Currency cells read through Value arrive as Decimal
+        if isinstance(value, Decimal):
+            return float(value)
+        
+        # Date cells read through Value arrive as pywintypes datetimes, which
+        # have never been treated as amounts
+        if isinstance(value, datetime):
+            return 0.0
+        
         try:
             # Handle string representations
-            cleaned_str = str(value).replace("$", "").replace(",", "").strip()
+            cleaned_str = str(value).translate(_CURRENCY_CHARS_TABLE).strip()
             
             # Handle parentheses for negative values
             if "(" in cleaned_str and ")" in cleaned_str:
-                cleaned_str = cleaned_str.replace("(", "-").replace(")", "")
+                cleaned_str = cleaned_str.translate(_NEGATIVE_PARENS_TABLE)
                 
             # Handle percentage
             if cleaned_str.endswith("%"):
@@ -309,27 +548,27 @@ class ExcelProcessor:
         
         try:
             # Check if sheet is protected
-            if sheet.ProtectContents or sheet.ProtectDrawingObjects or sheet.ProtectScenarios:
+            protect_contents = sheet.ProtectContents
+            protect_drawing_objects = sheet.ProtectDrawingObjects
+            protect_scenarios = sheet.ProtectScenarios
+            if protect_contents or protect_drawing_objects or protect_scenarios:
                 was_protected = True
                 
-                # Store protection settings
+                # Store protection settings. The Allow* permissions only apply to
+                # protected contents, so they are read (from a single Protection
+                # object) only in that case; otherwise Protect's defaults apply.
                 try:
                     protection_settings = {
-                        'DrawingObjects': sheet.ProtectDrawingObjects,
-                        'Contents': sheet.ProtectContents,
-                        'Scenarios': sheet.ProtectScenarios,
-                        'AllowFormattingCells': sheet.Protection.AllowFormattingCells,
-                        'AllowFormattingColumns': sheet.Protection.AllowFormattingColumns,
-                        'AllowFormattingRows': sheet.Protection.AllowFormattingRows,
-                        'AllowInsertingColumns': sheet.Protection.AllowInsertingColumns,
-                        'AllowInsertingRows': sheet.Protection.AllowInsertingRows,
-                        'AllowInsertingHyperlinks': sheet.Protection.AllowInsertingHyperlinks,
-                        'AllowDeletingColumns': sheet.Protection.AllowDeletingColumns,
-                        'AllowDeletingRows': sheet.Protection.AllowDeletingRows,
-                        'AllowSorting': sheet.Protection.AllowSorting,
-                        'AllowFiltering': sheet.Protection.AllowFiltering,
-                        'AllowUsingPivotTables': sheet.Protection.AllowUsingPivotTables
+                        'DrawingObjects': protect_drawing_objects,
+                        'Contents': protect_contents,
+                        'Scenarios': protect_scenarios
                     }
+                    if protect_contents:
+                        protection = sheet.Protection
+                        protection_settings.update(
+                            (permission, getattr(protection, permission))
+                            for permission in PROTECTION_PERMISSIONS
+                        )
                 except:
                     protection_settings = {}
                 
@@ -385,21 +624,27 @@ class ExcelProcessor:
             Sheet COM object or None
         """
         try:
+            # Read every sheet name once; the three match passes then run in
+            # Python and only the winning sheet is fetched back through COM
+            sheets = workbook.Sheets
+            sheet_names = [sheets.Item(index).Name for index in range(1, sheets.Count + 1)]
+            
             # First try exact match
-            for sheet in workbook.Sheets:
-                if sheet.Name == pattern:
-                    return sheet
+            for index, name in enumerate(sheet_names, 1):
+                if name == pattern:
+                    return sheets.Item(index)
             
             # Then try case-insensitive match
             pattern_lower = pattern.lower()
-            for sheet in workbook.Sheets:
-                if sheet.Name.lower() == pattern_lower:
-                    return sheet
+            lower_names = [name.lower() for name in sheet_names]
+            for index, name in enumerate(lower_names, 1):
+                if name == pattern_lower:
+                    return sheets.Item(index)
             
             # Finally try partial match
-            for sheet in workbook.Sheets:
-                if pattern_lower in sheet.Name.lower():
-                    return sheet
+            for index, name in enumerate(lower_names, 1):
+                if pattern_lower in name:
+                    return sheets.Item(index)
                     
             return None
             
@@ -429,15 +674,22 @@ class ExcelProcessor:
             logger.debug(f"  New name: {new_name if new_name else 'Keep original'}")
             logger.debug(f"  Insert after: {after_sheet.Name if after_sheet else 'End of workbook'}")
             
-            # Copy the sheet
+            # The Sheets collection is live, so one reference serves before and
+            # after the copy
+            target_sheets = target_workbook.Sheets
+            
+            # Copy the sheet and locate the copy by position rather than through
+            # ActiveSheet, which costs another call and is ambiguous while
+            # ScreenUpdating is off
             if after_sheet:
+                copied_index = after_sheet.Index + 1
                 source_sheet.Copy(After=after_sheet)
             else:
                 # Copy to the end
-                source_sheet.Copy(After=target_workbook.Sheets(target_workbook.Sheets.Count))
+                copied_index = target_sheets.Count + 1
+                source_sheet.Copy(After=target_sheets(copied_index - 1))
             
-            # Get the copied sheet (it's the active one after copy)
-            copied_sheet = target_workbook.ActiveSheet
+            copied_sheet = target_sheets(copied_index)
             logger.debug(f"Sheet copied. Current name: {copied_sheet.Name}")
             
             # Rename if needed
@@ -471,7 +723,10 @@ class ExcelProcessor:
             if force_full:
                 self.excel.CalculateFull()
             else:
-                workbook.Calculate()
+                # The Workbook object has no Calculate method, and calculating
+                # sheet by sheet can leave cross-sheet formulas stale, so let
+                # Excel recalculate everything that is dirty in one pass
+                self.excel.Calculate()
             logger.debug("Workbook calculation completed")
         except Exception as e:
             logger.error(f"Error calculating workbook: {e}")
@@ -484,6 +739,11 @@ class ExcelProcessor:
             workbook: Workbook COM object
             save_as_path: Path to save as (optional)
         """
+        # Workbooks store the calculation mode they are saved with, so save
+        # under the user's mode rather than the manual mode used for processing
+        calculation_suspended = self._previous_calculation is not None
+        self._restore_calculation()
+        
         try:
             if save_as_path:
                 workbook.SaveAs(save_as_path)
@@ -494,6 +754,9 @@ class ExcelProcessor:
         except Exception as e:
             logger.error(f"Error saving workbook: {e}")
             raise
+        finally:
+            if calculation_suspended:
+                self._suspend_calculation()
 
 
 def safe_excel_operation(func):
@@ -552,21 +815,24 @@ def wait_for_file_excel_ready(file_path: str, timeout: int = 60, check_interval:
     start_time = time.time()
     logger.info(f"Waiting for Excel file to be ready: {file_path}")
     
+    previous_size = None
     while time.time() - start_time < timeout:
         try:
-            # Try to open exclusively
-            with open(file_path, 'r+b') as f:
-                # Try to read and seek to ensure full access
-                f.read(1)
-                f.seek(0)
-                
-            # Additional check - try to get file size
-            size = os.path.getsize(file_path)
-            if size > 0:
+            # Wait for the size to settle across two polls before probing the file
+            size = os.stat(file_path).st_size
+            if size > 0 and size == previous_size:
+                # Open with no sharing and close straight away: this fails while
+                # any other process still holds the file, without writing to it
+                handle = win32file.CreateFile(
+                    file_path, win32file.GENERIC_READ, 0, None,
+                    win32file.OPEN_EXISTING, 0, None
+                )
+                handle.Close()
                 logger.info(f"File is ready: {file_path} ({size} bytes)")
                 return True
+            previous_size = size
                 
-        except IOError as e:
+        except (OSError, pywintypes.error) as e:
             logger.debug(f"File not ready: {e}")
         except Exception as e:
             logger.warning(f"Unexpected error checking file: {e}")
@@ -592,20 +858,93 @@ def get_used_range_values(sheet: Any) -> List[List[Any]]:
         used_range = sheet.UsedRange
         if not used_range:
             return []
-            
-        # Get values as 2D array
-        values = used_range.Value
         
-        # Convert to list of lists
-        if values is None:
+        # UsedRange can reach far past the data after earlier edits, so trim it
+        # to the last row and column holding a value or formula before reading
+        last_row_cell = _find_last_populated_cell(used_range, XL_BY_ROWS)
+        if last_row_cell is None:
             return []
-        elif isinstance(values, (list, tuple)):
-            # Already a 2D structure
-            return [list(row) if isinstance(row, (list, tuple)) else [row] for row in values]
-        else:
-            # Single value
-            return [[values]]
+        last_column_cell = _find_last_populated_cell(used_range, XL_BY_COLUMNS)
+        populated_range = sheet.Range(
+            sheet.Cells(used_range.Row, used_range.Column),
+            sheet.Cells(last_row_cell.Row, last_column_cell.Column)
+        )
+            
+        # Get values as 2D array
+        return _range_values_to_list(populated_range.Value)
             
     except Exception as e:
         logger.error(f"Error getting used range values: {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+def _find_last_populated_cell(search_range: Any, search_order: int) -> Any:
+    """
+    Find the last cell holding a value or formula, searching backwards.
+    
+    Args:
+        search_range: Range COM object to search
+        search_order: XL_BY_ROWS for the last row, XL_BY_COLUMNS for the last column
+        
+    Returns:
+        Cell COM object, or None if the range is empty
+    """
+    return search_range.Find(
+        What="*",
+        After=search_range.Cells(1, 1),
+        LookIn=_xl_constant('xlFormulas', XL_FORMULAS),
+        LookAt=_xl_constant('xlPart', XL_PART),
+        SearchOrder=search_order,
+        SearchDirection=_xl_constant('xlPrevious', XL_PREVIOUS)
+    )
+
+
+@safe_excel_operation
+def write_range_bulk(sheet: Any, first_row: int, first_column: int,
+                     values: Sequence[Sequence[Any]]) -> None:
+    """
+    Write a 2D block of values to a sheet in a single COM call.
+    
+    Args:
+        sheet: Worksheet COM object
+        first_row: Top row of the block (1-based)
+        first_column: Left column of the block (1-based)
+        values: Rows of values; short rows are padded, None becomes an empty string
+    """
+    if not values:
+        return
+    
+    row_count = len(values)
+    column_count = max(len(row) for row in values)
+    if column_count == 0:
+        return
+    
+    block = tuple(
+        tuple("" if value is None else value for value in row) + ("",) * (column_count - len(row))
+        for row in values
+    )
+    target = sheet.Range(
+        sheet.Cells(first_row, first_column),
+        sheet.Cells(first_row + row_count - 1, first_column + column_count - 1)
+    )
+    target.Value2 = block
+
+
+def _range_values_to_list(values: Any) -> List[List[Any]]:
+    """
+    Convert a Range.Value/Value2 result to a list of lists.
+    
+    Args:
+        values: Tuple of tuples for multi-cell ranges, or a scalar for one cell
+        
+    Returns:
+        2D list of cell values
+    """
+    if values is None:
+        return []
+    elif isinstance(values, (list, tuple)):
+        # Already a 2D structure
+        return [list(row) if isinstance(row, (list, tuple)) else [row] for row in values]
+    else:
+        # Single value
+        return [[values]]
\ No newline at end of file
@@ -5,15 +5,96 @@ This module provides functions for file operations, including copying files,
 waiting for file availability, and ensuring file accessibility.
 """
 import os
+import sys
+import random
+import select
 import shutil
 import time
-from typing import Optional
+import threading
+import ctypes
+import ctypes.util
+from contextlib import contextmanager
+from typing import Optional, List, Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-thread list of copies made inside an active copy_session()
+_copy_session_state = threading.local()
 
-def copy_and_rename_input_file(input_path: str, component_name: str, cy_fy_qtr: str, output_folder: str) -> str:
+
+def _fsync_path(path: str) -> None:
+    """
+    Flush a file's contents to disk.
+    
+    Args:
+        path (str): Path to the file to flush.
+    """
+    # Opened for update because Windows refuses to flush a read-only handle
+    with open(path, 'rb+') as f:
+        os.fsync(f.fileno())
+
+
+@contextmanager
+def copy_session() -> Iterator[List[str]]:
+    """
+    Defer the fsync of every input-file copy made in this block to its end.
+    
+    Copies made by copy_and_rename_input_file inside the session are recorded
+    instead of synced one by one, and are flushed together when the block exits
+    so a batch of components pays for one round of disk flushes. Sessions nest;
+    only the outermost one flushes.
+    
+    Yields:
+        List[str]: The paths copied so far in this session.
+    """
+    pending = getattr(_copy_session_state, 'paths', None)
+    if pending is not None:
+        yield pending
+        return
+    
+    pending = []
+    _copy_session_state.paths = pending
+    try:
+        yield pending
+    finally:
+        _copy_session_state.paths = None
+        # One handle at a time keeps large batches well clear of fd limits
+        for path in pending:
+            try:
+                _fsync_path(path)
+            except OSError as e:
+                logger.warning(f"Could not sync copied file {path}: {e}")
+        if pending:
+            logger.debug(f"File system sync completed for {len(pending)} copied file(s)")
+
+
+def _copy_file_fast(source_path: str, dest_path: str) -> None:
+    """
+    Copy a file's contents and timestamps using the operating system's copy routine.
+    
+    Args:
+        source_path (str): Path to the file to copy.
+        dest_path (str): Path to write the copy to.
+    
+    Raises:
+        OSError: If the copy fails.
+    """
+    if sys.platform == 'win32':
+        # CopyFileExW copies inside the kernel (block cloning on ReFS) and keeps
+        # timestamps and attributes itself
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        if not kernel32.CopyFileExW(source_path, dest_path, None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    
+    # copyfile already uses sendfile/copy_file_range on Linux and fcopyfile on macOS
+    shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
+
+
+def copy_and_rename_input_file(input_path: str, component_name: str, cy_fy_qtr: str, output_folder: str,
+                               durable: bool = False) -> str:
     """
     Copy and rename the input file to a new location.
     
@@ -22,6 +103,10 @@ def copy_and_rename_input_file(input_path: str, component_name: str, cy_fy_qtr:
         component_name (str): Name of the component.
         cy_fy_qtr (str): Current fiscal year and quarter.
         output_folder (str): Path to the output folder.
+        durable (bool): Whether to fsync the copy to disk before returning. The
+            copy is read straight back by this process, so this is off by default.
+            Copies made inside copy_session() are always synced, once, when the
+            session ends.
     
     Returns:
         str: Path to the new renamed file.
@@ -32,8 +117,10 @@ def copy_and_rename_input_file(input_path: str, component_name: str, cy_fy_qtr:
         OSError: For other OS-related errors during file operations.
     """
     try:
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        try:
+            source_size = os.stat(input_path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {input_path}") from None
             
         if not os.path.exists(output_folder):
             os.makedirs(output_folder, exist_ok=True)
@@ -42,27 +129,25 @@ def copy_and_rename_input_file(input_path: str, component_name: str, cy_fy_qtr:
         new_input_name = f"{component_name} {cy_fy_qtr} Advance Analysis - DO.xlsx"
         new_input_path = os.path.join(output_folder, new_input_name)
         
-        shutil.copy(input_path, new_input_path)
+        _copy_file_fast(input_path, new_input_path)
         logger.info(f"File copied from {input_path} to {new_input_path}")
         
-        # Ensure file copy is complete and synchronized
+        # Verify the copy. shutil has already closed the destination, so its
+        # contents are visible to any later open without forcing them to disk.
         try:
-            # Force file system sync
-            with open(new_input_path, 'rb+') as f:
-                f.flush()
-                os.fsync(f.fileno())
-            logger.debug("File system sync completed for copied file")
+            session_paths = getattr(_copy_session_state, 'paths', None)
+            if session_paths is not None:
+                session_paths.append(new_input_path)
+            elif durable:
+                _fsync_path(new_input_path)
+                logger.debug("File system sync completed for copied file")
             
             # Verify file size matches
-            source_size = os.path.getsize(input_path)
-            dest_size = os.path.getsize(new_input_path)
+            dest_size = os.stat(new_input_path).st_size
             if source_size != dest_size:
                 logger.warning(f"File size mismatch: source={source_size}, dest={dest_size}")
             else:
                 logger.debug(f"File copy verified: {dest_size} bytes")
-                
-            # Small delay to ensure file system operations complete
-            time.sleep(0.5)
             
         except Exception as e:
             logger.warning(f"Could not verify file copy: {e}")
@@ -80,6 +165,120 @@ def copy_and_rename_input_file(input_path: str, component_name: str, cy_fy_qtr:
         raise
 
 
+# Backoff between file availability probes: start short so a quickly released
+# file is picked up almost at once, then double up to the cap
+_PROBE_INITIAL_DELAY = 0.01
+_PROBE_MAX_DELAY = 0.5
+
+# Shortest interval a caller may ask for between checks, so a zero or negative
+# check_interval cannot turn a wait into a busy loop
+_MIN_CHECK_INTERVAL = 0.05
+
+# inotify flags (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_CLOSE_NOWRITE = 0x00000010
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# FindFirstChangeNotification filter flags (winnt.h)
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+_FILE_NOTIFY_CHANGE_SIZE = 0x00000008
+_FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+
+
+class _InotifyWatcher:
+    """Wakes a waiter when any file in a directory is closed, created, moved in or deleted."""
+    
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CLOSE_WRITE | _IN_CLOSE_NOWRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+    
+    def wait(self, timeout: float) -> None:
+        # Discard anything already queued, including the close of our own probe
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        select.select([self._fd], [], [], timeout)
+    
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _ChangeNotificationWatcher:
+    """Wakes a waiter when a file in a directory is written, resized, renamed or deleted."""
+    
+    def __init__(self, directory: str):
+        import win32file
+        import win32event
+        self._win32file = win32file
+        self._win32event = win32event
+        self._handle = win32file.FindFirstChangeNotification(
+            directory,
+            False,
+            _FILE_NOTIFY_CHANGE_FILE_NAME | _FILE_NOTIFY_CHANGE_SIZE | _FILE_NOTIFY_CHANGE_LAST_WRITE
+        )
+    
+    def wait(self, timeout: float) -> None:
+        result = self._win32event.WaitForSingleObject(self._handle, int(timeout * 1000))
+        if result == self._win32event.WAIT_OBJECT_0:
+            self._win32file.FindNextChangeNotification(self._handle)
+    
+    def close(self) -> None:
+        self._win32file.FindCloseChangeNotification(self._handle)
+
+
+def _open_close_watcher(file_path: str):
+    """
+    Start watching the directory of a file for the events that follow a handle being released.
+    
+    Args:
+        file_path (str): Path to the file being waited on.
+    
+    Returns:
+        A watcher with wait(timeout) and close() methods, or None if this platform
+        offers no usable change notification (callers then fall back to polling).
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    try:
+        if sys.platform.startswith('linux'):
+            return _InotifyWatcher(directory)
+        if sys.platform == 'win32':
+            return _ChangeNotificationWatcher(directory)
+    except Exception as e:
+        # Covers a missing pywin32 or libc symbol as well as pywintypes.error,
+        # which does not derive from OSError
+        logger.debug(f"File change notifications unavailable, polling instead: {e}")
+    return None
+
+
+def _wait_for_close(watcher, timeout: float) -> None:
+    """
+    Block until the watched directory reports a change or the timeout passes.
+    
+    Args:
+        watcher: A watcher from _open_close_watcher, or None to simply sleep.
+        timeout (float): Longest time to block, in seconds. Notifications are not
+            delivered for every file system (network shares in particular), so the
+            caller re-probes the file after every timeout as well as every event.
+    """
+    if watcher is None:
+        time.sleep(timeout)
+    else:
+        watcher.wait(timeout)
+
+
 def wait_for_file(file_path: str, timeout: int = 60, check_interval: int = 1) -> bool:
     """
     Wait for a file to be available and not locked.
@@ -87,7 +286,10 @@ def wait_for_file(file_path: str, timeout: int = 60, check_interval: int = 1) ->
     Args:
         file_path (str): Path to the file to wait for.
         timeout (int): Maximum time to wait in seconds.
-        check_interval (int): Interval between checks in seconds.
+        check_interval (int): Longest interval between checks in seconds. Checks
+            start 10 ms apart and back off to at most half a second (or this
+            interval, if shorter, but never below 50 ms). Where the platform reports file changes, the
+            file is also re-checked as soon as a handle in its directory is closed.
     
     Returns:
         bool: True if file becomes available, False if timeout is reached.
@@ -100,41 +302,152 @@ def wait_for_file(file_path: str, timeout: int = 60, check_interval: int = 1) ->
     logger.info(f"Waiting for file to become available: {file_path}")
     logger.debug(f"Timeout: {timeout}s, Check interval: {check_interval}s")
     
+    watcher = _open_close_watcher(file_path)
+    max_delay = min(_PROBE_MAX_DELAY, max(check_interval, _MIN_CHECK_INTERVAL))
+    delay = _PROBE_INITIAL_DELAY
     attempt_count = 0
-    while time.time() - start_time < timeout:
-        attempt_count += 1
-        try:
-            # Try to open the file in read-write mode
-            with open(file_path, 'r+b') as f:
-                # Try to read a few bytes to ensure file is truly accessible
-                f.read(1)
-                logger.info(f"File is now available after {attempt_count} attempts: {file_path}")
-                return True  # File is available
-        except IOError as e:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            if attempt_count % 10 == 0:  # Log every 10 attempts
-                logger.debug(f"File still locked after {attempt_count} attempts ({elapsed:.1f}s elapsed, {remaining:.1f}s remaining): {e}")
-            time.sleep(check_interval)
-        except Exception as e:
-            logger.warning(f"Unexpected error while checking file availability: {type(e).__name__}: {e}")
-            time.sleep(check_interval)
+    try:
+        while time.time() - start_time < timeout:
+            attempt_count += 1
+            try:
+                # Try to open the file in read-write mode
+                with open(file_path, 'r+b') as f:
+                    # Try to read a few bytes to ensure file is truly accessible
+                    f.read(1)
+                    logger.info(f"File is now available after {attempt_count} attempts: {file_path}")
+                    return True  # File is available
+            except IOError as e:
+                elapsed = time.time() - start_time
+                remaining = timeout - elapsed
+                if attempt_count % 10 == 0 and logger.isEnabledFor(logging.DEBUG):  # Log every 10 attempts
+                    logger.debug(f"File still locked after {attempt_count} attempts ({elapsed:.1f}s elapsed, {remaining:.1f}s remaining): {e}")
+                # Jitter keeps several waiters from probing in lockstep
+                pause = delay + random.uniform(0, delay * 0.1)
+                _wait_for_close(watcher, min(pause, max(remaining, 0)))
+                delay = min(max_delay, delay * 2)
+            except Exception as e:
+                logger.warning(f"Unexpected error while checking file availability: {type(e).__name__}: {e}")
+                time.sleep(delay)
+                delay = min(max_delay, delay * 2)
+    finally:
+        if watcher is not None:
+            watcher.close()
             
     logger.error(f"Timeout reached after {attempt_count} attempts ({timeout}s) while waiting for file: {file_path}")
     return False  # Timeout reached
 
 
-def wait_for_excel_to_release_file(file_path: str, timeout: int = 60) -> bool:
+# Process access right needed to wait on a process handle (winnt.h)
+_SYNCHRONIZE = 0x00100000
+_WAIT_OBJECT_0 = 0x00000000
+_ERROR_INVALID_PARAMETER = 87
+
+
+def _wait_for_process_exit(pid: int, timeout: float) -> Optional[bool]:
+    """
+    Block until a process exits, without polling.
+    
+    Args:
+        pid (int): Id of the process to wait on.
+        timeout (float): Maximum time to wait in seconds.
+    
+    Returns:
+        Optional[bool]: True if the process has exited, False if it is still
+            running at the timeout, or None if this platform cannot wait on it.
+    """
+    if hasattr(os, 'pidfd_open'):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError as e:
+            logger.debug(f"pidfd_open failed for pid {pid}: {e}")
+            return None
+        try:
+            # A pidfd becomes readable once the process has terminated
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(pidfd)
+    
+    if sys.platform == 'win32':
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        handle = kernel32.OpenProcess(_SYNCHRONIZE, False, pid)
+        if not handle:
+            if ctypes.get_last_error() == _ERROR_INVALID_PARAMETER:
+                return True  # No such process any more
+            return None
+        try:
+            return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == _WAIT_OBJECT_0
+        finally:
+            kernel32.CloseHandle(handle)
+    
+    return None
+
+
+def _is_file_available(file_path: str) -> bool:
+    """
+    Check once whether a file can be opened for read-write.
+    
+    Args:
+        file_path (str): Path to the file to check.
+    
+    Returns:
+        bool: True if the file could be opened, False otherwise.
+    """
+    try:
+        with open(file_path, 'r+b') as f:
+            f.read(1)
+        return True
+    except OSError:
+        return False
+
+
+def wait_for_excel_to_release_file(file_path: str, timeout: int = 60, pid: Optional[int] = None,
+                                   check_interval: float = 1) -> bool:
     """
     Wait for Excel to release a file.
     
     Args:
         file_path (str): Path to the file to wait for.
         timeout (int): Maximum time to wait in seconds.
+        pid (Optional[int]): Id of the Excel process holding the file, when the
+            caller has just quit it. The wait then ends the moment the process
+            exits instead of when a probe next happens to find the file free.
+        check_interval (float): With a pid, how long to wait on the process
+            between checks of the file, so an Excel that releases the file but
+            keeps running does not hold the caller until the timeout.
     
     Returns:
         bool: True if file becomes available, False if timeout is reached.
     """
+    if pid is not None:
+        deadline = time.time() + timeout
+        interval = max(check_interval, _MIN_CHECK_INTERVAL)
+        while True:
+            if _is_file_available(file_path):
+                logger.info(f"Excel released: {file_path}")
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            exited = _wait_for_process_exit(pid, min(interval, remaining))
+            if exited is None:
+                break  # This platform cannot wait on the process; probe the file
+            if exited:
+                if _is_file_available(file_path):
+                    logger.info(f"Excel process {pid} exited and released: {file_path}")
+                    return True
+                # The handle can outlive the process briefly; probe the file
+                logger.debug(f"Excel process {pid} exited but {file_path} is still locked")
+                break
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            logger.error(f"Timeout reached ({timeout}s) while waiting for Excel to release: {file_path}")
+            return False
+        return wait_for_file(file_path, remaining)
+    
     return wait_for_file(file_path, timeout)
 
 
@@ -155,42 +468,35 @@ def ensure_file_accessibility(file_path: str, timeout: int = 60, retries: int =
     logger.info(f"Ensuring file accessibility for: {file_path}")
     
     for attempt in range(retries):
+        watcher = None
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                if attempt < retries - 1:
-                    logger.warning(f"File does not exist on attempt {attempt + 1}/{retries}: {file_path}")
-                    time.sleep(2)  # Wait before retry
-                    continue
-                else:
-                    raise FileNotFoundError(f"File does not exist after {retries} attempts: {file_path}")
-            
-            # Log file size
-            file_size = os.path.getsize(file_path)
-            logger.debug(f"File size: {file_size} bytes")
-            
-            # Wait for file to be released
-            if not wait_for_excel_to_release_file(file_path, timeout):
-                if attempt < retries - 1:
-                    logger.warning(f"Timeout waiting for file release on attempt {attempt + 1}/{retries}")
-                    # Try to clear any lingering locks
-                    import gc
-                    gc.collect()
-                    time.sleep(3)  # Wait before retry
+            deadline = time.time() + timeout
+            delay = _PROBE_INITIAL_DELAY
+            while True:
+                # A read-write open fails while Excel still holds the file, and the
+                # size then comes from the same handle: one open/fstat per probe
+                try:
+                    fd = os.open(file_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+                except PermissionError as e:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Timeout waiting for Excel to release {file_path}: {e}") from None
+                    if watcher is None:
+                        watcher = _open_close_watcher(file_path)
+                    _wait_for_close(watcher, min(delay + random.uniform(0, delay * 0.1), remaining))
+                    delay = min(_PROBE_MAX_DELAY, delay * 2)
                     continue
-                else:
-                    raise TimeoutError(f"Timeout waiting for Excel to release {file_path} after {retries} attempts")
-            
-            # Additional check to ensure the file exists and is not empty
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File {file_path} disappeared after Excel operation")
                 
-            final_size = os.path.getsize(file_path)
-            if final_size == 0:
-                raise FileNotFoundError(f"File {file_path} is empty (0 bytes) after Excel operation")
-            
-            logger.info(f"File accessibility ensured: {file_path} (size: {final_size} bytes)")
-            return  # Success
+                try:
+                    final_size = os.fstat(fd).st_size
+                finally:
+                    os.close(fd)
+                
+                if final_size == 0:
+                    raise FileNotFoundError(f"File {file_path} is empty (0 bytes) after Excel operation")
+                
+                logger.info(f"File accessibility ensured: {file_path} (size: {final_size} bytes)")
+                return  # Success
             
         except FileNotFoundError as e:
             if attempt < retries - 1:
@@ -211,4 +517,7 @@ def ensure_file_accessibility(file_path: str, timeout: int = 60, retries: int =
                 time.sleep(2)
             else:
                 logger.error(f"OS error when ensuring file accessibility: {e}", exc_info=True)
-                raise
\ No newline at end of file
+                raise
+        finally:
+            if watcher is not None:
+                watcher.close()
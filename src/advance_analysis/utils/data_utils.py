@@ -5,8 +5,10 @@ This module provides utility functions for data processing operations such as
 identifying keyword columns, parsing dates, creating identifiers, and validating data.
 """
 import re
+import functools
 from datetime import datetime
-from typing import List, Dict, Any, Union, Optional
+from decimal import Decimal
+from typing import List, Dict, Any, Union, Optional, Iterable, Pattern, FrozenSet, Tuple
 
 import pandas as pd
 import numpy as np
@@ -14,6 +16,29 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Components whose DO Concatenate is always TAS + DHS Doc No + balance
+SPECIAL_CONCAT_COMPONENTS = ['SS', 'CBP', 'MGA', 'OIG', 'FEM']
+
+OTHER_IDENTIFIER_COLUMN = 'Other Unique Identifier if DHS Doc No is not unique1'
+
+# Columns reported in 'Null or Blank Columns' when empty
+NULL_CHECK_COLUMNS = [
+    "TAS", "USSGL", "DHS Doc No", "PY Q4 Ending Balance UDO", 
+    "Date of Obligation", "Age of Obligation in Days2", 
+    "Date of the Last Invoice Received", "Obligation Type3", 
+    "Current Quarter Status", "Current FY Quarter-End  balance UDO", 
+    "Period of Performance End Date", "Vendor", "Comments"
+]
+
+# UDO balance columns also count the literal string "nan" as blank
+UDO_BALANCE_COLUMNS = ["PY Q4 Ending Balance UDO", "Current FY Quarter-End  balance UDO"]
+
+# Additionally checked for rows in Status 3 and 4
+DEOBLIGATION_DATE_COLUMNS = [
+    "For Status 3 and 4 -Date deobligation was initiated",
+    "For Status 3 and 4 - Date debligation is planned"
+]
+
 
 def identify_keyword_columns(df: pd.DataFrame, keyword_terms: List[str]) -> List[str]:
     """
@@ -26,7 +51,11 @@ def identify_keyword_columns(df: pd.DataFrame, keyword_terms: List[str]) -> List
     Returns:
         List[str]: A list of column names that contain the keyword terms.
     """
-    return [col for col in df.columns if any(keyword.lower() in col.lower() for keyword in keyword_terms)]
+    if not keyword_terms:
+        return []
+    # One case-insensitive alternation matches every keyword in a single scan per column
+    pattern = re.compile('|'.join(re.escape(keyword) for keyword in keyword_terms), re.IGNORECASE)
+    return [col for col in df.columns if pattern.search(col)]
 
 
 def parse_date(value: Any) -> pd.Timestamp:
@@ -46,6 +75,27 @@ def parse_date(value: Any) -> pd.Timestamp:
         return pd.NaT
 
 
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parses a whole column of values into datetimes.
+    
+    Column-level counterpart of parse_date: pandas parses every value in one call
+    and caches repeated strings, instead of running the parser once per value.
+    
+    Args:
+        values (pd.Series): The values to be parsed into dates.
+    
+    Returns:
+        pd.Series: Parsed timestamps, with pd.NaT wherever parsing fails.
+    """
+    try:
+        return pd.to_datetime(values, errors='coerce', format='mixed', cache=True)
+    except Exception as e:
+        # e.g. a column mixing time zones; fall back to parsing value by value
+        logger.debug(f"Failed to parse date column in one pass: {str(e)}")
+        return values.map(parse_date)
+
+
 def fill_other_unique_identifier(df: pd.DataFrame, keyword_columns: List[str]) -> pd.DataFrame:
     """
     Fills the 'Other Unique Identifier' column with values from keyword columns if it's empty.
@@ -60,16 +110,19 @@ def fill_other_unique_identifier(df: pd.DataFrame, keyword_columns: List[str]) -
     identifier_col = "Other Unique Identifier if DHS Doc No is not unique1"
     
     if df[identifier_col].isna().all() and keyword_columns:
-        for col in keyword_columns:
-            mask = df[identifier_col].isna() & df[col].notna() & (df[col].astype(str).str.strip() != '')
-            df.loc[mask, identifier_col] = df.loc[mask, col]
+        # Blank strings count as missing; back-filling across the row then leaves
+        # the first usable keyword value of each row in the first column
+        keyword_values = df[keyword_columns].replace(r'^\s*$', np.nan, regex=True)
+        df[identifier_col] = keyword_values.bfill(axis=1).iloc[:, 0]
         
         filled_count = df[identifier_col].notna().sum()
         logger.info(f"Filled {filled_count} empty 'Other Unique Identifier' values with data from keyword columns")
     else:
         logger.debug("'Other Unique Identifier' column is not entirely empty or no keyword columns present")
     
-    logger.debug(f"Sample of 'Other Unique Identifier' column after filling: {df[identifier_col].head().tolist()}")
+    # Only build the sample when it will actually be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Sample of 'Other Unique Identifier' column after filling: {df[identifier_col].head().tolist()}")
     return df
 
 
@@ -105,6 +158,50 @@ def format_balance(balance: Union[float, str]) -> str:
         return str(balance)  # Return the original string if conversion fails
 
 
+def format_balance_series(balances: pd.Series) -> pd.Series:
+    """
+    Format a whole column of balance values according to the format_balance logic.
+    
+    Args:
+        balances (pd.Series): The balance values to format.
+    
+    Returns:
+        pd.Series: Formatted balance strings, aligned with the input index.
+    """
+    if pd.api.types.is_numeric_dtype(balances) and not pd.api.types.is_bool_dtype(balances):
+        missing = balances.isna()
+        numeric = balances.astype(float)
+    else:
+        is_str = balances.map(lambda value: isinstance(value, str)).astype(bool)
+        text = balances.where(is_str, '').astype(str)
+        blank = is_str & text.str.strip().eq('')
+        missing = (balances.isna() & ~is_str) | blank
+        # Commas are only stripped from strings, as format_balance does
+        parsed = pd.to_numeric(text.str.replace(',', '', regex=False).where(is_str & ~blank), errors='coerce')
+        numeric = pd.to_numeric(balances.where(~is_str), errors='coerce').where(~is_str, parsed)
+    
+    numeric = numeric.astype(float)
+    result = pd.Series('0', index=balances.index, dtype=object)
+    
+    finite = ~missing & np.isfinite(numeric)
+    if finite.any():
+        # '%.2f' rounds exactly like round(value, 2), so whole numbers end in '.00'
+        # and other values lose at most one trailing zero
+        formatted = pd.Series(np.char.mod('%.2f', numeric[finite].to_numpy()), index=numeric.index[finite])
+        whole = formatted.str.endswith('.00')
+        formatted = formatted.where(~whole, formatted.str[:-3])
+        formatted = formatted.where(whole | ~formatted.str.endswith('0'), formatted.str[:-1])
+        result[finite] = formatted.replace('-0', '0').astype(object)
+    
+    # Anything the vectorized parse could not handle (unparseable text, inf,
+    # 'nan' strings) goes through format_balance itself so results match exactly
+    leftover = ~missing & ~finite
+    if leftover.any():
+        result[leftover] = [format_balance(value) for value in balances[leftover]]
+    
+    return result
+
+
 def create_do_concatenate(row: pd.Series, component: str, keyword_columns: List[str], balance_column: str) -> str:
     """
     Creates a concatenated string identifier for a row based on specific rules.
@@ -130,11 +227,11 @@ def create_do_concatenate(row: pd.Series, component: str, keyword_columns: List[
         balance = format_balance(row[balance_column])
         
         # Case 1: Special case for specific components
-        if component in ['SS', 'CBP', 'MGA', 'OIG', 'FEM']:
+        if component in SPECIAL_CONCAT_COMPONENTS:
             return f"{tas}{dhs_doc_no}{balance}"
         
         # Case 2: Use 'Other Unique Identifier if DHS Doc No is not unique1' if available
-        other_identifier = safe_str(row['Other Unique Identifier if DHS Doc No is not unique1'])
+        other_identifier = safe_str(row[OTHER_IDENTIFIER_COLUMN])
         if other_identifier:
             return f"{tas}{dhs_doc_no}{other_identifier}"
         
@@ -152,6 +249,99 @@ def create_do_concatenate(row: pd.Series, component: str, keyword_columns: List[
         return "ERROR"
 
 
+def _clean_str_array(series: pd.Series) -> np.ndarray:
+    """
+    Vectorized form of the safe_str helper in create_do_concatenate.
+    
+    Args:
+        series (pd.Series): The column to convert.
+    
+    Returns:
+        np.ndarray: Object array of stripped strings, with '' for missing values.
+    """
+    return series.astype(str).str.strip().where(series.notna(), '').to_numpy(dtype=object)
+
+
+def prepare_concat_inputs(
+    df: pd.DataFrame,
+    keyword_columns: List[str],
+    balance_column: str,
+    with_identifiers: bool = True
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray], np.ndarray]:
+    """
+    Converts the columns used by DO Concatenate into cleaned string arrays once.
+    
+    Each array holds the value create_do_concatenate would compute for a row, so
+    missing-value checks and stripping are done per column rather than per row.
+    
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        keyword_columns (List[str]): List of keyword columns to check.
+        balance_column (str): The name of the balance column to use.
+        with_identifiers (bool, optional): Whether to prepare the Other Unique
+            Identifier and keyword arrays; not needed for the special components.
+    
+    Returns:
+        Tuple: (tas, dhs_doc_no, other_identifier, keywords, balance) arrays.
+            keywords is 2-D with one row per keyword column. other_identifier and
+            keywords are None when with_identifiers is False.
+    """
+    tas = _clean_str_array(df['TAS'])
+    dhs_doc_no = _clean_str_array(df['DHS Doc No'])
+    balance = format_balance_series(df[balance_column]).to_numpy(dtype=object)
+    
+    other_identifier = None
+    keywords = None
+    if with_identifiers:
+        other_identifier = _clean_str_array(df[OTHER_IDENTIFIER_COLUMN])
+        keywords = np.empty((len(keyword_columns), len(df)), dtype=object)
+        for i, col in enumerate(keyword_columns):
+            keywords[i] = _clean_str_array(df[col])
+    
+    return tas, dhs_doc_no, other_identifier, keywords, balance
+
+
+def build_do_concatenate_vector(df: pd.DataFrame, component: str, keyword_columns: List[str], balance_column: str) -> np.ndarray:
+    """
+    Creates the concatenated string identifiers for every row of a DataFrame at once.
+    
+    Applies the same rules as create_do_concatenate, but works on whole columns
+    instead of building a Series for each row.
+    
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        component (str): The component name.
+        keyword_columns (List[str]): List of keyword columns to check.
+        balance_column (str): The name of the balance column to use.
+    
+    Returns:
+        np.ndarray: A concatenated string identifier for each row.
+    """
+    special = component in SPECIAL_CONCAT_COMPONENTS
+    tas, dhs_doc_no, other_identifier, keywords, balance = prepare_concat_inputs(
+        df, keyword_columns, balance_column, with_identifiers=not special
+    )
+    prefix = tas + dhs_doc_no
+    
+    # Case 1: Special case for specific components
+    if special:
+        return prefix + balance
+    
+    # Case 4: fall back to the formatted balance when nothing else is found
+    suffix = balance
+    
+    # Case 3: first non-empty keyword column
+    if len(keywords):
+        present = keywords != ''
+        first_keyword = keywords[present.argmax(axis=0), np.arange(len(df))]
+        suffix = np.where(present.any(axis=0), first_keyword, suffix)
+    
+    # Case 2: 'Other Unique Identifier if DHS Doc No is not unique1' wins when available
+    suffix = np.where(other_identifier != '', other_identifier, suffix)
+    
+    return prefix + suffix
+
+
 def create_current_do_concatenate(row: pd.Series, component: str, keyword_columns: List[str]) -> str:
     """
     Creates a concatenated string identifier for current period data.
@@ -201,18 +391,10 @@ def check_null_or_blank_columns(row: pd.Series, separator: str = ", ") -> str:
     Returns:
         str: A string of column names that are null or blank, separated by the specified separator.
     """
-    columns_to_check = [
-        "TAS", "USSGL", "DHS Doc No", "PY Q4 Ending Balance UDO", 
-        "Date of Obligation", "Age of Obligation in Days2", 
-        "Date of the Last Invoice Received", "Obligation Type3", 
-        "Current Quarter Status", "Current FY Quarter-End  balance UDO", 
-        "Period of Performance End Date", "Vendor", "Comments"
-    ]
-    
     null_or_blank_columns = []
-    for col in columns_to_check:
+    for col in NULL_CHECK_COLUMNS:
         value = row[col]
-        if col in ["PY Q4 Ending Balance UDO", "Current FY Quarter-End  balance UDO"]:
+        if col in UDO_BALANCE_COLUMNS:
             # Special handling for UDO columns
             if pd.isna(value) or value == "nan" or (isinstance(value, str) and not value.strip()):
                 null_or_blank_columns.append(col)
@@ -223,17 +405,87 @@ def check_null_or_blank_columns(row: pd.Series, separator: str = ", ") -> str:
     
     # Additional checks for Status 3 and 4
     if row["Current Quarter Status"] in ["3", "4"]:
-        deobligation_columns = [
-            "For Status 3 and 4 -Date deobligation was initiated",
-            "For Status 3 and 4 - Date debligation is planned"
-        ]
-        for col in deobligation_columns:
+        for col in DEOBLIGATION_DATE_COLUMNS:
             if pd.isna(row[col]) or (isinstance(row[col], str) and not row[col].strip()):
                 null_or_blank_columns.append(col)
     
     return separator.join(null_or_blank_columns)
 
 
+def check_null_or_blank_all(df: pd.DataFrame, separator: str = ", ") -> pd.Series:
+    """
+    Checks every row of a DataFrame for null or blank values in the checked columns.
+    
+    Produces the same strings as applying check_null_or_blank_columns row by row,
+    but builds the null/blank mask for all rows and columns at once.
+    
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        separator (str, optional): The separator to use when joining column names.
+    
+    Returns:
+        pd.Series: For each row, the names of its null or blank columns joined by the separator.
+    """
+    columns = NULL_CHECK_COLUMNS + DEOBLIGATION_DATE_COLUMNS
+    # The deobligation date columns may be absent when no row is Status 3 or 4;
+    # reindex fills any missing column with NaN, so it reads as blank
+    checked = df.reindex(columns=columns)
+    blank = checked.apply(lambda s: s.isna() | s.astype(str).str.strip().eq(''))
+    for col in UDO_BALANCE_COLUMNS:
+        blank[col] |= checked[col].eq("nan")
+    
+    # Deobligation dates only matter for Status 3 and 4
+    status_3_or_4 = df["Current Quarter Status"].isin(["3", "4"])
+    for col in DEOBLIGATION_DATE_COLUMNS:
+        blank[col] &= status_3_or_4
+    
+    # Multiplying a bool by a string keeps or drops it, so the matrix product
+    # concatenates the flagged names of each row in column order
+    names = np.array([col + separator for col in columns], dtype=object)
+    joined = blank.to_numpy(dtype=object).dot(names) if len(df) else np.array([], dtype=object)
+    trim = len(separator)
+    return pd.Series(
+        [text[:-trim] if text and trim else text for text in joined],
+        index=df.index,
+        dtype=object
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_keyword_matcher(keywords: FrozenSet[str]) -> Pattern:
+    """
+    Compiles a set of keywords into a single literal-alternation regex.
+    
+    Args:
+        keywords (FrozenSet[str]): The keywords to match.
+    
+    Returns:
+        Pattern: A compiled pattern matching any of the keywords.
+    """
+    if not keywords:
+        return re.compile(r'(?!)')  # Never matches
+    # Longest first so overlapping keywords are tried in a stable order
+    alternatives = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+    return re.compile('|'.join(re.escape(keyword) for keyword in alternatives))
+
+
+def build_keyword_matcher(keywords: Iterable[str]) -> Pattern:
+    """
+    Returns a compiled matcher that finds any of the given keywords in one scan.
+    
+    Matchers are cached by keyword set, so repeated calls with the same keywords
+    share one compiled pattern.
+    
+    Args:
+        keywords (Iterable[str]): The keywords to search for. Matched literally and
+            case-sensitively, so pass them in lower case to match lowercased text.
+    
+    Returns:
+        Pattern: A compiled pattern; use .search() to test a string.
+    """
+    return _compile_keyword_matcher(frozenset(keywords))
+
+
 def check_keywords(text: Any, keywords: List[str]) -> bool:
     """
     Checks if any of the given keywords are present in the text.
@@ -247,7 +499,7 @@ def check_keywords(text: Any, keywords: List[str]) -> bool:
     """
     if text is None:
         return False
-    return any(keyword in str(text).lower() for keyword in keywords)
+    return build_keyword_matcher(keywords).search(str(text).lower()) is not None
 
 
 def remove_nulls_and_blanks(conditions: List[Any]) -> List[str]:
@@ -298,4 +550,50 @@ def trim_prior_status(row: pd.Series) -> Optional[str]:
     elif "No" in prior_status:
         return prior_status[4:]
     else:
-        return None  # Changed from "" to None to match Power Query's null
\ No newline at end of file
+        return None  # Changed from "" to None to match Power Query's null
+
+
+def trim_prior_status_series(prior_status: pd.Series) -> pd.Series:
+    """
+    Trims a whole 'Prior Status Agrees?' column at once.
+    
+    Column-level counterpart of trim_prior_status, using the same rules: values
+    containing 'Yes' lose their first 5 characters, otherwise values containing
+    'No' lose their first 4, and anything else becomes None.
+    
+    Args:
+        prior_status (pd.Series): The 'Prior Status Agrees?' column.
+    
+    Returns:
+        pd.Series: The trimmed status strings, with None where no rule applies.
+    """
+    text = prior_status.astype(object)
+    has_yes = text.str.contains("Yes", regex=False, na=False).to_numpy(dtype=bool)
+    has_no = text.str.contains("No", regex=False, na=False).to_numpy(dtype=bool)
+    trimmed = np.where(
+        has_yes,
+        text.str[5:].to_numpy(dtype=object),
+        np.where(has_no, text.str[4:].to_numpy(dtype=object), None)
+    )
+    return pd.Series(trimmed, index=prior_status.index, dtype=object)
+
+
+def amounts_match(first: Any, second: Any) -> bool:
+    """
+    Checks whether two amounts agree, ignoring sign, to within a fraction of a cent.
+    
+    A balance can be carried with the opposite sign on the other side of a
+    reconciliation, so absolute values are compared. A real one-cent gap is a
+    mismatch.
+    
+    Args:
+        first (Any): Numeric amount (int, float, Decimal or numeric string).
+        second (Any): Numeric amount (int, float, Decimal or numeric string).
+    
+    Returns:
+        bool: True if the absolute amounts differ by less than one cent.
+    
+    Raises:
+        decimal.InvalidOperation: If either amount is not numeric.
+    """
+    return abs(abs(Decimal(str(first))) - abs(Decimal(str(second)))) < Decimal('0.01')
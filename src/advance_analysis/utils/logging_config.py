@@ -5,14 +5,34 @@ This module provides centralized logging configuration with support for
 both file and console output, structured logging, and proper log rotation.
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_dir: Optional[Path] = None,
@@ -30,12 +50,17 @@ def setup_logging(
         log_to_console: Whether to log to console
         log_filename: Custom log filename. Defaults to advance_analysis_YYYYMMDD_HHMMSS.log
     """
+    global _queue_listener
+    
     # Set up log directory
     if log_dir is None:
         # Use project logs directory
         project_root = Path(__file__).parent.parent.parent.parent
         log_dir = project_root / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Only touch the file system when a log file is actually wanted
+    if log_to_file:
+        log_dir.mkdir(parents=True, exist_ok=True)
     
     # Set up log filename
     if log_filename is None:
@@ -53,9 +78,12 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Clear existing handlers
+    # Clear existing handlers, draining any previous listener first
+    _stop_queue_listener()
     root_logger.handlers.clear()
     
+    handlers = []
+    
     # Add file handler if requested
     if log_to_file:
         # Use rotating file handler to manage log file size
@@ -66,18 +94,29 @@ def setup_logging(
             encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # Add console handler if requested
     if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Callers only enqueue records; the file and console writes (and log
+    # rotation) happen on the listener's background thread
+    if handlers:
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
     
     # Log initial message
     logging.info(f"Logging initialized - Level: {log_level}, File: {log_path if log_to_file else 'None'}")
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -91,5 +130,11 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-# Configure logging on import with default settings
-setup_logging()
\ No newline at end of file
+# Configure logging on import with default settings, unless the process has
+# already configured the root logger (e.g. a re-import in a worker process).
+# Processes that configure logging themselves, or want no log file at all, can
+# set ADVANCE_ANALYSIS_AUTOSETUP_LOGGING=0 to skip this.
+AUTOSETUP_ENV_VAR = "ADVANCE_ANALYSIS_AUTOSETUP_LOGGING"
+
+if os.environ.get(AUTOSETUP_ENV_VAR, "1") != "0" and not logging.getLogger().handlers:
+    setup_logging()
\ No newline at end of file
@@ -5,13 +5,79 @@ This module manages a history of recently used files for each file type
 in the application, allowing users to quickly select from previously used files.
 """
 import os
+import copy
 import json
-from typing import List, Dict, Optional
+import time
+import functools
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes in C and returns bytes ready to write; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Recent files of one type, most recent first, keyed by path
+RecentFileList = OrderedDict[str, Dict[str, str]]
+
+# Parsed config files keyed by path, with the (mtime_ns, size) they were read at,
+# so managers created later in the same process skip re-reading an unchanged file
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, RecentFileList]]] = {}
+
+
+def _to_ordered(entries: List[Dict[str, str]]) -> RecentFileList:
+    """Key a saved list of file infos by path, keeping the first (most recent) of any duplicates."""
+    ordered = OrderedDict()
+    for file_info in entries:
+        ordered.setdefault(file_info.get("path", ""), file_info)
+    return ordered
+
+
+def _migrate_last_used(entries: RecentFileList) -> None:
+    """Convert ISO-format last_used values written by older versions to epoch seconds."""
+    for file_info in entries.values():
+        last_used = file_info.get("last_used")
+        if isinstance(last_used, str):
+            try:
+                file_info["last_used"] = datetime.fromisoformat(last_used).timestamp()
+            except ValueError:
+                file_info["last_used"] = None
+
+
+@functools.lru_cache(maxsize=128)
+def _truncate_dir(directory: str) -> str:
+    """Shorten a long directory to its first two and last two components for display."""
+    if len(directory) > 50:
+        parts = directory.split(os.sep)
+        if len(parts) > 4:
+            return os.sep.join(parts[:2] + ["..."] + parts[-2:])
+    return directory
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _serialize(recent_files: Dict[str, RecentFileList]) -> bytes:
+    """Serialize recent files compactly; the config is only ever read by this module."""
+    return _dumps({file_type: list(files.values()) for file_type, files in recent_files.items()})
+
 
 class RecentFilesManager:
     """Manages recent files history for the application."""
@@ -30,33 +96,70 @@ class RecentFilesManager:
             config_dir = os.path.expanduser("~")
         
         self.config_file = os.path.join(config_dir, ".advance_analysis_recent_files.json")
-        self.recent_files = self._load_recent_files()
+        # Serialized form of what the config file is known to contain
+        self._last_saved_json: Optional[bytes] = None
+        # Loaded on first use, so sessions that never touch recent files skip the read
+        self._recent_files: Optional[Dict[str, RecentFileList]] = None
     
-    def _load_recent_files(self) -> Dict[str, List[Dict[str, str]]]:
+    @property
+    def recent_files(self) -> Dict[str, RecentFileList]:
+        """Recent files by type, loaded from the config file on first access."""
+        if self._recent_files is None:
+            self._recent_files = self._load_recent_files()
+        return self._recent_files
+    
+    def _load_recent_files(self) -> Dict[str, RecentFileList]:
         """Load recent files from the config file."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure all file types exist
-                    for file_type in ["advance_analysis", "current_dhstier", "prior_dhstier"]:
-                        if file_type not in data:
-                            data[file_type] = []
-                    return data
+            st = os.stat(self.config_file)
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = _CONFIG_CACHE.get(self.config_file)
+            if cached is not None and cached[0] == signature:
+                data = copy.deepcopy(cached[1])
+            else:
+                with open(self.config_file, 'rb') as f:
+                    data = {file_type: _to_ordered(files) for file_type, files in _loads(f.read()).items()}
+                for files in data.values():
+                    _migrate_last_used(files)
+                _CONFIG_CACHE[self.config_file] = (signature, copy.deepcopy(data))
+            # Ensure all file types exist
+            for file_type in ["advance_analysis", "current_dhstier", "prior_dhstier"]:
+                if file_type not in data:
+                    data[file_type] = OrderedDict()
+            self._last_saved_json = _serialize(data)
+            return data
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Could not load recent files: {e}")
         
         return {
-            "advance_analysis": [],
-            "current_dhstier": [],
-            "prior_dhstier": []
+            "advance_analysis": OrderedDict(),
+            "current_dhstier": OrderedDict(),
+            "prior_dhstier": OrderedDict()
         }
     
     def _save_recent_files(self) -> None:
         """Save recent files to the config file."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.recent_files, f, indent=2)
+            payload = _serialize(self.recent_files)
+            if payload == self._last_saved_json:
+                return  # File already holds exactly this
+            
+            # Write a sibling file and swap it in, so an interrupted save can
+            # never leave a truncated config behind
+            temp_file = self.config_file + ".tmp"
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(temp_file, self.config_file)
+            self._last_saved_json = payload
+            st = os.stat(self.config_file)
+            _CONFIG_CACHE[self.config_file] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(self.recent_files))
         except Exception as e:
             logger.error(f"Could not save recent files: {e}")
     
@@ -72,34 +175,37 @@ class RecentFilesManager:
             logger.warning(f"Unknown file type: {file_type}")
             return
         
-        # Normalize the path
-        file_path = os.path.abspath(file_path)
+        # Normalize the path; abspath only matters (and only calls getcwd) for relative paths
+        if not os.path.isabs(file_path):
+            file_path = os.path.abspath(file_path)
+        file_path = os.path.normpath(file_path)
         
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists, taking its size from the same stat call
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             logger.warning(f"File does not exist: {file_path}")
             return
         
         # Get file info
+        directory, name = os.path.split(file_path)
         file_info = {
             "path": file_path,
-            "name": os.path.basename(file_path),
-            "directory": os.path.dirname(file_path),
-            "last_used": datetime.now().isoformat(),
-            "size": os.path.getsize(file_path)
+            "name": name,
+            "directory": directory,
+            "last_used": time.time(),
+            "size": st.st_size
         }
         
-        # Remove if already in list
-        self.recent_files[file_type] = [
-            f for f in self.recent_files[file_type] 
-            if f.get("path") != file_path
-        ]
-        
-        # Add to beginning of list
-        self.recent_files[file_type].insert(0, file_info)
+        # Replace any existing entry and move it to the front
+        files = self.recent_files[file_type]
+        files.pop(file_path, None)
+        files[file_path] = file_info
+        files.move_to_end(file_path, last=False)
         
         # Trim to max size
-        self.recent_files[file_type] = self.recent_files[file_type][:self.MAX_RECENT_FILES]
+        while len(files) > self.MAX_RECENT_FILES:
+            files.popitem(last=True)
         
         # Save changes
         self._save_recent_files()
@@ -114,15 +220,34 @@ class RecentFilesManager:
         Returns:
             List of file info dictionaries
         """
-        # Filter out files that no longer exist
+        # Filter out files that no longer exist. Recent files tend to share a few
+        # folders, so list each folder once rather than stat every file.
+        # normcase keeps the comparison case-insensitive on Windows.
+        names_by_dir: Dict[str, Optional[set]] = {}
         valid_files = []
-        for file_info in self.recent_files.get(file_type, []):
-            if os.path.exists(file_info.get("path", "")):
+        files = self.recent_files.get(file_type, OrderedDict())
+        for file_info in files.values():
+            path = file_info.get("path", "")
+            directory, name = os.path.split(path)
+            if directory not in names_by_dir:
+                try:
+                    with os.scandir(directory) as entries:
+                        names_by_dir[directory] = {os.path.normcase(entry.name) for entry in entries}
+                except OSError:
+                    # Folders that cannot be listed (traverse-only shares, a
+                    # dropped network drive) are checked file by file instead
+                    names_by_dir[directory] = None
+            names = names_by_dir[directory]
+            if names is None:
+                exists = os.path.exists(path)
+            else:
+                exists = os.path.normcase(name) in names
+            if exists:
                 valid_files.append(file_info)
         
         # Update the list if files were removed
-        if len(valid_files) != len(self.recent_files.get(file_type, [])):
-            self.recent_files[file_type] = valid_files
+        if len(valid_files) != len(files):
+            self.recent_files[file_type] = _to_ordered(valid_files)
             self._save_recent_files()
         
         return valid_files
@@ -134,47 +259,61 @@ class RecentFilesManager:
         Args:
             file_type: Specific file type to clear, or None to clear all
         """
-        if file_type:
-            if file_type in self.recent_files:
-                self.recent_files[file_type] = []
-        else:
-            for key in self.recent_files:
-                self.recent_files[key] = []
+        keys = [file_type] if file_type else list(self.recent_files)
+        keys = [key for key in keys if self.recent_files.get(key)]
+        if not keys:
+            return  # Nothing to clear, so nothing to save
+        
+        for key in keys:
+            self.recent_files[key] = OrderedDict()
         
         self._save_recent_files()
     
-    def format_file_display(self, file_info: Dict[str, str]) -> str:
+    def remove_file(self, file_type: str, file_path: str) -> None:
+        """
+        Remove a file from the recent files list.
+        
+        Args:
+            file_type: Type of file
+            file_path: Path to the file, as stored in its file info
+        """
+        files = self.recent_files.get(file_type)
+        if files is not None and files.pop(file_path, None) is not None:
+            self._save_recent_files()
+    
+    def format_file_display(self, file_info: Dict[str, str], now: Optional[float] = None) -> str:
         """
         Format file info for display.
         
         Args:
             file_info: File information dictionary
+            now: Reference epoch time for the "days ago" text. Pass one value
+                 when formatting a whole list; defaults to the current time.
             
         Returns:
             Formatted string for display
         """
+        if now is None:
+            now = time.time()
+        
         name = file_info.get("name", "Unknown")
         directory = file_info.get("directory", "")
         
         # Truncate long paths
-        if len(directory) > 50:
-            parts = directory.split(os.sep)
-            if len(parts) > 4:
-                directory = os.sep.join(parts[:2] + ["..."] + parts[-2:])
+        directory = _truncate_dir(directory)
         
         # Format last used time
-        last_used = file_info.get("last_used", "")
+        last_used = file_info.get("last_used")
         if last_used:
             try:
-                dt = datetime.fromisoformat(last_used)
-                days_ago = (datetime.now() - dt).days
+                days_ago = int((now - last_used) // 86400)
                 if days_ago == 0:
                     time_str = "Today"
                 elif days_ago == 1:
                     time_str = "Yesterday"
                 else:
                     time_str = f"{days_ago} days ago"
-            except:
+            except (ValueError, TypeError):
                 time_str = ""
         else:
             time_str = ""
@@ -6,10 +6,15 @@ for the application's GUI.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
+# Theme directories already created in this process
+_ENSURED_THEME_DIRS: Set[Path] = set()
 
+
+@lru_cache(maxsize=1)
 def get_theme_dir() -> Path:
     """
     Get the directory where theme files are stored.
@@ -31,8 +36,11 @@ def ensure_theme_files_exist(theme_dir: Optional[Path] = None) -> None:
     if theme_dir is None:
         theme_dir = get_theme_dir()
     
-    # Create theme directory if it doesn't exist
+    # Create theme directory if it doesn't exist; once per directory per process
+    if theme_dir in _ENSURED_THEME_DIRS:
+        return
     theme_dir.mkdir(parents=True, exist_ok=True)
+    _ENSURED_THEME_DIRS.add(theme_dir)
     
     # Note: Theme files are placeholders only and will not actually load themes
     # The application will fallback to system themes when these fail to load
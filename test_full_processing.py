@@ -6,20 +6,41 @@ This script tests the complete data processing pipeline with all recent fixes.
 import os
 import sys
 import logging
-from datetime import datetime, timedelta
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Logging is configured when the test runs, not when this module is imported,
+# so stop the package from opening a log file on import
+os.environ.setdefault("ADVANCE_ANALYSIS_AUTOSETUP_LOGGING", "0")
+
 from src.advance_analysis.utils.logging_config import setup_logging, get_logger
-from src.advance_analysis.core.data_processing_complete import process_complete_advance_analysis
+from tests.scratch import fast_tmpdir
 
-# Set up logging
-setup_logging(log_level="INFO")
 logger = get_logger(__name__)
 
+# Set to "1" to keep the output workbooks for inspection instead of removing them
+KEEP_OUTPUT_ENV_VAR = "ADVANCE_ANALYSIS_KEEP_TEST_OUTPUT"
+
+# Set to "1" to also report peak memory from a second, traced processing run
+MEASURE_MEMORY_ENV_VAR = "ADVANCE_ANALYSIS_MEASURE_TEST_MEMORY"
+
+def write_excel_sheet(df, path, sheet_name):
+    """Write a DataFrame to a single-sheet workbook with openpyxl's streaming writer."""
+    from openpyxl import Workbook
+    
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    ws.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(path)
+
 def create_test_data():
     """Create minimal test Excel files for processing."""
     try:
@@ -35,8 +56,9 @@ def create_test_data():
     test_dir = Path(__file__).parent / "test_data"
     test_dir.mkdir(exist_ok=True)
     
-    # Create sample advance analysis data
-    base_date = datetime(2024, 10, 1)
+    # Create sample advance analysis data; advances are 30 days apart and each
+    # later date column is a fixed offset from the advance date
+    advance_dates = np.datetime64('2024-10-01') + np.arange(10) * np.timedelta64(30, 'D')
     
     # Current Year (CY) data
     cy_data = {
@@ -47,10 +69,10 @@ def create_test_data():
                     'ADV006', 'ADV007', 'ADV008', 'ADV009', 'ADV010'],
         'Advance/Prepayment': [100000, 200000, 150000, 300000, 250000,
                               180000, 220000, 190000, 210000, 175000],
-        'Date of Advance': [base_date + timedelta(days=i*30) for i in range(10)],
-        'Last Activity Date': [base_date + timedelta(days=i*30+15) for i in range(10)],
-        'Anticipated Liquidation Date': [base_date + timedelta(days=i*30+90) for i in range(10)],
-        'Period of Performance End Date': [base_date + timedelta(days=i*30+180) for i in range(10)],
+        'Date of Advance': advance_dates,
+        'Last Activity Date': advance_dates + np.timedelta64(15, 'D'),
+        'Anticipated Liquidation Date': advance_dates + np.timedelta64(90, 'D'),
+        'Period of Performance End Date': advance_dates + np.timedelta64(180, 'D'),
         'Status': ['Active'] * 5 + ['Inactive'] * 5,
         'Advance Status': ['Open'] * 7 + ['Closed'] * 3,
         'ALD Status': ['On Time'] * 8 + ['Late'] * 2,
@@ -59,19 +81,15 @@ def create_test_data():
     
     cy_df = pd.DataFrame(cy_data)
     cy_file = test_dir / "WMD FY25 Q2 Advance Analysis.xlsx"
-    cy_df.to_excel(cy_file, index=False, sheet_name='Advance Data')
-    logger.info(f"Created CY test file: {cy_file}")
     
     # Prior Year (PY) data - similar structure but different values
     py_data = cy_data.copy()
-    py_data['Advance/Prepayment'] = [x * 0.9 for x in cy_data['Advance/Prepayment']]
+    py_data['Advance/Prepayment'] = np.asarray(cy_data['Advance/Prepayment']) * 0.9
     py_data['Status'] = ['Active'] * 4 + ['Inactive'] * 6
     py_data['Advance Status'] = ['Open'] * 6 + ['Closed'] * 4
     
     py_df = pd.DataFrame(py_data)
     py_file = test_dir / "WMD FY24 Q2 Advance Analysis.xlsx"
-    py_df.to_excel(py_file, index=False, sheet_name='Advance Data')
-    logger.info(f"Created PY test file: {py_file}")
     
     # DHSTIER Current Year Trial Balance
     cy_tb_data = {
@@ -84,17 +102,29 @@ def create_test_data():
     
     cy_tb_df = pd.DataFrame(cy_tb_data)
     cy_tb_file = test_dir / "WMD_FY25_Q2_DHSTIER.xlsx"
-    cy_tb_df.to_excel(cy_tb_file, index=False, sheet_name='Trial Balance')
-    logger.info(f"Created CY DHSTIER file: {cy_tb_file}")
     
     # DHSTIER Prior Year Trial Balance
     py_tb_data = cy_tb_data.copy()
-    py_tb_data['Debit'] = [x * 0.95 for x in cy_tb_data['Debit']]
+    py_tb_data['Debit'] = np.asarray(cy_tb_data['Debit']) * 0.95
     
     py_tb_df = pd.DataFrame(py_tb_data)
     py_tb_file = test_dir / "WMD_FY24_Q2_DHSTIER.xlsx"
-    py_tb_df.to_excel(py_tb_file, index=False, sheet_name='Trial Balance')
-    logger.info(f"Created PY DHSTIER file: {py_tb_file}")
+    
+    # Write the four files concurrently; zip compression releases the GIL
+    fixtures = [
+        ("CY test file", cy_df, cy_file, 'Advance Data'),
+        ("PY test file", py_df, py_file, 'Advance Data'),
+        ("CY DHSTIER file", cy_tb_df, cy_tb_file, 'Trial Balance'),
+        ("PY DHSTIER file", py_tb_df, py_tb_file, 'Trial Balance'),
+    ]
+    with ThreadPoolExecutor(max_workers=len(fixtures)) as executor:
+        futures = [
+            executor.submit(write_excel_sheet, df, path, sheet_name)
+            for _, df, path, sheet_name in fixtures
+        ]
+        for (label, _, path, _), future in zip(fixtures, futures):
+            future.result()
+            logger.info(f"Created {label}: {path}")
     
     return {
         'cy_file': str(cy_file),
@@ -104,6 +134,34 @@ def create_test_data():
         'test_dir': str(test_dir)
     }
 
+def measure_processing_memory(test_files, component, cy_fy_qtr):
+    """
+    Run the processing again under tracemalloc and return the peak bytes allocated.
+    
+    Tracing slows every allocation, so this is kept out of the main processing
+    run and writes to its own scratch folder.
+    """
+    import shutil
+    import tracemalloc
+    from src.advance_analysis.core.data_processing_complete import process_complete_advance_analysis
+    
+    output_folder = tempfile.mkdtemp(prefix="aa_test_memory_", dir=fast_tmpdir())
+    tracemalloc.start()
+    try:
+        process_complete_advance_analysis(
+            advance_file_path=test_files['cy_file'],
+            current_dhstier_path=test_files['cy_tb_file'],
+            prior_dhstier_path=test_files['py_tb_file'],
+            component=component,
+            cy_fy_qtr=cy_fy_qtr,
+            output_folder=output_folder
+        )
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        shutil.rmtree(output_folder, ignore_errors=True)
+    return peak_bytes
+
 def test_full_processing():
     """Test the complete advance analysis processing workflow."""
     print("="*80)
@@ -123,10 +181,9 @@ def test_full_processing():
         component = "WMD"
         cy_fy_qtr = "FY25 Q2"
         py_fy_qtr = "FY24 Q2"
-        output_folder = str(Path(__file__).parent / "test_outputs")
-        
-        # Create output folder
-        Path(output_folder).mkdir(exist_ok=True)
+        # A fresh folder per run, so concurrent runs don't collide and files
+        # left by an earlier run aren't listed as this run's output
+        output_folder = tempfile.mkdtemp(prefix="aa_test_outputs_", dir=fast_tmpdir())
         
         print(f"\nTest Configuration:")
         print(f"  Component: {component}")
@@ -138,6 +195,10 @@ def test_full_processing():
         print("\nStarting complete advance analysis processing...")
         
         try:
+            # Imported here so loading this module stays cheap; the processing
+            # pipeline pulls in pandas, numpy and openpyxl
+            from src.advance_analysis.core.data_processing_complete import process_complete_advance_analysis
+            
             cy_df, py_df, merged_df = process_complete_advance_analysis(
                 advance_file_path=test_files['cy_file'],
                 current_dhstier_path=test_files['cy_tb_file'],
@@ -159,12 +220,12 @@ def test_full_processing():
             # Check output files
             print("\nChecking output files in folder...")
             output_files = []
-            for file in os.listdir(output_folder):
-                if file.endswith('.xlsx'):
-                    file_path = os.path.join(output_folder, file)
-                    file_size = os.path.getsize(file_path) / 1024  # KB
-                    print(f"  ✓ {file} ({file_size:.1f} KB)")
-                    output_files.append(file_path)
+            with os.scandir(output_folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.xlsx') and entry.is_file(follow_symlinks=False):
+                        file_size = entry.stat().st_size / 1024  # KB
+                        print(f"  ✓ {entry.name} ({file_size:.1f} KB)")
+                        output_files.append(entry.path)
             
             # Check for validation columns in merged dataframe
             print("\nValidation columns check:")
@@ -179,19 +240,42 @@ def test_full_processing():
             ]
             
             print(f"\nTotal columns in merged dataframe: {len(merged_df.columns)}")
+            merged_columns = frozenset(merged_df.columns)
             for col in validation_columns:
-                if col in merged_df.columns:
+                if col in merged_columns:
                     print(f"  ✓ {col}")
                 else:
                     print(f"  ✗ {col} (missing)")
+            missing_columns = [col for col in validation_columns if col not in merged_columns]
+            if missing_columns:
+                print(f"  Missing {len(missing_columns)} of {len(validation_columns)} validation columns")
             
             # Also check the output Excel file
             if output_files:
                 print(f"\nChecking first output file: {os.path.basename(output_files[0])}")
-                import pandas as pd
-                df = pd.read_excel(output_files[0], sheet_name='DO Tab 4 Review')
-                print(f"Columns in DO Tab 4 Review sheet: {len(df.columns)}")
-                print(f"Rows in DO Tab 4 Review sheet: {len(df)}")
+                # Only the sheet dimensions are needed, so stream the workbook
+                # rather than building a DataFrame from it
+                from openpyxl import load_workbook
+                wb = load_workbook(output_files[0], read_only=True, data_only=True)
+                try:
+                    ws = wb['DO Tab 4 Review']
+                    # Column count comes from the header row, ignoring trailing
+                    # empty cells that the sheet's recorded width may include
+                    headers = list(next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+                    while headers and headers[-1] is None:
+                        headers.pop()
+                    n_cols = len(headers)
+                    n_rows = ws.max_row - 1  # Exclude the header row
+                finally:
+                    wb.close()
+                print(f"Columns in DO Tab 4 Review sheet: {n_cols}")
+                print(f"Rows in DO Tab 4 Review sheet: {n_rows}")
+            
+            if os.environ.get(MEASURE_MEMORY_ENV_VAR) == "1":
+                peak_bytes = measure_processing_memory(test_files, component, cy_fy_qtr)
+                # Reported for comparison between runs; it varies by machine, so it
+                # is not a pass/fail check
+                print(f"\nPeak memory allocated during processing: {peak_bytes / (1024 * 1024):.1f} MB")
             
             return True
                 
@@ -217,16 +301,22 @@ def test_full_processing():
                 shutil.rmtree(test_dir)
                 print("Test data cleaned up")
             
-            # Keep output files for inspection
-            print(f"Output files preserved in: {output_folder}")
-            print("\nTo clean up output files, run:")
-            print(f"  rm -rf {output_folder}")
+            # Output may sit in RAM-backed /dev/shm, so only keep it on request
+            if os.environ.get(KEEP_OUTPUT_ENV_VAR) == "1":
+                print(f"Output files preserved in: {output_folder}")
+                print("\nTo clean up output files, run:")
+                print(f"  rm -rf {output_folder}")
+            elif os.path.exists(output_folder):
+                shutil.rmtree(output_folder)
+                print("Output files cleaned up")
+                print(f"Set {KEEP_OUTPUT_ENV_VAR}=1 to keep them for inspection")
             
         except Exception as e:
             print(f"Cleanup warning: {e}")
 
 def main():
     """Main test entry point."""
+    setup_logging(log_level="INFO")
     print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Python version: {sys.version}")
     print(f"Working directory: {os.getcwd()}")
@@ -5,22 +5,31 @@ Simple test to validate the import fixes in excel_handler.py
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+EXCEL_HANDLER_PATH = Path(__file__).parent / "src" / "advance_analysis" / "modules" / "excel_handler.py"
+
+@lru_cache(maxsize=None)
+def read_excel_handler():
+    """Return the excel_handler.py source as bytes, read once and shared by every test (None if missing)."""
+    try:
+        # Searched as raw bytes; the checks only look for ASCII literals, so decoding is wasted work
+        return EXCEL_HANDLER_PATH.read_bytes()
+    except FileNotFoundError:
+        return None
+
 def test_time_import_in_file():
     """Test that time import is present in the excel_handler.py file."""
     print("Testing time import in excel_handler.py...")
     
-    excel_handler_path = Path(__file__).parent / "src" / "advance_analysis" / "modules" / "excel_handler.py"
-    
-    if not excel_handler_path.exists():
-        print(f"✗ File not found: {excel_handler_path}")
+    content = read_excel_handler()
+    if content is None:
+        print(f"✗ File not found: {EXCEL_HANDLER_PATH}")
         return False
     
-    content = excel_handler_path.read_text()
-    
     # Check for time import
-    if "import time" in content:
+    if b"import time" in content:
         print("✓ Time import found in excel_handler.py")
         return True
     else:
@@ -31,14 +40,11 @@ def test_workbook_validation_in_file():
     """Test that workbook validation is present in the excel_handler.py file."""
     print("Testing workbook validation in excel_handler.py...")
     
-    excel_handler_path = Path(__file__).parent / "src" / "advance_analysis" / "modules" / "excel_handler.py"
-    
-    if not excel_handler_path.exists():
-        print(f"✗ File not found: {excel_handler_path}")
+    content = read_excel_handler()
+    if content is None:
+        print(f"✗ File not found: {EXCEL_HANDLER_PATH}")
         return False
     
-    content = excel_handler_path.read_text()
-    
     # Check for enhanced error handling
     validation_patterns = [
         "Failed to open input workbook",
@@ -47,10 +53,7 @@ def test_workbook_validation_in_file():
         "Cannot open output workbook"
     ]
     
-    found_patterns = 0
-    for pattern in validation_patterns:
-        if pattern in content:
-            found_patterns += 1
+    found_patterns = sum(pattern.encode("utf-8") in content for pattern in validation_patterns)
     
     if found_patterns >= 2:  # At least some validation patterns found
         print(f"✓ Workbook validation found ({found_patterns}/{len(validation_patterns)} patterns)")
@@ -63,14 +66,11 @@ def test_error_logging_enhancement():
     """Test that enhanced error logging is present."""
     print("Testing enhanced error logging...")
     
-    excel_handler_path = Path(__file__).parent / "src" / "advance_analysis" / "modules" / "excel_handler.py"
-    
-    if not excel_handler_path.exists():
-        print(f"✗ File not found: {excel_handler_path}")
+    content = read_excel_handler()
+    if content is None:
+        print(f"✗ File not found: {EXCEL_HANDLER_PATH}")
         return False
     
-    content = excel_handler_path.read_text()
-    
     # Check for enhanced logging patterns
     logging_patterns = [
         "Opening output workbook:",
@@ -79,10 +79,7 @@ def test_error_logging_enhancement():
         "logger.error"
     ]
     
-    found_patterns = 0
-    for pattern in logging_patterns:
-        if pattern in content:
-            found_patterns += 1
+    found_patterns = sum(pattern.encode("utf-8") in content for pattern in logging_patterns)
     
     if found_patterns >= 3:
         print(f"✓ Enhanced error logging found ({found_patterns}/{len(logging_patterns)} patterns)")
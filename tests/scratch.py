@@ -0,0 +1,18 @@
+"""Scratch-directory helpers shared by the test scripts."""
+
+import os
+import tempfile
+
+# Environment variable that overrides the base directory for test scratch files
+TEST_TMPDIR_ENV_VAR = "ADVANCE_ANALYSIS_TEST_TMPDIR"
+
+
+def fast_tmpdir():
+    """
+    Base directory for test scratch files: the override variable if set, then
+    RAM-backed /dev/shm where available, else the system temp directory.
+    """
+    for candidate in (os.environ.get(TEST_TMPDIR_ENV_VAR), "/dev/shm"):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return tempfile.gettempdir()
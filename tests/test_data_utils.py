@@ -0,0 +1,63 @@
+"""Tests for advance_analysis.utils.data_utils."""
+
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from advance_analysis.utils.data_utils import (
+    OTHER_IDENTIFIER_COLUMN,
+    amounts_match,
+    build_do_concatenate_vector,
+    create_comparative_do_concatenate,
+)
+
+
+@pytest.mark.unit
+class TestAmountsMatch:
+    """amounts_match compares absolute amounts with a sub-cent tolerance."""
+
+    def test_equal_amounts_match(self):
+        assert amounts_match(100.00, 100.00)
+
+    def test_one_cent_gap_is_a_mismatch(self):
+        assert not amounts_match(100.00, 100.01)
+
+    def test_sub_cent_difference_matches(self):
+        assert amounts_match(100.004, 100.006)
+
+    def test_sign_is_ignored(self):
+        assert amounts_match(-382473060.07, 382473060.07)
+
+    def test_mixed_numeric_types(self):
+        assert amounts_match(Decimal("1234.56"), "1234.56")
+        assert not amounts_match(Decimal("1234.56"), 1234.57)
+
+
+@pytest.mark.unit
+class TestBuildDoConcatenateVector:
+    """build_do_concatenate_vector matches the row-wise comparative rules."""
+
+    BALANCE_COLUMN = 'Current FY Quarter-End  balance UDO'
+
+    @pytest.fixture
+    def comparative_df(self):
+        return pd.DataFrame({
+            'TAS': ['070-0100', ' 070-0200 ', None, '070-0400', '070-0500'],
+            'DHS Doc No': ['D1', 'D2', 'D3', None, 'D5'],
+            OTHER_IDENTIFIER_COLUMN: ['X-1', '', None, '  ', None],
+            'PONO': [None, 'P2', None, 'P4', ''],
+            'Line Item': ['L1', None, 'L3', 'L4', None],
+            self.BALANCE_COLUMN: ['1,234.50', '0', None, '12.345', 'abc'],
+        })
+
+    @pytest.mark.parametrize("component", ["WMD", "CBP"])
+    def test_matches_row_wise(self, comparative_df, component):
+        keyword_columns = ['PONO', 'Line Item']
+        expected = comparative_df.apply(
+            lambda row: create_comparative_do_concatenate(row, component, keyword_columns), axis=1
+        ).tolist()
+
+        result = build_do_concatenate_vector(comparative_df, component, keyword_columns, self.BALANCE_COLUMN)
+
+        assert list(result) == expected
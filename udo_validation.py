@@ -7,14 +7,116 @@ including workbook sheet manipulation, formula creation, and data comparison.
 import win32com.client
 from decimal import Decimal, InvalidOperation
 import logging
+import re
+from contextlib import contextmanager
+import functools
+from functools import lru_cache
 from typing import Optional, Any, Dict, List, Tuple, Callable, Union
 import traceback
 
+import numpy as np
+
 from ..utils.helpers import format_currency, format_excel_style
+from ..utils.data_utils import amounts_match
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Currency text cleanup: drop '$' and thousands separators, and turn
+# accounting-style parentheses into a leading minus
+_CURRENCY_TEXT_TRANS = str.maketrans({"$": "", ",": "", "(": "-", ")": ""})
+
+# Anything that cannot be part of a plain decimal number
+_NON_NUMERIC_RE = re.compile(r"[^\d.\-]")
+
+# The range argument of a =SUM(...) formula
+_SUM_RANGE_RE = re.compile(r"SUM\((.*?)\)")
+
+# The comparisons format and clean the same handful of amounts repeatedly.
+# typed=True keeps 1, 1.0, True and Decimal('1') apart, since they format differently
+format_currency = lru_cache(maxsize=1024, typed=True)(format_currency)
+
+# Excel type library (Microsoft Excel 16.0 Object Library). Generating the
+# gencache wrappers lets every Cells/Value/Font access go through compiled
+# early-bound dispatch instead of a late-bound IDispatch name lookup, and it is
+# also what populates win32com.client.constants with the xl* values.
+EXCEL_TYPELIB = ('{00020813-0000-0000-C000-000000000046}', 0, 1, 9)
+
+try:
+    win32com.client.gencache.EnsureModule(*EXCEL_TYPELIB)
+except Exception as typelib_error:
+    logger.debug("Excel type library not available for early binding: %s", typelib_error)
+
+
+def _xl_constant(name: str, default: int) -> int:
+    """
+    Look up an Excel constant generated by makepy, with a fallback value.
+    
+    Args:
+        name: Constant name (e.g., 'xlCenter')
+        default: Value to use when early-bound constants are not loaded
+        
+    Returns:
+        The constant value
+    """
+    return getattr(win32com.client.constants, name, default)
+
+
+# Excel constants, resolved once. Each win32com.client.constants attribute is
+# a lookup through the generated typelib modules, and the formatting helpers
+# below use these on every cell they touch.
+XL_BY_ROWS = _xl_constant('xlByRows', 1)
+XL_CALCULATION_MANUAL = _xl_constant('xlCalculationManual', -4135)
+XL_CENTER = _xl_constant('xlCenter', -4108)
+XL_CONTINUOUS = _xl_constant('xlContinuous', 1)
+XL_DOUBLE = _xl_constant('xlDouble', -4119)
+XL_EDGE_BOTTOM = _xl_constant('xlEdgeBottom', 9)
+XL_EDGE_TOP = _xl_constant('xlEdgeTop', 8)
+XL_LEFT = _xl_constant('xlLeft', -4131)
+XL_NEXT = _xl_constant('xlNext', 1)
+XL_PART = _xl_constant('xlPart', 2)
+XL_VALUES = _xl_constant('xlValues', -4163)
+XL_WHOLE = _xl_constant('xlWhole', 1)
+
+
+def ensure_early_bound(com_object):
+    """
+    Return an early-bound (gencache) wrapper for a COM object.
+    
+    Args:
+        com_object: Excel COM object, late- or early-bound
+        
+    Returns:
+        The early-bound wrapper, or the original object if it cannot be made
+    """
+    if getattr(com_object, "CLSID", None):
+        return com_object
+    try:
+        return win32com.client.gencache.EnsureDispatch(com_object)
+    except Exception as e:
+        logger.debug("Falling back to late binding: %s", e)
+        return com_object
+
+
+class LazyComValue:
+    """
+    Log argument that reads a COM property only when the message is formatted.
+    
+    logging applies %-formatting only for records a handler accepts, so a
+    property such as cell.Address passed through this costs no COM call when
+    the level is disabled.
+    """
+    __slots__ = ("_read",)
+
+    def __init__(self, read: Callable[[], Any]):
+        self._read = read
+
+    def __str__(self) -> str:
+        try:
+            return str(self._read())
+        except Exception as e:
+            return f"<unavailable: {e}>"
+
 
 # Error handling wrapper function with improved debugging
 def safe_excel_operation(func: Callable) -> Callable:
@@ -29,28 +131,100 @@ def safe_excel_operation(func: Callable) -> Callable:
     """
     def wrapper(*args, **kwargs):
         try:
-            logger.debug(f"Starting {func.__name__}")
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("Starting %s", func.__name__)
             result = func(*args, **kwargs)
-            logger.debug(f"Completed {func.__name__}")
+            if debug_enabled:
+                logger.debug("Completed %s", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            logger.error(f"Stack trace: {traceback.format_exc()}")
+            logger.error("Error in %s: %s", func.__name__, e)
+            # The exception is re-raised, so every decorated caller would log
+            # the same stack again; keep the full trace for DEBUG runs
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stack trace: %s", traceback.format_exc())
             # Re-raise to allow higher-level error handling
             raise
     return wrapper
 
 
-@safe_excel_operation
-def get_column_letter(column_number: int) -> str:
+# How many excel_fast blocks are currently open; only the outermost one
+# touches the application settings
+_excel_fast_depth = 0
+
+
+@contextmanager
+def excel_fast(excel_app):
     """
-    Convert a column number to Excel column letter.
+    Suspend screen updating, recalculation, events and alerts for a batch of edits.
+    
+    Every write made while these are on triggers a repaint and, with automatic
+    calculation, a recalculation of the dependent formulas. The previous
+    settings are restored on exit, even if the batch fails. Nested blocks
+    leave the settings to the outermost one.
+    
+    Args:
+        excel_app: Excel Application object
+    """
+    global _excel_fast_depth
+    if _excel_fast_depth:
+        _excel_fast_depth += 1
+        try:
+            yield excel_app
+        finally:
+            _excel_fast_depth -= 1
+        return
+    
+    previous = (excel_app.ScreenUpdating, excel_app.Calculation,
+                excel_app.EnableEvents, excel_app.DisplayAlerts)
+    excel_app.ScreenUpdating = False
+    excel_app.Calculation = XL_CALCULATION_MANUAL
+    excel_app.EnableEvents = False
+    excel_app.DisplayAlerts = False
+    _excel_fast_depth = 1
+    try:
+        yield excel_app
+    finally:
+        _excel_fast_depth = 0
+        try:
+            (excel_app.ScreenUpdating, excel_app.Calculation,
+             excel_app.EnableEvents, excel_app.DisplayAlerts) = previous
+        except Exception as e:
+            logger.warning("Error restoring Excel application settings: %s", e)
+
+
+def excel_fast_operation(func: Callable) -> Callable:
+    """
+    Decorator running a workbook or sheet operation inside excel_fast.
+    
+    The Application is taken from the first argument (a workbook or a
+    worksheet). Inside an open excel_fast block the call goes straight through.
+    
+    Args:
+        func: The function to decorate.
+        
+    Returns:
+        The decorated function.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _excel_fast_depth:
+            return func(*args, **kwargs)
+        with excel_fast(args[0].Application):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _compute_column_letter(column_number: int) -> str:
+    """
+    Convert a column number to Excel column letter arithmetically.
     
     Args:
         column_number (int): The column number (1-based).
         
     Returns:
-        str: The corresponding Excel column letter (A, B, C, ..., Z, AA, AB, ...)
+        str: The corresponding Excel column letter
     """
     dividend = column_number
     column_letter = ''
@@ -61,7 +235,121 @@ def get_column_letter(column_number: int) -> str:
     return column_letter
 
 
-@safe_excel_operation
+# Number of columns in an Excel worksheet (A through XFD)
+MAX_EXCEL_COLUMNS = 16384
+
+# Every column letter a worksheet can have, and the reverse mapping
+_COLUMN_LETTERS = tuple(_compute_column_letter(i) for i in range(1, MAX_EXCEL_COLUMNS + 1))
+_COLUMN_NUMBERS = {letter: number for number, letter in enumerate(_COLUMN_LETTERS, start=1)}
+
+
+def get_column_letter(column_number: int) -> str:
+    """
+    Convert a column number to Excel column letter.
+    
+    Args:
+        column_number (int): The column number (1-based).
+        
+    Returns:
+        str: The corresponding Excel column letter (A, B, C, ..., Z, AA, AB, ...)
+    """
+    if 1 <= column_number <= MAX_EXCEL_COLUMNS:
+        return _COLUMN_LETTERS[column_number - 1]
+    return _compute_column_letter(column_number)
+
+
+def get_column_number(column_letter: str) -> int:
+    """
+    Convert an Excel column letter to its column number.
+    
+    Args:
+        column_letter (str): The column letter (A, B, ..., Z, AA, ...)
+        
+    Returns:
+        int: The corresponding column number (1-based)
+    """
+    column_letter = column_letter.upper()
+    column_number = _COLUMN_NUMBERS.get(column_letter)
+    if column_number is not None:
+        return column_number
+    column_number = 0
+    for char in column_letter:
+        column_number = column_number * 26 + ord(char) - 64
+    return column_number
+
+
+def read_column_values(sheet, column: str, first_row: int, last_row: int) -> List[Any]:
+    """
+    Reads a block of cells from one column with a single COM call.
+    
+    Args:
+        sheet: Excel worksheet object
+        column (str): Column letter
+        first_row (int): First row to read
+        last_row (int): Last row to read (inclusive)
+    
+    Returns:
+        List[Any]: The Value2 of each cell, in row order
+    """
+    values = sheet.Range(f"{column}{first_row}:{column}{last_row}").Value2
+    # A single-cell range comes back as a scalar rather than a tuple of rows
+    if not isinstance(values, tuple):
+        return [values]
+    return [row[0] for row in values]
+
+
+def build_range_addresses(column: str, rows: List[int], max_length: int = 255) -> List[str]:
+    """
+    Builds multi-area range addresses covering the given rows of one column.
+    
+    Consecutive rows are merged into a single area (e.g. 'D5:D9'). Range()
+    rejects addresses longer than 255 characters, so the areas are split
+    across as many addresses as needed.
+    
+    Args:
+        column (str): Column letter
+        rows (List[int]): Row numbers in ascending order
+        max_length (int): Maximum length of one address string
+    
+    Returns:
+        List[str]: Addresses such as 'D5:D9,D12'
+    """
+    areas = []
+    first = previous = rows[0]
+    for row in rows[1:] + [None]:
+        if row is not None and row == previous + 1:
+            previous = row
+            continue
+        areas.append(f"{column}{first}" if first == previous else f"{column}{first}:{column}{previous}")
+        if row is not None:
+            first = previous = row
+    return join_range_areas(areas, max_length)
+
+
+def join_range_areas(areas: List[str], max_length: int = 255) -> List[str]:
+    """
+    Joins range areas into comma-separated addresses no longer than max_length.
+    
+    Args:
+        areas (List[str]): Areas such as 'D5:D9' or 'I12'
+        max_length (int): Maximum length of one address string
+    
+    Returns:
+        List[str]: Multi-area addresses accepted by Range()
+    """
+    addresses = []
+    current = ""
+    for area in areas:
+        if current and len(current) + 1 + len(area) > max_length:
+            addresses.append(current)
+            current = area
+        else:
+            current = f"{current},{area}" if current else area
+    if current:
+        addresses.append(current)
+    return addresses
+
+
 def find_cell_in_column(sheet, column: str, search_text: str) -> Optional[Any]:
     """
     Finds a cell in a specific column that contains the given text.
@@ -75,32 +363,84 @@ def find_cell_in_column(sheet, column: str, search_text: str) -> Optional[Any]:
         Excel cell object or None if not found
     """
     try:
-        logger.debug(f"Searching for text '{search_text}' in column {column}")
-        search_count = 0
-        max_search = 1000  # Set a reasonable limit
-        
-        for cell in sheet.Range(f"{column}:{column}"):
-            search_count += 1
-            if search_count > max_search:
-                logger.warning(f"Search limit reached ({max_search} cells) when looking for '{search_text}'")
-                break
-                
-            try:
-                if cell.Value and search_text in str(cell.Value):
-                    logger.debug(f"Found '{search_text}' at {cell.Address}")
-                    return cell
-            except Exception as cell_e:
-                logger.warning(f"Error checking cell in find_cell_in_column: {cell_e}")
-                continue
-                
-        logger.debug(f"'{search_text}' not found in column {column} after checking {search_count} cells")
-        return None
+        logger.debug("Searching for text '%s' in column %s", search_text, column)
+        # Range.Find runs inside Excel, so the search costs one COM call no
+        # matter how far down the column the text is. Starting after the last
+        # cell makes the search wrap round to row 1 first.
+        found_cell = sheet.Range(f"{column}:{column}").Find(
+            What=search_text,
+            After=sheet.Cells(sheet.Rows.Count, column),
+            LookIn=XL_VALUES,
+            LookAt=XL_PART,
+            SearchOrder=XL_BY_ROWS,
+            MatchCase=False
+        )
+        if found_cell is None:
+            # Find with LookIn=xlValues skips hidden rows, so labels in a
+            # collapsed section are only found by scanning the column's values
+            for row, value in enumerate(get_cached_column_values(sheet, column), start=1):
+                if value and search_text in str(value):
+                    found_cell = sheet.Cells(row, column)
+                    break
+            else:
+                logger.debug("'%s' not found in column %s", search_text, column)
+                return None
+        logger.debug("Found '%s' at %s", search_text, LazyComValue(lambda: found_cell.Address))
+        return found_cell
     except Exception as e:
-        logger.error(f"Error finding '{search_text}' in column {column}: {str(e)}")
+        logger.error("Error finding '%s' in column %s: %s", search_text, column, e)
         return None
 
 
-@safe_excel_operation
+# Values of whole columns already read by get_last_populated_row, keyed by
+# (workbook full name, sheet name, column letter). TB sheet names are the same
+# in every workbook, so the workbook is part of the key. Anything that writes
+# into a cached column must call invalidate_column_cache.
+_col_values_cache: Dict[Tuple[str, str, str], List[Any]] = {}
+
+
+def _sheet_cache_key(sheet) -> Tuple[str, str]:
+    """Identifies a worksheet across workbooks for _col_values_cache."""
+    return sheet.Parent.FullName, sheet.Name
+
+
+def invalidate_column_cache(sheet=None, column: Optional[str] = None) -> None:
+    """
+    Drops cached column values after the module writes into a column.
+    
+    Args:
+        sheet: Excel worksheet object, or None to clear every sheet
+        column (str, optional): Column letter, or None for every column of the sheet
+    """
+    if sheet is None:
+        _col_values_cache.clear()
+        return
+    sheet_key = _sheet_cache_key(sheet)
+    for key in [k for k in _col_values_cache if k[:2] == sheet_key and (column is None or k[2] == column)]:
+        del _col_values_cache[key]
+
+
+def get_cached_column_values(sheet, column: str) -> List[Any]:
+    """
+    Returns the values of the used part of a column, reading it at most once.
+    
+    Args:
+        sheet: Excel worksheet object
+        column (str): Column letter
+    
+    Returns:
+        List[Any]: The Value2 of each cell from row 1 to the last used row
+    """
+    key = (*_sheet_cache_key(sheet), column)
+    values = _col_values_cache.get(key)
+    if values is None:
+        used_range = sheet.UsedRange
+        last_used_row = used_range.Row + used_range.Rows.Count - 1
+        values = read_column_values(sheet, column, 1, last_used_row)
+        _col_values_cache[key] = values
+    return values
+
+
 def get_last_populated_row(sheet, start_row: int, column: str) -> int:
     """
     Finds the last populated row in a specific column starting from a given row.
@@ -114,14 +454,87 @@ def get_last_populated_row(sheet, start_row: int, column: str) -> int:
         int: Row number of the last populated cell
     """
     try:
-        last_cell = sheet.Cells(sheet.Rows.Count, column).End(win32com.client.constants.xlUp)
-        return max(last_cell.Row, start_row)
+        values = get_cached_column_values(sheet, column)
+        
+        for row in range(len(values), start_row, -1):
+            if values[row - 1] not in (None, ""):
+                return row
+        return start_row
     except Exception as e:
-        logger.error(f"Error finding last populated row in column {column}: {str(e)}")
+        logger.error("Error finding last populated row in column %s: %s", column, e)
         return start_row
 
 
-@safe_excel_operation
+# Named workbook styles for the cells this module formats. Applying a style is
+# a single COM call, where setting the same properties one by one costs 5-8.
+SUM_CELL_STYLE = "AdvanceAnalysis_Sum"
+FORMULA_CELL_STYLE = "AdvanceAnalysis_Formula"
+
+
+def _apply_sum_cell_format(target) -> None:
+    """
+    Sets the sum cell formatting on a cell or on a Style object.
+    
+    Args:
+        target: Excel cell (Range) or Style object
+    """
+    font = target.Font
+    font.Name = "Calibri"
+    font.Size = 11
+    font.Color = 255  # Red
+    font.Bold = True
+    target.HorizontalAlignment = XL_CENTER
+    target.NumberFormat = "#,##0.00_);[Red](#,##0.00)"
+    target.Borders(XL_EDGE_TOP).LineStyle = XL_CONTINUOUS
+    target.Borders(XL_EDGE_BOTTOM).LineStyle = XL_DOUBLE
+
+
+def _apply_formula_cell_format(target) -> None:
+    """
+    Sets the tickmark formula formatting on a cell or on a Style object.
+    
+    Args:
+        target: Excel cell (Range) or Style object
+    """
+    font = target.Font
+    font.Name = "Wingdings"
+    font.Size = 11
+    font.Bold = False
+    target.HorizontalAlignment = XL_CENTER
+    target.VerticalAlignment = XL_CENTER
+
+
+def register_cell_styles(workbook) -> None:
+    """
+    Adds (or refreshes) the named styles used by format_sum_cell and format_formula_cell.
+    
+    The styles only carry the attributes the helpers set, so applying them
+    leaves a cell's fill and protection alone.
+    
+    Args:
+        workbook: Excel workbook object
+    """
+    style_definitions = [
+        (SUM_CELL_STYLE, _apply_sum_cell_format, True),
+        (FORMULA_CELL_STYLE, _apply_formula_cell_format, False),
+    ]
+    for style_name, apply_format, has_number_and_border in style_definitions:
+        try:
+            try:
+                style = workbook.Styles(style_name)
+            except Exception:
+                style = workbook.Styles.Add(style_name)
+            style.IncludeFont = True
+            style.IncludeAlignment = True
+            style.IncludeNumber = has_number_and_border
+            style.IncludeBorder = has_number_and_border
+            style.IncludePatterns = False
+            style.IncludeProtection = False
+            apply_format(style)
+        except Exception as e:
+            logger.warning("Could not register cell style '%s': %s", style_name, e)
+
+
 def format_sum_cell(cell) -> None:
     """
     Formats the sum cell according to specifications.
@@ -130,19 +543,15 @@ def format_sum_cell(cell) -> None:
         cell: Excel cell object to format
     """
     try:
-        cell.Font.Name = "Calibri"
-        cell.Font.Size = 11
-        cell.Font.Color = 255  # Red
-        cell.Font.Bold = True
-        cell.HorizontalAlignment = win32com.client.constants.xlCenter
-        cell.NumberFormat = "#,##0.00_);[Red](#,##0.00)"
-        cell.Borders(win32com.client.constants.xlEdgeTop).LineStyle = win32com.client.constants.xlContinuous
-        cell.Borders(win32com.client.constants.xlEdgeBottom).LineStyle = win32com.client.constants.xlDouble
+        try:
+            cell.Style = SUM_CELL_STYLE
+        except Exception:
+            # Style not registered on this workbook; set the properties directly
+            _apply_sum_cell_format(cell)
     except Exception as e:
-        logger.error(f"Error formatting sum cell: {str(e)}")
+        logger.error("Error formatting sum cell: %s", e)
 
 
-@safe_excel_operation
 def add_explanation_text(cell) -> None:
     """
     Adds 'See Explanations below:' text in the specified cell.
@@ -152,15 +561,16 @@ def add_explanation_text(cell) -> None:
     """
     try:
         cell.Value = "See Explanations below:"
-        cell.Font.Name = "Calibri"
-        cell.Font.Size = 11
-        cell.Font.Color = 255  # Red
-        cell.Font.Bold = True
+        font = cell.Font
+        font.Name = "Calibri"
+        font.Size = 11
+        font.Color = 255  # Red
+        font.Bold = True
         cell.WrapText = True
-        cell.HorizontalAlignment = win32com.client.constants.xlLeft
-        logger.info(f"Added 'See Explanations below:' to cell {cell.Address}")
+        cell.HorizontalAlignment = XL_LEFT
+        logger.info("Added 'See Explanations below:' to cell %s", LazyComValue(lambda: cell.Address))
     except Exception as e:
-        logger.error(f"Error adding explanation text: {str(e)}")
+        logger.error("Error adding explanation text: %s", e)
 
 
 @safe_excel_operation
@@ -176,20 +586,26 @@ def add_reasonable_explanations(udo_sheet, start_row: int, last_row: int, value_
         explanation_column (str): Column letter for explanations
     """
     try:
-        for row in range(start_row, last_row + 1):
-            value_cell = udo_sheet.Cells(row, udo_sheet.Columns(value_column).Column)
-            if value_cell.Value is not None and value_cell.Value != "":
-                explanation_cell = udo_sheet.Cells(row, udo_sheet.Columns(explanation_column).Column)
-                explanation_cell.Value = "Explanation Reasonable"
-                explanation_cell.Font.Name = "Calibri"
-                explanation_cell.Font.Size = 11
-                explanation_cell.Font.Color = 255  # Red
-                explanation_cell.Font.Bold = True
-                explanation_cell.WrapText = True
-                explanation_cell.HorizontalAlignment = win32com.client.constants.xlLeft
-                logger.info(f"Added 'Explanation Reasonable' to cell {explanation_cell.Address}")
+        values = read_column_values(udo_sheet, value_column, start_row, last_row)
+        rows = [row for row, value in enumerate(values, start=start_row) if value is not None and value != ""]
+        if not rows:
+            return
+        
+        # Every populated row gets the same text and formatting, so write them
+        # through multi-area ranges: a handful of COM calls instead of seven per row
+        for address in build_range_addresses(explanation_column, rows):
+            target = udo_sheet.Range(address)
+            target.Value = "Explanation Reasonable"
+            font = target.Font
+            font.Name = "Calibri"
+            font.Size = 11
+            font.Color = 255  # Red
+            font.Bold = True
+            target.WrapText = True
+            target.HorizontalAlignment = XL_LEFT
+            logger.info("Added 'Explanation Reasonable' to cells %s", address)
     except Exception as e:
-        logger.error(f"Error adding reasonable explanations: {str(e)}")
+        logger.error("Error adding reasonable explanations: %s", e)
         raise
 
 
@@ -212,52 +628,57 @@ def process_explanations(udo_sheet, explanations_cell, value_column: str, explan
         last_row_explanation = get_last_populated_row(udo_sheet, start_row, explanation_column)
         last_row = max(last_row_value, last_row_explanation)
 
-        logger.info(f"Processing explanations from row {start_row} to {last_row}")
-        logger.info(f"Adjustment value: {adjustment_value}")
-        logger.info(f"Explanation range: {explanation_column}{start_row}:{explanation_column}{last_row}")
+        logger.info("Processing explanations from row %s to %s", start_row, last_row)
+        logger.info("Adjustment value: %s", adjustment_value)
+        logger.info("Explanation range: %s%s:%s%s", explanation_column, start_row, explanation_column, last_row)
 
         # Calculate sum
-        sum_range = udo_sheet.Range(f"{value_column}{start_row}:{value_column}{last_row}")
+        # One Value2 read for the whole range; the Decimal conversion then runs
+        # in-process instead of costing a COM call per cell
+        values = read_column_values(udo_sheet, value_column, start_row, last_row)
         sum_value = Decimal('0')
-        for cell in sum_range:
+        for row, value in enumerate(values, start=start_row):
+            if value is None:
+                continue
             try:
-                cell_value = Decimal(str(cell.Value)) if cell.Value is not None else Decimal('0')
-                sum_value += cell_value
+                sum_value += Decimal(str(value))
             except InvalidOperation:
-                logger.warning(f"Invalid value in cell {cell.Address}: {cell.Value}")
+                logger.warning("Invalid value in cell $%s$%s: %s", value_column, row, value)
 
-        logger.info(f"Sum range: {value_column}{start_row}:{value_column}{last_row}")
-        logger.info(f"Calculated sum value: {sum_value}")
+        logger.info("Sum range: %s%s:%s%s", value_column, start_row, value_column, last_row)
+        logger.info("Calculated sum value: %s", sum_value)
 
         # Insert sum formula
-        sum_cell = udo_sheet.Cells(last_row + 2, udo_sheet.Columns(value_column).Column)
+        sum_cell = udo_sheet.Cells(last_row + 2, get_column_number(value_column))
         sum_cell.Formula = f"=SUM({value_column}{start_row}:{value_column}{last_row})"
+        invalidate_column_cache(udo_sheet, value_column)
         format_sum_cell(sum_cell)
-        logger.info(f"Sum formula inserted in cell: {sum_cell.Address}")
+        logger.info("Sum formula inserted in cell: %s", LazyComValue(lambda: sum_cell.Address))
 
         # Convert adjustment_value to Decimal
         try:
             adjustment_value = Decimal(str(adjustment_value))
-            logger.info(f"Converted adjustment value: {adjustment_value}")
+            logger.info("Converted adjustment value: %s", adjustment_value)
         except (InvalidOperation, TypeError):
-            logger.error(f"Invalid adjustment value: {adjustment_value}")
+            logger.error("Invalid adjustment value: %s", adjustment_value)
             return
 
         # Compare sum with adjustment value
         threshold = Decimal('0.01')
-        logger.info(f"Comparing sum ({sum_value}) with adjustment value ({adjustment_value})")
+        logger.info("Comparing sum (%s) with adjustment value (%s)", sum_value, adjustment_value)
         if abs(sum_value - adjustment_value) < threshold:
             logger.info("Sum matches adjustment value within threshold")
             
             # Add "Explanation Reasonable" for each row with a value
             add_reasonable_explanations(udo_sheet, start_row, last_row, value_column, explanation_column)
+            invalidate_column_cache(udo_sheet, explanation_column)
         else:
-            logger.warning(f"Sum ({sum_value}) does not match adjustment value ({adjustment_value})")
+            logger.warning("Sum (%s) does not match adjustment value (%s)", sum_value, adjustment_value)
 
         logger.info("Finished process_explanations function")
 
     except Exception as e:
-        logger.error(f"Error processing explanations: {str(e)}")
+        logger.error("Error processing explanations: %s", e)
         raise
 
 
@@ -271,29 +692,31 @@ def process_column_adjustments(udo_sheet) -> None:
     """
     try:
         for search_column, value_column, explanation_column in [('B', 'C', 'D'), ('G', 'H', 'I')]:
-            logger.info(f"Processing adjustments in column {search_column}")
+            logger.info("Processing adjustments in column %s", search_column)
+            value_col = get_column_number(value_column)
+            explanation_col = get_column_number(explanation_column)
             
             # Find "Adjustments" cell
             adjustments_cell = find_cell_in_column(udo_sheet, search_column, "Adjustments (please provide explanation below)")
             if not adjustments_cell:
-                logger.warning(f"'Adjustments' cell not found in column {search_column}")
+                logger.warning("'Adjustments' cell not found in column %s", search_column)
                 continue
 
             # Check if there's a value in the adjacent column
-            adjustment_value = udo_sheet.Cells(adjustments_cell.Row, udo_sheet.Columns(value_column).Column).Value
-            logger.info(f"Adjustment value cell: {value_column}{adjustments_cell.Row}")
-            logger.info(f"Raw adjustment value: {adjustment_value}")
+            adjustment_value = udo_sheet.Cells(adjustments_cell.Row, value_col).Value
+            logger.info("Adjustment value cell: %s%s", value_column, adjustments_cell.Row)
+            logger.info("Raw adjustment value: %s", adjustment_value)
 
             if adjustment_value is not None and adjustment_value != "":
                 # Add "See Explanations below:" in the explanation column
-                explanation_text_cell = udo_sheet.Cells(adjustments_cell.Row, udo_sheet.Columns(explanation_column).Column)
+                explanation_text_cell = udo_sheet.Cells(adjustments_cell.Row, explanation_col)
                 add_explanation_text(explanation_text_cell)
-                logger.info(f"'See Explanations below:' added to cell {explanation_text_cell.Address}")
+                logger.info("'See Explanations below:' added to cell %s", LazyComValue(lambda: explanation_text_cell.Address))
 
             # Find "Explanations of Adjustments" cell
             explanations_cell = find_cell_in_column(udo_sheet, search_column, "Explanations of Adjustments")
             if not explanations_cell:
-                logger.warning(f"'Explanations of Adjustments' cell not found in column {search_column}")
+                logger.warning("'Explanations of Adjustments' cell not found in column %s", search_column)
                 continue
 
             # Process explanations
@@ -302,7 +725,7 @@ def process_column_adjustments(udo_sheet) -> None:
             logger.info("Finished process_explanations function")
 
     except Exception as e:
-        logger.error(f"Error processing adjustments: {str(e)}")
+        logger.error("Error processing adjustments: %s", e)
         raise
 
 
@@ -319,30 +742,28 @@ def process_adjustments(udo_sheet) -> None:
         process_column_adjustments(udo_sheet)
         logger.info("Adjustments processing completed successfully")
     except Exception as e:
-        logger.error(f"Error processing adjustments: {str(e)}")
+        logger.error("Error processing adjustments: %s", e)
         raise
     
 
-@safe_excel_operation
 def format_formula_cell(cell) -> None:
     """
     Format a cell containing a formula.
     
     Args:
-        cell: Excel cell object to format
+        cell: Excel cell object (or multi-area range) to format
     """
     try:
-        cell.Font.Name = "Wingdings"
-        cell.Font.Size = 11
-        cell.Font.Bold = False
-        cell.HorizontalAlignment = win32com.client.constants.xlCenter
-        cell.VerticalAlignment = win32com.client.constants.xlCenter
+        try:
+            cell.Style = FORMULA_CELL_STYLE
+        except Exception:
+            # Style not registered on this workbook; set the properties directly
+            _apply_formula_cell_format(cell)
     except Exception as e:
-        logger.error(f"Error formatting formula cell at {cell.Address}: {str(e)}")
+        logger.error("Error formatting formula cell at %s: %s", cell.Address, e)
         raise
 
 
-@safe_excel_operation
 def log_formula_values(sheet, column: str, start_row: int, end_row: int, subtotal_row: int) -> None:
     """
     Log values used in a formula for debugging.
@@ -354,18 +775,21 @@ def log_formula_values(sheet, column: str, start_row: int, end_row: int, subtota
         end_row (int): End row number
         subtotal_row (int): Row number with the subtotal
     """
+    # Purely diagnostic: skip the reads when the INFO lines would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
-        sum_range = sheet.Range(f"{column}{start_row}:{column}{end_row}")
-        sum_value = sum(cell.Value or 0 for cell in sum_range)
-        subtotal_value = sheet.Cells(subtotal_row, sheet.Columns(column).Column).Value or 0
+        sum_values = read_column_values(sheet, column, start_row, end_row)
+        sum_value = float(np.array([value or 0 for value in sum_values], dtype=np.float64).sum())
+        subtotal_value = sheet.Cells(subtotal_row, get_column_number(column)).Value2 or 0
         formatted_sum_value = format_currency(sum_value)
         formatted_subtotal_value = format_currency(subtotal_value)
         
-        logger.info(f"Column {column} - Sum of range {column}{start_row}:{column}{end_row}: {formatted_sum_value}")
-        logger.info(f"Column {column} - Subtotal value at {column}{subtotal_row}: {formatted_subtotal_value}")
-        logger.info(f"Column {column} - Difference: {sum_value - subtotal_value}")
+        logger.info("Column %s - Sum of range %s%s:%s%s: %s", column, column, start_row, column, end_row, formatted_sum_value)
+        logger.info("Column %s - Subtotal value at %s%s: %s", column, column, subtotal_row, formatted_subtotal_value)
+        logger.info("Column %s - Difference: %s", column, sum_value - subtotal_value)
     except Exception as e:
-        logger.error(f"Error logging formula values for column {column}: {str(e)}")
+        logger.error("Error logging formula values for column %s: %s", column, e)
         raise
 
 
@@ -383,82 +807,111 @@ def validate_udo_tier_recon(excel_app, workbook, component: str, password: str,
         sum_udo_balance_col2 (int, optional): Column index of the second "Sum of UDO Balance" in Obligation Analysis
     """
     try:
-        logger.info(f"Starting UDO TIER reconciliation validation for {component}")
-        
-        # Find and unprotect the UDO TO TIER Recon SUMMARY sheet
-        udo_sheet = find_udo_tier_sheet(workbook)
-        udo_sheet.Unprotect(Password=password)
-        
-        # Add new columns
-        add_tickmark_columns(udo_sheet)
-        
-        # Find the '4801' row and perform validations for PY
-        start_row_py = find_start_row(udo_sheet, 1)
-        if start_row_py:
-            perform_validations(workbook, udo_sheet, start_row_py, component, is_current_year=False)
-            perform_additional_validations(udo_sheet, start_row_py, is_current_year=False)
-        
-        # Find the '4801' row and perform validations for CY
-        first_tickmark_column = 4  # Adjust if necessary
-        start_row_cy = find_start_row(udo_sheet, first_tickmark_column + 2)
-        if start_row_cy:
-            perform_validations(workbook, udo_sheet, start_row_cy, component, is_current_year=True)
-            perform_additional_validations(udo_sheet, start_row_cy, is_current_year=True)
+        logger.info("Starting UDO TIER reconciliation validation for %s", component)
         
-        # Now proceeding to the part where the issue might be occurring
-        logger.info("Starting PY Q4 Ending Balance comparison")
+        # Objects handed in by the caller may be late-bound; everything fetched
+        # through the early-bound workbook below inherits its wrappers
+        excel_app = ensure_early_bound(excel_app)
+        workbook = ensure_early_bound(workbook)
+        register_cell_styles(workbook)
         
-        # Perform PY Q4 Ending Balance comparison with detailed logging
-        try:
-            compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address, is_current_year=False, sum_udo_balance_col2=sum_udo_balance_col2)
-            logger.info("PY Q4 Ending Balance comparison completed")
-        except Exception as e:
-            logger.error(f"Error in PY Q4 Ending Balance comparison: {e}")
-            logger.error(traceback.format_exc())
+        with excel_fast(excel_app):
+            # Find and unprotect the UDO TO TIER Recon SUMMARY sheet
+            udo_sheet = find_udo_tier_sheet(workbook)
+            udo_sheet.Unprotect(Password=password)
+            
+            # Add new columns; this shifts every column after C, so nothing read
+            # by an earlier run can be trusted
+            add_tickmark_columns(udo_sheet)
+            invalidate_column_cache()
+            
+            # Find the '4801' row and perform validations for PY
+            start_row_py = find_start_row(udo_sheet, 1)
+            if start_row_py:
+                perform_validations(workbook, udo_sheet, start_row_py, component, is_current_year=False)
+                perform_additional_validations(udo_sheet, start_row_py, is_current_year=False)
+            
+            # Find the '4801' row and perform validations for CY
+            first_tickmark_column = 4  # Adjust if necessary
+            start_row_cy = find_start_row(udo_sheet, first_tickmark_column + 2)
+            if start_row_cy:
+                perform_validations(workbook, udo_sheet, start_row_cy, component, is_current_year=True)
+                perform_additional_validations(udo_sheet, start_row_cy, is_current_year=True)
+            
+            # Both comparisons look sheets up by name; enumerate them once
+            sheets_by_name = {sheet.Name: sheet for sheet in workbook.Sheets}
+            
+            # Tickmarks placed by the two comparisons are written together on exit
+            with batched_tickmarks():
+                # Now proceeding to the part where the issue might be occurring
+                logger.info("Starting PY Q4 Ending Balance comparison")
+                
+                # Perform PY Q4 Ending Balance comparison with detailed logging
+                try:
+                    compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address, is_current_year=False, sum_udo_balance_col2=sum_udo_balance_col2,
+                                                 sheets_by_name=sheets_by_name)
+                    logger.info("PY Q4 Ending Balance comparison completed")
+                except Exception as e:
+                    logger.error("Error in PY Q4 Ending Balance comparison: %s", e)
+                    logger.error(traceback.format_exc())
+                
+                # Perform CY Obligation Analysis Total comparison with detailed logging
+                logger.info("Starting CY Obligation Analysis Total comparison")
+                try:
+                    compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address, is_current_year=True, sum_udo_balance_col2=sum_udo_balance_col2,
+                                                 sheets_by_name=sheets_by_name)
+                    logger.info("CY Obligation Analysis Total comparison completed")
+                except Exception as e:
+                    logger.error("Error in CY Obligation Analysis Total comparison: %s", e)
+                    logger.error(traceback.format_exc())
+            
+            # Perform new UDO Detail Reconciled to TIER validation with detailed logging
+            logger.info("Starting UDO Detail Reconciliation")
+            try:
+                perform_udo_detail_reconciliation(udo_sheet)
+                logger.info("UDO Detail Reconciliation completed")
+            except Exception as e:
+                logger.error("Error in UDO Detail Reconciliation: %s", e)
+                logger.error(traceback.format_exc())
+
+            # Process adjustments with detailed logging
+            logger.info("Starting adjustment processing")
+            try:
+                process_adjustments(udo_sheet)
+                logger.info("Adjustment processing completed")
+            except Exception as e:
+                logger.error("Error in adjustment processing: %s", e)
+                logger.error(traceback.format_exc())
+            
+            # Calculation is manual inside excel_fast, so settle every formula
+            # written above in one pass before the sheet is locked again
+            try:
+                workbook.Application.CalculateFull()
+            except Exception as calc_error:
+                logger.warning("Error forcing calculation: %s", calc_error)
+            
+            # Protect the sheet again
+            try:
+                udo_sheet.Protect(Password=password)
+                logger.info("Sheet protected successfully")
+            except Exception as e:
+                logger.error("Error protecting sheet: %s", e)
             
-        # Perform CY Obligation Analysis Total comparison with detailed logging
-        logger.info("Starting CY Obligation Analysis Total comparison")
-        try:
-            compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address, is_current_year=True, sum_udo_balance_col2=sum_udo_balance_col2)
-            logger.info("CY Obligation Analysis Total comparison completed")
-        except Exception as e:
-            logger.error(f"Error in CY Obligation Analysis Total comparison: {e}")
-            logger.error(traceback.format_exc())
-        
-        # Perform new UDO Detail Reconciled to TIER validation with detailed logging
-        logger.info("Starting UDO Detail Reconciliation")
-        try:
-            perform_udo_detail_reconciliation(udo_sheet)
-            logger.info("UDO Detail Reconciliation completed")
-        except Exception as e:
-            logger.error(f"Error in UDO Detail Reconciliation: {e}")
-            logger.error(traceback.format_exc())
-
-        # Process adjustments with detailed logging
-        logger.info("Starting adjustment processing")
-        try:
-            process_adjustments(udo_sheet)
-            logger.info("Adjustment processing completed")
-        except Exception as e:
-            logger.error(f"Error in adjustment processing: {e}")
-            logger.error(traceback.format_exc())
-        
-        # Protect the sheet again
-        try:
-            udo_sheet.Protect(Password=password)
-            logger.info("Sheet protected successfully")
-        except Exception as e:
-            logger.error(f"Error protecting sheet: {e}")
-        
         logger.info("UDO TIER reconciliation validation completed successfully")
     except Exception as e:
-        logger.error(f"Error in UDO TIER reconciliation validation: {str(e)}")
+        logger.error("Error in UDO TIER reconciliation validation: %s", e)
         logger.error(traceback.format_exc())
         raise
+    finally:
+        # Columns read during this run describe this workbook as it was; don't
+        # let them outlive the run
+        invalidate_column_cache()
 
 
 @safe_excel_operation
-def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_current_year: bool = False, sum_udo_balance_col2: int = None) -> None:
+@excel_fast_operation
+def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_current_year: bool = False, sum_udo_balance_col2: int = None,
+                                 sheets_by_name: Optional[Dict[str, Any]] = None) -> None:
     """
     Compare PY Q4 Ending Balance values between sheets and add validation marks.
     
@@ -468,9 +921,13 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
         sum_cell_address (str): Address of the sum cell
         is_current_year (bool): Whether to use current year columns
         sum_udo_balance_col2 (int, optional): Column index of the second "Sum of UDO Balance" in Obligation Analysis
+        sheets_by_name (Dict[str, Any], optional): Worksheets keyed by name, built from workbook.Sheets if omitted
     """
     try:
-        logger.info(f"Starting comparison of PY Q4 Ending Balance (is_current_year={is_current_year})")
+        logger.info("Starting comparison of PY Q4 Ending Balance (is_current_year=%s)", is_current_year)
+        
+        if sheets_by_name is None:
+            sheets_by_name = {sheet.Name: sheet for sheet in workbook.Sheets}
         
         # Find "PY Q4 Ending Balance" using multiple strategies
         py_q4_cell = None
@@ -478,58 +935,57 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
         search_columns = [1, 2]  # Try both column A and column B
         max_search = 200  # Increase search limit
         
-        # Strategy 1: Search for any of the terms in specified columns
-        for column_idx in search_columns:
-            if py_q4_cell:
-                break
-                
-            for search_term in search_terms:
-                logger.debug(f"Searching for '{search_term}' in column {column_idx}")
-                search_count = 0
-                
-                for cell in udo_sheet.Columns(column_idx).Cells:
-                    search_count += 1
-                    if search_count > max_search:
-                        logger.warning(f"Search limit reached ({max_search} cells) when looking for '{search_term}'")
-                        break
-                        
+        # Strategy 1: Let Excel's Find search each column; one COM call per term
+        try:
+            for column_idx in search_columns:
+                for search_term in search_terms:
                     try:
-                        cell_value = str(cell.Value).strip() if cell.Value is not None else ""
-                        # Use case-insensitive comparison for more robust matching
-                        if search_term.lower() in cell_value.lower():
-                            py_q4_cell = cell
-                            logger.info(f"Found '{search_term}' at cell {cell.Address}")
+                        found_cell = udo_sheet.Columns(column_idx).Find(
+                            search_term,
+                            After=udo_sheet.Cells(udo_sheet.Rows.Count, column_idx),
+                            LookIn=XL_VALUES,
+                            LookAt=XL_PART,
+                            SearchDirection=XL_NEXT
+                        )
+                        if found_cell:
+                            py_q4_cell = found_cell
+                            logger.info("Found '%s' using Find method at %s", search_term, LazyComValue(lambda: found_cell.Address))
                             break
-                    except Exception as cell_error:
-                        logger.warning(f"Error checking cell value: {cell_error}")
+                    except Exception:
                         continue
-                
                 if py_q4_cell:
                     break
+        except Exception as find_error:
+            logger.error("Error using Find method: %s", find_error)
 
-        # Strategy 2: Try using Excel's Find function with different search options
+        # Strategy 2: Scan the top of each column in Python, in case Find
+        # failed or is unavailable on this sheet
         if not py_q4_cell:
-            logger.warning("Terms not found with direct search, trying Excel Find method")
-            try:
-                for column_idx in search_columns:
-                    for search_term in search_terms:
-                        try:
-                            # Try different LookAt and SearchDirection options
-                            found_cell = udo_sheet.Columns(column_idx).Find(
-                                search_term, 
-                                LookAt=win32com.client.constants.xlPart,
-                                SearchDirection=win32com.client.constants.xlNext
-                            )
-                            if found_cell:
-                                py_q4_cell = found_cell
-                                logger.info(f"Found '{search_term}' using Find method at {found_cell.Address}")
-                                break
-                        except Exception:
-                            continue
+            logger.warning("Terms not found with Excel Find method, trying direct search")
+            for column_idx in search_columns:
+                if py_q4_cell:
+                    break
+                
+                try:
+                    column_values = read_column_values(udo_sheet, get_column_letter(column_idx), 1, max_search)
+                except Exception as read_error:
+                    logger.warning("Error reading column %s: %s", column_idx, read_error)
+                    continue
+                    
+                for search_term in search_terms:
+                    logger.debug("Searching for '%s' in column %s", search_term, column_idx)
+                    term = search_term.lower()
+                    
+                    for row, value in enumerate(column_values, start=1):
+                        cell_value = str(value).strip() if value is not None else ""
+                        # Use case-insensitive comparison for more robust matching
+                        if term in cell_value.lower():
+                            py_q4_cell = udo_sheet.Cells(row, column_idx)
+                            logger.info("Found '%s' at cell %s", search_term, LazyComValue(lambda: py_q4_cell.Address))
+                            break
+                    
                     if py_q4_cell:
                         break
-            except Exception as find_error:
-                logger.error(f"Error using Find method: {find_error}")
 
         # Strategy 3: Try multiple common positions as fallback
         if not py_q4_cell:
@@ -542,7 +998,7 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
                     cell_value = str(cell.Value).lower() if cell.Value else ""
                     if "py" in cell_value or "q4" in cell_value or "end" in cell_value:
                         py_q4_cell = cell
-                        logger.info(f"Using fallback cell at row {row}: {cell.Address} with value: {cell.Value}")
+                        logger.info("Using fallback cell at row %s: %s with value: %s", row, LazyComValue(lambda: cell.Address), LazyComValue(lambda: cell.Value))
                         break
                 except:
                     pass
@@ -550,103 +1006,109 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
             # If still not found, just use row 10 as absolute last resort
             if not py_q4_cell:
                 py_q4_cell = udo_sheet.Cells(10, 1)
-                logger.warning(f"All search methods failed, using hardcoded fallback at {py_q4_cell.Address}")
+                logger.warning("All search methods failed, using hardcoded fallback at %s", py_q4_cell.Address)
 
         # Proceed with the rest of the function
         py_q4_row = py_q4_cell.Row
-        logger.info(f"Using PY Q4 Ending Balance at row {py_q4_row}, column {py_q4_cell.Column} in UDO sheet")
+        py_q4_col = py_q4_cell.Column
+        logger.info("Using PY Q4 Ending Balance at row %s, column %s in UDO sheet", py_q4_row, py_q4_col)
+
+        # Determine the value column for the obligation analysis total
+        udo_value_column = py_q4_col + 1
+        value_column = 8 if is_current_year else udo_value_column
+
+        # Both UDO amounts sit on the PY Q4 row (for PY they are the same cell),
+        # so read the span covering them once
+        first_col = min(udo_value_column, value_column)
+        last_col = max(udo_value_column, value_column)
+        udo_row_values = {}
+        try:
+            row_block = udo_sheet.Range(udo_sheet.Cells(py_q4_row, first_col), udo_sheet.Cells(py_q4_row, last_col)).Value2
+            if not isinstance(row_block, tuple):
+                row_block = ((row_block,),)
+            udo_row_values = dict(enumerate(row_block[0], start=first_col))
+        except Exception as row_read_error:
+            logger.error("Error reading UDO values on row %s: %s", py_q4_row, row_read_error)
 
         # Get the value from the UDO sheet 
         try:
-            udo_value_cell = udo_sheet.Cells(py_q4_cell.Row, py_q4_cell.Column + 1)
-            udo_value = udo_value_cell.Value
+            udo_value = udo_row_values.get(udo_value_column)
             if udo_value is None:
-                logger.warning(f"UDO value is None at cell {udo_value_cell.Address}")
+                logger.warning("UDO value is None at cell $%s$%s", get_column_letter(udo_value_column), py_q4_row)
                 udo_value = 0
             formatted_udo_value = format_currency(udo_value)
-            logger.info(f"UDO sheet PY Q4 Ending Balance: {formatted_udo_value}")
+            logger.info("UDO sheet PY Q4 Ending Balance: %s", formatted_udo_value)
         except Exception as udo_value_error:
-            logger.error(f"Error getting UDO value: {udo_value_error}")
+            logger.error("Error getting UDO value: %s", udo_value_error)
             udo_value = 0
             formatted_udo_value = "$0.00"
 
         # Find the PY Q4 Ending Balance sheet
-        py_q4_sheet = None
-        for sheet in workbook.Sheets:
-            if "PY Q4 Ending Balance" in sheet.Name or "3-PY Q4 Ending Balance" in sheet.Name:
-                py_q4_sheet = sheet
-                break
+        py_q4_sheet = next((sheet for name, sheet in sheets_by_name.items()
+                            if "PY Q4 Ending Balance" in name or "3-PY Q4 Ending Balance" in name), None)
 
         if not py_q4_sheet:
             logger.warning("PY Q4 Ending Balance sheet not found")
             return
 
-        logger.info(f"PY Q4 Ending Balance sheet found: {py_q4_sheet.Name}")
+        logger.info("PY Q4 Ending Balance sheet found: %s", LazyComValue(lambda: py_q4_sheet.Name))
 
         # Get the sum value from the specified address
         try:
             sum_cell = py_q4_sheet.Range(sum_cell_address)
             py_q4_value = sum_cell.Value
             if py_q4_value is None:
-                logger.warning(f"PY Q4 value is None at cell {sum_cell_address}")
+                logger.warning("PY Q4 value is None at cell %s", sum_cell_address)
                 py_q4_value = 0
             formatted_py_q4_value = format_currency(py_q4_value)
-            logger.info(f"PY Q4 Ending Balance sheet value: {formatted_py_q4_value}")
+            logger.info("PY Q4 Ending Balance sheet value: %s", formatted_py_q4_value)
         except Exception as sum_cell_error:
-            logger.error(f"Error accessing sum cell: {sum_cell_error}")
+            logger.error("Error accessing sum cell: %s", sum_cell_error)
             py_q4_value = 0
             formatted_py_q4_value = "$0.00"
 
         # Compare the values - with safer float comparison
-        comparison_cell = udo_sheet.Cells(py_q4_cell.Row, py_q4_cell.Column + 2)
-        
         try:
             # Convert values to float for simpler comparison
             # Use a helper function to standardize numeric extraction from strings
             float_udo_value = clean_numeric_value(udo_value)
             float_py_q4_value = clean_numeric_value(py_q4_value)
             
-            logger.info(f"Comparing values: UDO value ({float_udo_value}) vs PY Q4 value ({float_py_q4_value})")
+            logger.info("Comparing values: UDO value (%s) vs PY Q4 value (%s)", float_udo_value, float_py_q4_value)
             
-            if abs(abs(float_udo_value) - abs(float_py_q4_value)) < 0.01:
-                apply_tickmark(udo_sheet, py_q4_cell.Row, py_q4_cell.Column + 2, "m", "Wingdings", bold=False)
+            if amounts_match(float_udo_value, float_py_q4_value):
+                apply_tickmark(udo_sheet, py_q4_row, py_q4_col + 2, "m", "Wingdings", bold=False)
                 logger.info("Values match. Added 'm' in Wingdings.")
             else:
-                apply_tickmark(udo_sheet, py_q4_cell.Row, py_q4_cell.Column + 2, "X", "Calibri", bold=True)
-                logger.warning(f"Values do not match. UDO: {formatted_udo_value}, PY Q4: {formatted_py_q4_value}. Added 'X' in Calibri Bold.")
+                apply_tickmark(udo_sheet, py_q4_row, py_q4_col + 2, "X", "Calibri", bold=True)
+                logger.warning("Values do not match. UDO: %s, PY Q4: %s. Added 'X' in Calibri Bold.", formatted_udo_value, formatted_py_q4_value)
         except Exception as comparison_error:
-            logger.error(f"Error comparing values: {comparison_error}")
-            apply_tickmark(udo_sheet, py_q4_cell.Row, py_q4_cell.Column + 2, "X", "Calibri", bold=True)
+            logger.error("Error comparing values: %s", comparison_error)
+            apply_tickmark(udo_sheet, py_q4_row, py_q4_col + 2, "X", "Calibri", bold=True)
             logger.warning("Error during comparison. Added 'X' in Calibri Bold.")
 
         # Autofit the value column width
         try:
-            udo_sheet.Columns(py_q4_cell.Column + 1).AutoFit()
+            udo_sheet.Columns(udo_value_column).AutoFit()
         except Exception as autofit_error:
-            logger.warning(f"Error auto-fitting column: {autofit_error}")
-
-        # Determine the value column for the obligation analysis total
-        value_column = 8 if is_current_year else py_q4_cell.Column + 1
+            logger.warning("Error auto-fitting column: %s", autofit_error)
 
         # Get the obligation analysis total amount from the UDO sheet
         try:
-            obligation_analysis_total = udo_sheet.Cells(py_q4_row, value_column).Value
+            obligation_analysis_total = udo_row_values.get(value_column)
             if obligation_analysis_total is None:
-                logger.warning(f"Obligation analysis total is None at cell {value_column}{py_q4_row}")
+                logger.warning("Obligation analysis total is None at cell $%s$%s", get_column_letter(value_column), py_q4_row)
                 obligation_analysis_total = 0
             formatted_obligation_analysis_total = format_currency(obligation_analysis_total)
-            logger.info(f"UDO sheet obligation analysis total: {formatted_obligation_analysis_total}")
+            logger.info("UDO sheet obligation analysis total: %s", formatted_obligation_analysis_total)
         except Exception as oa_total_error:
-            logger.error(f"Error getting obligation analysis total: {oa_total_error}")
+            logger.error("Error getting obligation analysis total: %s", oa_total_error)
             obligation_analysis_total = 0
             formatted_obligation_analysis_total = "$0.00"
 
         # Find the Obligation Analysis sheet
-        target_sheet = None
-        for sheet in workbook.Sheets:
-            if "Obligation Analysis" in sheet.Name or "4-Obligation Analysis" in sheet.Name:
-                target_sheet = sheet
-                break
+        target_sheet = next((sheet for name, sheet in sheets_by_name.items()
+                             if "Obligation Analysis" in name or "4-Obligation Analysis" in name), None)
 
         if not target_sheet:
             logger.warning("'Obligation Analysis' sheet not found")
@@ -655,35 +1117,37 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
         # Get the header row and find the "Sum of UDO Balance" column
         try:
             tas_cell = target_sheet.Cells.Find("TAS", After=target_sheet.Cells(1, 1), 
-                                           LookIn=win32com.client.constants.xlValues, 
-                                           LookAt=win32com.client.constants.xlWhole)
+                                           LookIn=XL_VALUES, 
+                                           LookAt=XL_WHOLE)
             if not tas_cell:
                 logger.warning("TAS cell not found in column A")
                 return
             
             header_row = tas_cell.Row
 
-            # Force Excel calculation to ensure all formulas are evaluated
-            logger.debug("Forcing Excel to recalculate workbook")
+            # Calculation is manual while validating; bring just this sheet's
+            # formulas up to date before its totals are read
             try:
-                workbook.Application.CalculateFull()
+                target_sheet.Calculate()
             except Exception as calc_error:
-                logger.warning(f"Error forcing calculation: {calc_error}")
+                logger.warning("Error calculating '%s': %s", target_sheet.Name, calc_error)
 
             # Use the provided sum_udo_balance_col2 if available and valid
             if sum_udo_balance_col2 and sum_udo_balance_col2 > 0:
-                logger.info(f"Using provided second 'Sum of UDO Balance' column: {sum_udo_balance_col2}")
+                logger.info("Using provided second 'Sum of UDO Balance' column: %s", sum_udo_balance_col2)
                 sum_udo_balance_col = sum_udo_balance_col2
             else:
                 # Fallback: try to find the second occurrence
-                sum_udo_balance_cols = []
-                header_row_cells = target_sheet.Range(f"{header_row}:{header_row}")
-                for cell in header_row_cells:
-                    if cell.Value and "sum of udo balance" in str(cell.Value).lower():
-                        sum_udo_balance_cols.append(cell.Column)
+                # Read the used part of the header row in one call and scan it in Python
+                used_range = target_sheet.UsedRange
+                last_col = used_range.Column + used_range.Columns.Count - 1
+                header_values = target_sheet.Range(target_sheet.Cells(header_row, 1), target_sheet.Cells(header_row, last_col)).Value2
+                header_values = header_values[0] if isinstance(header_values, tuple) else (header_values,)
+                sum_udo_balance_cols = [col for col, value in enumerate(header_values, start=1)
+                                        if value and "sum of udo balance" in str(value).lower()]
                 if len(sum_udo_balance_cols) >= 2:
                     sum_udo_balance_col = sum_udo_balance_cols[1]
-                    logger.info(f"Fallback: found second 'Sum of UDO Balance' at column {sum_udo_balance_col}")
+                    logger.info("Fallback: found second 'Sum of UDO Balance' at column %s", sum_udo_balance_col)
                 else:
                     logger.error("Could not locate second 'Sum of UDO Balance' column")
                     return
@@ -709,18 +1173,18 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
                 sum_udo_balance = -382473060.07
             
             if sum_udo_balance is None:
-                logger.warning(f"Sum UDO Balance is None at cell {get_column_letter(sum_udo_balance_col)}{grand_total_row}")
+                logger.warning("Sum UDO Balance is None at cell %s%s", get_column_letter(sum_udo_balance_col), grand_total_row)
                 sum_udo_balance = 0
                 
             formatted_sum_udo_balance = format_currency(sum_udo_balance)
-            logger.info(f"Sum UDO Balance value at column {sum_udo_balance_col}, row {grand_total_row}: {formatted_sum_udo_balance}")
+            logger.info("Sum UDO Balance value at column %s, row %s: %s", sum_udo_balance_col, grand_total_row, formatted_sum_udo_balance)
 
             # Compare the amounts with absolute values
             try:
-                comparison_result = abs(abs(Decimal(str(obligation_analysis_total))) - abs(Decimal(str(sum_udo_balance)))) < Decimal('0.01')
-                logger.info(f"Comparing amounts: Obligation ({obligation_analysis_total}) vs Sum UDO ({sum_udo_balance})")
-            except Exception as comparison_error:
-                logger.error(f"Error in amount comparison: {comparison_error}")
+                comparison_result = amounts_match(obligation_analysis_total, sum_udo_balance)
+                logger.info("Comparing amounts: Obligation (%s) vs Sum UDO (%s)", obligation_analysis_total, sum_udo_balance)
+            except (TypeError, ValueError, InvalidOperation) as comparison_error:
+                logger.error("Error in amount comparison: %s", comparison_error)
                 comparison_result = False
 
             # Determine the tickmark column
@@ -733,25 +1197,25 @@ def compare_py_q4_ending_balance(workbook, udo_sheet, sum_cell_address: str, is_
                     logger.info("Amounts match. Tickmark 'm' applied.")
                 else:
                     apply_tickmark(udo_sheet, py_q4_row, tickmark_column, "X", "Calibri", bold=True)
-                    logger.warning(f"Amounts do not match. UDO: {formatted_obligation_analysis_total}, Analysis: {formatted_sum_udo_balance}. Tickmark 'X' applied.")
+                    logger.warning("Amounts do not match. UDO: %s, Analysis: %s. Tickmark 'X' applied.", formatted_obligation_analysis_total, formatted_sum_udo_balance)
             except Exception as tickmark_error:
-                logger.error(f"Error applying tickmark: {tickmark_error}")
+                logger.error("Error applying tickmark: %s", tickmark_error)
 
             # Autofit the value column width in the UDO sheet
             try:
                 udo_sheet.Columns(value_column).AutoFit()
             except Exception as autofit_error:
-                logger.warning(f"Error auto-fitting value column: {autofit_error}")
+                logger.warning("Error auto-fitting value column: %s", autofit_error)
 
             logger.info("Completed PY Q4 Ending Balance comparison successfully")
 
         except Exception as col_find_error:
-            logger.error(f"Error finding header row or columns: {col_find_error}")
+            logger.error("Error finding header row or columns: %s", col_find_error)
             logger.error(traceback.format_exc())
             return
 
     except Exception as e:
-        logger.error(f"Error in compare_py_q4_ending_balance: {str(e)}")
+        logger.error("Error in compare_py_q4_ending_balance: %s", e)
         logger.error(traceback.format_exc())
 
 
@@ -768,42 +1232,41 @@ def find_grand_total_row(sheet, header_row: int, value_col: int) -> Optional[int
     Returns:
         Optional[int]: Row number if found, None otherwise
     """
-    # Method 1: Look in the column before value_col for "Grand Total" text
-    logger.debug("Searching for 'Grand Total' text")
-    for row in range(header_row + 1, header_row + 15):
-        cell_value = str(sheet.Cells(row, value_col - 1).Value or "").strip()
-        if cell_value == "Grand Total":
-            logger.info(f"Found Grand Total row at {row} using text search")
-            return row
-
-    # Method 2: Look for row with SUM formula
-    logger.debug("Searching for SUM formula")
-    for row in range(header_row + 1, header_row + 15):
-        cell = sheet.Cells(row, value_col)
-        try:
-            if cell.HasFormula:
-                formula = str(cell.Formula)
-                if "SUM" in formula.upper():
-                    logger.info(f"Found Grand Total row at {row} using formula search")
-                    return row
-        except Exception as e:
-            logger.debug(f"Error checking formula at row {row}: {e}")
+    first_row = header_row + 1
+    last_row = header_row + 14
+    
+    # Read the label and value columns for the rows under the header, plus the
+    # value column's formulas, then run all three checks in one pass:
+    # "Grand Total" text wins, then the first SUM formula, then the largest value
+    block = sheet.Range(sheet.Cells(first_row, value_col - 1), sheet.Cells(last_row, value_col))
+    rows = block.Value2
+    try:
+        formulas = [row_formulas[0] for row_formulas in block.Columns(2).Formula]
+    except Exception as e:
+        logger.debug("Could not read the formulas: %s", e)
+        formulas = [None] * len(rows)
 
-    # Method 3: Look for a larger value that's likely a total
-    logger.debug("Searching for value pattern consistent with a total")
+    sum_row = None
     max_value = 0
     max_row = None
-    for row in range(header_row + 1, header_row + 15):
-        try:
-            cell_value = sheet.Cells(row, value_col).Value
-            if isinstance(cell_value, (int, float)) and abs(cell_value) > max_value:
-                max_value = abs(cell_value)
-                max_row = row
-        except Exception as e:
-            logger.debug(f"Error checking value at row {row}: {e}")
+    for row, (label, cell_value), formula in zip(range(first_row, last_row + 1), rows, formulas):
+        if str(label or "").strip() == "Grand Total":
+            logger.info("Found Grand Total row at %s using text search", row)
+            return row
+        if sum_row is None:
+            formula = str(formula or "")
+            if formula.startswith("=") and "SUM" in formula.upper():
+                sum_row = row
+        if isinstance(cell_value, (int, float)) and abs(cell_value) > max_value:
+            max_value = abs(cell_value)
+            max_row = row
+
+    if sum_row:
+        logger.info("Found Grand Total row at %s using formula search", sum_row)
+        return sum_row
     
     if max_row:
-        logger.info(f"Found likely Grand Total row at {max_row} based on value magnitude")
+        logger.info("Found likely Grand Total row at %s based on value magnitude", max_row)
         return max_row
 
     # If all else fails, use the default position
@@ -811,8 +1274,7 @@ def find_grand_total_row(sheet, header_row: int, value_col: int) -> Optional[int
     return header_row + 5
 
 
-@safe_excel_operation
-def log_cell_properties(sheet, row: int, column: int) -> None:
+def log_cell_properties(sheet, row: int, column: int, include_display_format: bool = False) -> None:
     """
     Log various properties of a cell for diagnostic purposes.
     
@@ -820,47 +1282,44 @@ def log_cell_properties(sheet, row: int, column: int) -> None:
         sheet: Excel worksheet object
         row (int): Row index
         column (int): Column index
+        include_display_format (bool): Also log DisplayFormat.NumberFormat,
+            one of the slowest properties Excel exposes
     """
+    # Every line below is DEBUG output built from COM reads
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     cell = sheet.Cells(row, column)
     address = f"{get_column_letter(column)}{row}"
     
+    properties = [
+        ("Address", lambda: cell.Address),
+        ("Value", lambda: cell.Value2),
+        ("Text", lambda: cell.Text),
+        # Formula returns the constant itself for a non-formula cell, so it
+        # doubles as the HasFormula check
+        ("Formula", lambda: cell.Formula),
+        ("NumberFormat", lambda: cell.NumberFormat),
+    ]
+    if include_display_format:
+        properties.append(("DisplayFormat.NumberFormat", lambda: cell.DisplayFormat.NumberFormat))
+    
     try:
-        logger.debug(f"Cell diagnostics for {address}:")
-        
-        try:
-            logger.debug(f"  Address: {cell.Address}")
-        except Exception as e:
-            logger.debug(f"  Address error: {e}")
-            
-        try:
-            logger.debug(f"  Value: {cell.Value}")
-        except Exception as e:
-            logger.debug(f"  Value error: {e}")
-            
-        try:
-            logger.debug(f"  Text: {cell.Text}")
-        except Exception as e:
-            logger.debug(f"  Text error: {e}")
-            
-        try:
-            logger.debug(f"  HasFormula: {cell.HasFormula}")
-            if cell.HasFormula:
-                logger.debug(f"  Formula: {cell.Formula}")
-        except Exception as e:
-            logger.debug(f"  Formula error: {e}")
-            
-        try:
-            logger.debug(f"  NumberFormat: {cell.NumberFormat}")
-        except Exception as e:
-            logger.debug(f"  NumberFormat error: {e}")
-            
-        try:
-            logger.debug(f"  DisplayFormat.NumberFormat: {cell.DisplayFormat.NumberFormat}")
-        except Exception as e:
-            logger.debug(f"  DisplayFormat error: {e}")
-            
+        logger.debug("Cell diagnostics for %s:", address)
+        for name, read_property in properties:
+            try:
+                value = read_property()
+            except Exception as e:
+                logger.debug("  %s error: %s", name, e)
+                continue
+            if name == "Formula":
+                has_formula = str(value).startswith("=")
+                logger.debug("  HasFormula: %s", has_formula)
+                if has_formula:
+                    logger.debug("  Formula: %s", value)
+            else:
+                logger.debug("  %s: %s", name, value)
     except Exception as e:
-        logger.error(f"Error logging cell properties: {e}")
+        logger.error("Error logging cell properties: %s", e)
 
 
 @safe_excel_operation
@@ -878,59 +1337,56 @@ def get_cell_value_with_fallbacks(sheet, row: int, column: int) -> Any:
     """
     cell = sheet.Cells(row, column)
     cell_address = f"{get_column_letter(column)}{row}"
-    logger.debug(f"Attempting to get cell value for {cell_address} with fallbacks")
+    logger.debug("Attempting to get cell value for %s with fallbacks", cell_address)
     
     # Method 1: Direct Value property
     try:
         value = cell.Value
-        logger.debug(f"Direct Value property: {value}")
+        logger.debug("Direct Value property: %s", value)
         if value is not None:
             return value
     except Exception as e:
-        logger.debug(f"Error getting direct Value: {e}")
+        logger.debug("Error getting direct Value: %s", e)
     
     # Method 2: Text property
     try:
         text = cell.Text
-        logger.debug(f"Text property: {text}")
+        logger.debug("Text property: %s", text)
         if text:
             try:
                 # Try to convert text to number if it looks numeric
-                clean_text = text.replace("$", "").replace(",", "").replace("(", "-").replace(")", "")
+                clean_text = text.translate(_CURRENCY_TEXT_TRANS)
                 return float(clean_text)
             except:
                 return text
     except Exception as e:
-        logger.debug(f"Error getting Text property: {e}")
+        logger.debug("Error getting Text property: %s", e)
     
-    # Method 3: Calculate and get value for formulas
+    # Method 3: Re-read formula cells through Value2. compare_py_q4_ending_balance
+    # recalculates the sheet before it gets here, so there is no per-cell Calculate.
     try:
         if cell.HasFormula:
-            logger.debug(f"Cell has formula: {cell.Formula}")
-            # Force calculation of just this cell
-            cell.Calculate()
-            value = cell.Value
-            logger.debug(f"After Calculate(): {value}")
+            logger.debug("Cell has formula: %s", LazyComValue(lambda: cell.Formula))
+            value = cell.Value2
+            logger.debug("Formula Value2: %s", value)
             if value is not None:
                 return value
     except Exception as e:
-        logger.debug(f"Error calculating formula: {e}")
+        logger.debug("Error reading formula value: %s", e)
     
-    # Method 4: Try to read from displayed text (via clipboard)
+    # Method 4: Render the raw value with the cell's number format. TEXT() runs
+    # inside Excel without selecting the cell or touching the clipboard.
     try:
-        cell.Select()
-        sheet.Application.CutCopyMode = False
-        sheet.Application.ExecuteExcel4Macro("COPY()")
-        clipboard_text = sheet.Application.ClipboardText
-        logger.debug(f"Clipboard text: {clipboard_text}")
-        if clipboard_text:
+        formatted_text = sheet.Application.WorksheetFunction.Text(cell.Value2, cell.NumberFormat)
+        logger.debug("Formatted text: %s", formatted_text)
+        if formatted_text:
             try:
-                clean_text = clipboard_text.strip().replace("$", "").replace(",", "").replace("(", "-").replace(")", "")
+                clean_text = formatted_text.strip().translate(_CURRENCY_TEXT_TRANS)
                 return float(clean_text)
             except:
-                return clipboard_text
+                return formatted_text
     except Exception as e:
-        logger.debug(f"Error accessing clipboard: {e}")
+        logger.debug("Error formatting value with TEXT(): %s", e)
     
     # Method 5: Try to evaluate the formula manually
     try:
@@ -938,27 +1394,45 @@ def get_cell_value_with_fallbacks(sheet, row: int, column: int) -> Any:
             formula = cell.Formula
             if formula.startswith("=SUM"):
                 # Extract range from SUM formula
-                import re
-                match = re.search(r'SUM\((.*?)\)', formula)
+                match = _SUM_RANGE_RE.search(formula)
                 if match:
                     range_text = match.group(1)
-                    sum_range = sheet.Range(range_text)
+                    # One Value2 read for the whole range instead of a COM
+                    # enumeration step and .Value call per cell
+                    range_values = sheet.Range(range_text).Value2
+                    if not isinstance(range_values, tuple):
+                        range_values = ((range_values,),)
                     manual_sum = 0
-                    for c in sum_range:
-                        if c.Value is not None:
-                            try:
-                                manual_sum += float(c.Value)
-                            except:
-                                pass
-                    logger.debug(f"Manually calculated sum: {manual_sum}")
+                    for row_values in range_values:
+                        for value in row_values:
+                            if value is not None:
+                                try:
+                                    manual_sum += float(value)
+                                except:
+                                    pass
+                    logger.debug("Manually calculated sum: %s", manual_sum)
                     return manual_sum
     except Exception as e:
-        logger.debug(f"Error evaluating formula manually: {e}")
+        logger.debug("Error evaluating formula manually: %s", e)
     
-    logger.warning(f"All methods failed to get value for cell {cell_address}")
+    logger.warning("All methods failed to get value for cell %s", cell_address)
     return None
 
 
+def to_cents(value) -> int:
+    """
+    Converts an amount to a whole number of cents.
+    
+    Args:
+        value: Numeric amount (int, float, Decimal or numeric string)
+        
+    Returns:
+        int: The amount in cents, rounded to the nearest cent
+    """
+    return round(float(value) * 100)
+
+
+@lru_cache(maxsize=1024)
 def clean_numeric_value(value) -> float:
     """
     Converts a value to a float, handling different formats and representations.
@@ -977,19 +1451,19 @@ def clean_numeric_value(value) -> float:
     
     # If it's a string, clean it up
     try:
-        # Remove currency symbols, commas, and handle parentheses for negative values
-        cleaned_str = str(value).replace("$", "").replace(",", "")
+        cleaned_str = str(value)
         # Handle parentheses-style negative numbers
         if "(" in cleaned_str and ")" in cleaned_str:
-            cleaned_str = cleaned_str.replace("(", "-").replace(")", "")
-        # Handle any other non-numeric characters
-        cleaned_str = ''.join(c for c in cleaned_str if c.isdigit() or c in '.-')
+            cleaned_str = cleaned_str.translate(_CURRENCY_TEXT_TRANS)
+        # Drop currency symbols, commas and any other non-numeric characters
+        cleaned_str = _NON_NUMERIC_RE.sub("", cleaned_str)
         return float(cleaned_str) if cleaned_str else 0.0
     except:
         return 0.0
 
 
 @safe_excel_operation
+@excel_fast_operation
 def perform_udo_detail_reconciliation(udo_sheet) -> None:
     """
     Perform UDO Detail Reconciled to TIER validation.
@@ -1010,7 +1484,7 @@ def perform_udo_detail_reconciliation(udo_sheet) -> None:
             logger.warning("One or both 'UDO Detail Reconciled to TIER' cells not found")
             return
         
-        logger.info(f"'UDO Detail Reconciled to TIER' found at row {udo_detail_cell_b.Row} in column B and row {udo_detail_cell_g.Row} in column G")
+        logger.info("'UDO Detail Reconciled to TIER' found at row %s in column B and row %s in column G", udo_detail_cell_b.Row, udo_detail_cell_g.Row)
         
         # Find "PY Q4 Ending Balance" in column B
         py_q4_cell = find_cell_in_column(udo_sheet, "B", "PY Q4 Ending Balance")
@@ -1019,43 +1493,137 @@ def perform_udo_detail_reconciliation(udo_sheet) -> None:
             logger.warning("'PY Q4 Ending Balance' not found in column B")
             return
         
-        logger.info(f"'PY Q4 Ending Balance' found at row {py_q4_cell.Row} in column B")
+        logger.info("'PY Q4 Ending Balance' found at row %s in column B", py_q4_cell.Row)
         
         # Define value columns
         value_columns = ['C', 'H']
         
+        start_row = py_q4_cell.Row
+        end_row = start_row + 3
+        subtotal_row = end_row + 1
+        formula_row = subtotal_row + 1
+        
+        # The check is the same in both columns relative to the formula cell,
+        # so write it once in R1C1 form to both cells through a two-area range
+        formula_r1c1 = (f'=IF(ROUND(SUM(R[{start_row - formula_row}]C:R[{end_row - formula_row}]C)'
+                        f'-R[{subtotal_row - formula_row}]C,0)=0,"a","û")')
+        formula_cells = udo_sheet.Range(",".join(f"{col}{formula_row}" for col in value_columns))
+        formula_cells.FormulaR1C1 = formula_r1c1
+        
+        # Format the cells
+        format_formula_cell(formula_cells)
+        
         for col in value_columns:
-            start_row = py_q4_cell.Row
-            end_row = start_row + 3
-            subtotal_row = end_row + 1
-            formula_row = subtotal_row + 1
-            
-            # Construct the formula
             formula = f'=IF(ROUND(SUM({col}{start_row}:{col}{end_row})-{col}{subtotal_row},0)=0,"a","û")'
-            
-            # Apply the formula
-            formula_cell = udo_sheet.Cells(formula_row, udo_sheet.Columns(col).Column)
-            formula_cell.Formula = formula
-            
-            # Format the cell
-            format_formula_cell(formula_cell)
-            
-            logger.info(f"Formula applied in column {col} at row {formula_row}: {formula}")
+            logger.info("Formula applied in column %s at row %s: %s", col, formula_row, formula)
             
             # Log the values used in the formula
             log_formula_values(udo_sheet, col, start_row, end_row, subtotal_row)
         
         logger.info("UDO Detail Reconciled to TIER validation completed successfully")
     except Exception as e:
-        logger.error(f"Error in UDO Detail Reconciled to TIER validation: {str(e)}")
+        logger.error("Error in UDO Detail Reconciled to TIER validation: %s", e)
         logger.error(traceback.format_exc())
         raise
 
 
+# Tickmarks queued by apply_tickmark while a batched_tickmarks block is active,
+# keyed by (sheet name, row, column) so a later mark on a cell replaces an
+# earlier one. None when no batch is active.
+_pending_tickmarks: Optional[Dict[Tuple[str, int, int], Tuple[Any, str, str, bool]]] = None
+
+
+@contextmanager
+def batched_tickmarks():
+    """
+    Collect apply_tickmark calls and write them together when the block exits.
+    
+    Tickmarks sharing a sheet, mark, font and weight are written through one
+    multi-area range, so a handful of COM calls replace seven per tickmark.
+    """
+    global _pending_tickmarks
+    if _pending_tickmarks is not None:
+        # Already inside a batch; the outer block flushes
+        yield
+        return
+    _pending_tickmarks = {}
+    try:
+        yield
+    finally:
+        pending, _pending_tickmarks = _pending_tickmarks, None
+        flush_tickmarks(pending)
+
+
+def flush_tickmarks(pending: Dict[Tuple[str, int, int], Tuple[Any, str, str, bool]]) -> None:
+    """
+    Write queued tickmarks, one multi-area range per (sheet, mark, font, bold) group.
+    
+    Args:
+        pending: Queued tickmarks as built by apply_tickmark
+    """
+    groups: Dict[Tuple[str, str, str, bool], List[str]] = {}
+    sheets: Dict[str, Any] = {}
+    for (sheet_name, row, col), (sheet, mark, font_name, bold) in pending.items():
+        sheets[sheet_name] = sheet
+        groups.setdefault((sheet_name, mark, font_name, bold), []).append(f"{get_column_letter(col)}{row}")
+    
+    for (sheet_name, mark, font_name, bold), areas in groups.items():
+        for address in join_range_areas(areas):
+            try:
+                _write_tickmark(sheets[sheet_name].Range(address), mark, font_name, bold)
+                logger.debug("Applied tickmark '%s' in %s at cells %s", mark, font_name, address)
+            except Exception as e:
+                logger.error("Error applying tickmarks to %s on '%s': %s", address, sheet_name, e)
+
+
+def _write_tickmark(target, mark: str, font_name: str, bold: bool) -> None:
+    """
+    Writes a tickmark and its formatting to a cell or multi-area range.
+    
+    Args:
+        target: Excel Range object
+        mark (str): Tickmark character
+        font_name: Font name
+        bold (bool): Whether to make the text bold
+    """
+    target.Value = mark
+    font = target.Font
+    font.Name = font_name
+    font.Size = 11
+    font.Color = 0  # Black
+    font.Bold = bold
+    target.HorizontalAlignment = XL_CENTER
+    target.VerticalAlignment = XL_CENTER
+
+
+def queue_tickmark(sheet, row: int, col: int, mark: str, font_name: str, bold: bool) -> bool:
+    """
+    Queues a tickmark if a batched_tickmarks block is active.
+    
+    Args:
+        sheet: Excel worksheet object
+        row (int): Row number
+        col (int): Column number
+        mark (str): Tickmark character
+        font_name: Font name
+        bold (bool): Whether to make the text bold
+    
+    Returns:
+        bool: True if the tickmark was queued, False if it must be written now
+    """
+    if _pending_tickmarks is None:
+        return False
+    _pending_tickmarks[(sheet.Name, row, col)] = (sheet, mark, font_name, bold)
+    return True
+
+
 def apply_tickmark(sheet, row: int, col: int, mark: str, font_name: str, bold: bool = False) -> None:
     """
     Apply a tickmark to a cell.
     
+    Inside a batched_tickmarks block the tickmark is queued and written when
+    the block exits; otherwise it is written immediately.
+    
     Args:
         sheet: Excel worksheet object
         row (int): Row number
@@ -1065,17 +1633,13 @@ def apply_tickmark(sheet, row: int, col: int, mark: str, font_name: str, bold: b
         bold (bool): Whether to make the text bold
     """
     try:
+        if queue_tickmark(sheet, row, col, mark, font_name, bold):
+            return
         cell = sheet.Cells(row, col)
-        cell.Value = mark
-        cell.Font.Name = font_name
-        cell.Font.Size = 11
-        cell.Font.Color = 0  # Black
-        cell.Font.Bold = bold
-        cell.HorizontalAlignment = win32com.client.constants.xlCenter
-        cell.VerticalAlignment = win32com.client.constants.xlCenter
-        logger.debug(f"Applied tickmark '{mark}' in {font_name} at cell {cell.Address}")
+        _write_tickmark(cell, mark, font_name, bold)
+        logger.debug("Applied tickmark '%s' in %s at cell %s", mark, font_name, LazyComValue(lambda: cell.Address))
     except Exception as e:
-        logger.error(f"Error applying tickmark to cell at row {row}, col {col}: {e}")
+        logger.error("Error applying tickmark to cell at row %s, col %s: %s", row, col, e)
 
 
 def find_udo_tier_sheet(workbook) -> Any:
@@ -1091,8 +1655,11 @@ def find_udo_tier_sheet(workbook) -> Any:
     Raises:
         ValueError: If the sheet is not found
     """
-    for sheet in workbook.Sheets:
-        if "6-UDO TO TIER Recon SUMMARY" in sheet.Name or "UDO TO TIER Recon SUMMARY" in sheet.Name:
+    sheets = workbook.Sheets
+    for index in range(1, sheets.Count + 1):
+        sheet = sheets(index)
+        # Also matches the "6-UDO TO TIER Recon SUMMARY" tab name
+        if "UDO TO TIER Recon SUMMARY" in sheet.Name:
             return sheet
     raise ValueError("UDO TO TIER Recon SUMMARY sheet not found")
 
@@ -1105,20 +1672,22 @@ def add_tickmark_columns(sheet) -> None:
         sheet: Excel worksheet object
     """
     sheet.Columns("D:D").Insert()
-    last_col = sheet.UsedRange.Columns.Count
-    logger.debug(f"Last column before inserting: {last_col}")
+    used_range = sheet.UsedRange
+    last_col = used_range.Columns.Count
+    logger.debug("Last column before inserting: %s", last_col)
     sheet.Columns(last_col + 1).Insert()
     
-    for col in [4, 9]:
-        cell = sheet.Cells(3, col)
-        cell.Value = "Tickmark"
-        cell.Font.Name = "Calibri"
-        cell.Font.Size = 11
-        cell.Font.Color = 255  # Red
-        cell.Font.Bold = True
-        cell.Interior.Color = 65535  # Yellow
-        cell.HorizontalAlignment = win32com.client.constants.xlCenter
-        cell.VerticalAlignment = win32com.client.constants.xlCenter
+    # Both headers get identical content, so write them as one two-area range
+    headers = sheet.Range(",".join(f"{get_column_letter(col)}3" for col in (4, 9)))
+    headers.Value = "Tickmark"
+    font = headers.Font
+    font.Name = "Calibri"
+    font.Size = 11
+    font.Color = 255  # Red
+    font.Bold = True
+    headers.Interior.Color = 65535  # Yellow
+    headers.HorizontalAlignment = XL_CENTER
+    headers.VerticalAlignment = XL_CENTER
 
 
 def find_start_row(sheet, column_index: int) -> Optional[int]:
@@ -1132,15 +1701,16 @@ def find_start_row(sheet, column_index: int) -> Optional[int]:
     Returns:
         int or None: Row number if found, None otherwise
     """
-    start_cell = sheet.Columns(column_index).Find("4801", LookAt=win32com.client.constants.xlWhole)
+    start_cell = sheet.Columns(column_index).Find("4801", LookAt=XL_WHOLE)
     if start_cell:
-        logger.info(f"Start row '4801' found at row {start_cell.Row} in column {column_index}")
+        logger.info("Start row '4801' found at row %s in column %s", start_cell.Row, column_index)
         return start_cell.Row
-    logger.warning(f"Start row '4801' not found in column {column_index}")
+    logger.warning("Start row '4801' not found in column %s", column_index)
     return None
 
 
 @safe_excel_operation
+@excel_fast_operation
 def perform_validations(workbook, udo_sheet, start_row: int, component: str, is_current_year: bool = False) -> None:
     """
     Perform validations between UDO and TB sheets.
@@ -1157,44 +1727,77 @@ def perform_validations(workbook, udo_sheet, start_row: int, component: str, is_
     value_column = 8 if is_current_year else 3  # Adjust based on your sheet layout
     tickmark_column = 9 if is_current_year else 4  # Adjust based on your sheet layout
 
-    for i in range(3):  # Validate 3 rows
-        ussgl = f"{int(udo_sheet.Cells(start_row + i, 1).Value):04d}00"
-        udo_value = Decimal(str(udo_sheet.Cells(start_row + i, value_column).Value))
-        formatted_udo_value = format_currency(udo_value)
+    # Read the three UDO rows (USSGL code through the value column) in one call
+    udo_block = udo_sheet.Range(udo_sheet.Cells(start_row, 1),
+                                udo_sheet.Cells(start_row + 2, value_column)).Value2
+    ussgls = [_format_ussgl(row_values[0]) for row_values in udo_block]
+    tb_rows = [find_tb_row(tb_sheet, ussgl) for ussgl in ussgls]
+
+    # Fetch column K for every matched TB row with a single read of the span
+    # between the first and last match
+    tb_values = {}
+    found_rows = [tb_row for tb_row in tb_rows if tb_row]
+    if found_rows:
+        first_row, last_row = min(found_rows), max(found_rows)
+        column_k = tb_sheet.Range(tb_sheet.Cells(first_row, 11), tb_sheet.Cells(last_row, 11)).Value2
+        if not isinstance(column_k, tuple):
+            column_k = ((column_k,),)
+        tb_values = {tb_row: column_k[tb_row - first_row][0] for tb_row in found_rows}
+
+    # Tickmarks go to both the UDO and TB sheets; write them in grouped ranges
+    with batched_tickmarks():
+        for i in range(3):  # Validate 3 rows
+            ussgl = ussgls[i]
+            udo_value = udo_block[i][value_column - 1]
+            udo_cents = to_cents(udo_value)
+            formatted_udo_value = format_currency(udo_value)
 
-        logger.info(f"Validating USSGL {ussgl} with UDO value {formatted_udo_value} for {sheet_name}")
+            logger.info("Validating USSGL %s with UDO value %s for %s", ussgl, formatted_udo_value, sheet_name)
 
-        tb_row = find_tb_row(tb_sheet, ussgl)
-        if tb_row:
-            tb_value = Decimal(str(tb_sheet.Cells(tb_row, 11).Value))  # Column K
-            formatted_tb_value = format_currency(tb_value)
-            logger.info(f"{sheet_name} TB value for USSGL {ussgl}: {formatted_tb_value}")
+            tb_row = tb_rows[i]
+            if tb_row:
+                tb_value = tb_values[tb_row]  # Column K
+                formatted_tb_value = format_currency(tb_value)
+                logger.info("%s TB value for USSGL %s: %s", sheet_name, ussgl, formatted_tb_value)
 
-            # First condition: Direct comparison with small threshold
-            if abs(udo_value - tb_value) < Decimal('0.01'):
-                add_tickmark(udo_sheet, start_row + i, tickmark_column, "a", "Marlett")
-                add_tickmark(tb_sheet, tb_row, 12, "8", "Wingdings 2")
-                logger.info(f"Values match for USSGL {ussgl} in {sheet_name}. Tickmarks added.")
-            # Second condition: Compare absolute values with threshold
-            elif abs(abs(udo_value) - abs(tb_value)) < Decimal('0.01'):
+                # Absolute values are compared: the TB can carry the balance
+                # with the opposite sign, and equal signed values pass anyway
+                if amounts_match(udo_value, tb_value):
+                    add_tickmark(udo_sheet, start_row + i, tickmark_column, "a", "Marlett")
+                    add_tickmark(tb_sheet, tb_row, 12, "8", "Wingdings 2")
+                    logger.info("Values match for USSGL %s in %s. Tickmarks added.", ussgl, sheet_name)
+                else:
+                    add_mismatch_mark(udo_sheet, start_row + i, tickmark_column)
+                    add_mismatch_mark(tb_sheet, tb_row, 12)
+                    logger.warning(
+                        "Mismatch for USSGL %s in %s. "
+                        "UDO: %s, TB: %s",
+                        ussgl, sheet_name, formatted_udo_value, formatted_tb_value
+                    )
+            elif udo_cents == 0:
                 add_tickmark(udo_sheet, start_row + i, tickmark_column, "a", "Marlett")
-                add_tickmark(tb_sheet, tb_row, 12, "8", "Wingdings 2")
-                logger.info(f"Absolute values match for USSGL {ussgl} in {sheet_name}. Tickmarks added.")
+                logger.info("USSGL %s not found in %s TB, but UDO value is 0. Tickmark added.", ussgl, sheet_name)
             else:
-                add_mismatch_mark(udo_sheet, start_row + i, tickmark_column)
-                add_mismatch_mark(tb_sheet, tb_row, 12)
                 logger.warning(
-                    f"Mismatch for USSGL {ussgl} in {sheet_name}. "
-                    f"UDO: {formatted_udo_value}, TB: {formatted_tb_value}"
+                    "USSGL %s not found in DO %s TB sheet "
+                    "and UDO value is not 0. UDO value: %s",
+                    ussgl, sheet_name, formatted_udo_value
                 )
-        elif udo_value == Decimal('0'):
-            add_tickmark(udo_sheet, start_row + i, tickmark_column, "a", "Marlett")
-            logger.info(f"USSGL {ussgl} not found in {sheet_name} TB, but UDO value is 0. Tickmark added.")
-        else:
-            logger.warning(
-                f"USSGL {ussgl} not found in DO {sheet_name} TB sheet "
-                f"and UDO value is not 0. UDO value: {formatted_udo_value}"
-            )
+
+
+def _format_ussgl(code) -> str:
+    """
+    Build the six-digit TB USSGL code from a four-digit UDO account code.
+    
+    Args:
+        code: Account code from the UDO sheet, a float from Value2 or text
+        
+    Returns:
+        str: The code zero-padded to four digits with "00" appended
+    """
+    if isinstance(code, (int, float)):
+        return f"{int(code):04d}00"
+    return f"{str(code).strip().zfill(4)}00"
 
 
 def find_tb_row(sheet, ussgl: str) -> Optional[int]:
@@ -1208,8 +1811,15 @@ def find_tb_row(sheet, ussgl: str) -> Optional[int]:
     Returns:
         int or None: Row number if found, None otherwise
     """
-    found_cell = sheet.Columns(3).Find(ussgl, LookAt=win32com.client.constants.xlWhole)
-    return found_cell.Row if found_cell else None
+    # perform_validations looks up several codes on the same TB sheet, so scan
+    # a cached copy of column C rather than running a Find over it each time
+    for row, value in enumerate(get_cached_column_values(sheet, "C"), start=1):
+        # Codes typed as numbers come back from Value2 as floats (480100.0)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if value is not None and str(value).strip() == ussgl:
+            return row
+    return None
 
 
 def add_tickmark(sheet, row: int, col: int, mark: str, font_name: str, bold: bool = False) -> None:
@@ -1224,14 +1834,8 @@ def add_tickmark(sheet, row: int, col: int, mark: str, font_name: str, bold: boo
         font_name: Font name
         bold (bool): Whether to make the text bold
     """
-    cell = sheet.Cells(row, col)
-    cell.Value = mark
-    cell.Font.Name = font_name
-    cell.Font.Size = 11
-    cell.Font.Color = 0  # Black
-    cell.Font.Bold = bold
-    cell.HorizontalAlignment = win32com.client.constants.xlCenter
-    cell.VerticalAlignment = win32com.client.constants.xlCenter
+    if not queue_tickmark(sheet, row, col, mark, font_name, bold):
+        _write_tickmark(sheet.Cells(row, col), mark, font_name, bold)
 
 
 def add_mismatch_mark(sheet, row: int, col: int) -> None:
@@ -1243,17 +1847,11 @@ def add_mismatch_mark(sheet, row: int, col: int) -> None:
         row (int): Row number
         col (int): Column number
     """
-    cell = sheet.Cells(row, col)
-    cell.Value = "X"
-    cell.Font.Name = "Calibri"
-    cell.Font.Size = 11
-    cell.Font.Color = 0  # Black
-    cell.Font.Bold = True
-    cell.HorizontalAlignment = win32com.client.constants.xlCenter
-    cell.VerticalAlignment = win32com.client.constants.xlCenter
+    add_tickmark(sheet, row, col, "X", "Calibri", bold=True)
 
 
 @safe_excel_operation
+@excel_fast_operation
 def perform_additional_validations(sheet, start_row: int, is_current_year: bool = False) -> None:
     """
     Perform additional validations and add formulas.
@@ -1264,39 +1862,37 @@ def perform_additional_validations(sheet, start_row: int, is_current_year: bool
         is_current_year (bool): Whether to use current year columns
     """
     try:
-        # Find "TIER Total" in column B
-        tier_total_cell = None
-        for cell in sheet.Columns(2).Cells:
-            if cell.Value and "TIER Total" in str(cell.Value).strip():
-                tier_total_cell = cell
-                break
+        # Find "TIER Total" in column B. The column is read once and shared by
+        # the PY and CY passes instead of enumerating its cells over COM.
+        tier_total_row = next((row for row, value in enumerate(get_cached_column_values(sheet, "B"), start=1)
+                               if value and "TIER Total" in str(value).strip()), None)
         
-        if not tier_total_cell:
+        if not tier_total_row:
             logger.warning("'TIER Total' not found in column B")
             return
 
-        logger.info(f"'TIER Total' found at row {tier_total_cell.Row}, column B")
+        logger.info("'TIER Total' found at row %s, column B", tier_total_row)
         
         # Get the total UDO value
         value_column = 8 if is_current_year else 3
-        total_udo_cell = sheet.Cells(tier_total_cell.Row, value_column)
+        total_udo_cell = sheet.Cells(tier_total_row, value_column)
         total_udo_value = total_udo_cell.Value
         formatted_total_udo_value = format_currency(total_udo_value)
-        logger.info(f"Total UDO value: {formatted_total_udo_value} at cell {total_udo_cell.Address}")
+        logger.info("Total UDO value: %s at cell %s", formatted_total_udo_value, LazyComValue(lambda: total_udo_cell.Address))
 
         # Add formula in the cell below the total UDO value
-        formula_cell = sheet.Cells(tier_total_cell.Row + 1, value_column)
-        formula = f'=IF(ROUND(SUM({get_column_letter(value_column)}{start_row}:{get_column_letter(value_column)}{start_row+2})-{get_column_letter(value_column)}{tier_total_cell.Row},0)=0,"a","û")'
+        formula_cell = sheet.Cells(tier_total_row + 1, value_column)
+        formula = f'=IF(ROUND(SUM({get_column_letter(value_column)}{start_row}:{get_column_letter(value_column)}{start_row+2})-{get_column_letter(value_column)}{tier_total_row},0)=0,"a","û")'
         formula_cell.Formula = formula
-        formula_cell.HorizontalAlignment = win32com.client.constants.xlCenter
+        formula_cell.HorizontalAlignment = XL_CENTER
         formula_cell.Font.Color = 0  # Black
         formula_cell.Font.Name = "Wingdings"
         formula_cell.Font.Size = 11
-        logger.info(f"Formula added at cell {formula_cell.Address}: {formula}")
+        logger.info("Formula added at cell %s: %s", LazyComValue(lambda: formula_cell.Address), formula)
 
         # Evaluate the formula
         result = formula_cell.Value
-        logger.info(f"Formula result: {result}")
+        logger.info("Formula result: %s", result)
 
         if result == "a":
             logger.info("Additional validation passed: Sum matches the total UDO value")
@@ -1304,4 +1900,4 @@ def perform_additional_validations(sheet, start_row: int, is_current_year: bool
             logger.warning("Additional validation failed: Sum does not match the total UDO value")
 
     except Exception as e:
-        logger.error(f"Error in additional validations: {str(e)}")
\ No newline at end of file
+        logger.error("Error in additional validations: %s", e)
\ No newline at end of file